@@ -3,15 +3,21 @@
 Модуль для извлечения фин данных с Yahoo Finance по тикеру и выбранному полю.
 
 Использует requests для получения данных и BeautifulSoup для парсинга HTML.
+Запросы идут через общую сессию SESSION с пулом постоянных соединений,
+поэтому повторные вызовы не устанавливают соединение заново.
 """
 
 import sys
 # import time
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
-def fetch_financial_data(ticker: str, field: str) -> list:
+
+def fetch_financial_data(ticker: str, field: str, session=None) -> list:
     """
     Получает финансовые данные компании с Yahoo Finance.
 
@@ -20,6 +26,11 @@ def fetch_financial_data(ticker: str, field: str) -> list:
 
         field (str): Название поля таблицы (например, Total Revenue).
 
+        session: Клиент с методом get (requests.Session или совместимый),
+            по умолчанию SESSION. Ошибками запроса считаются классы
+            из атрибута session.errors (как у HttpSession), если он есть,
+            иначе requests.exceptions.RequestException.
+
     Возвращает:
         list: Список значений для запрашиваемого поля.
 
@@ -35,10 +46,12 @@ def fetch_financial_data(ticker: str, field: str) -> list:
         Gecko/20100101 Firefox/133.0"
     }
 
+    session = SESSION if session is None else session
+    errors = getattr(session, "errors", (requests.exceptions.RequestException,))
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = session.get(url, headers=headers, timeout=10)
         response.raise_for_status()
-    except requests.exceptions.RequestException as ex:
+    except errors as ex:
         raise requests.exceptions.RequestException(f"Error fetching URL: {url}"
                                                    ) from ex
 
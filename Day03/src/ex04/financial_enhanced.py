@@ -3,14 +3,20 @@
 Модуль для извлечения фин данных с Yahoo Finance по тикеру и выбранному полю.
 
 Использует httpx для получения данных и BeautifulSoup для парсинга HTML.
+Запросы идут через общий клиент CLIENT с пулом постоянных соединений,
+поэтому повторные вызовы не устанавливают соединение заново.
 """
 
 import sys
 import httpx
 from bs4 import BeautifulSoup
 
+CLIENT = httpx.Client(
+    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+)
 
-def fetch_financial_data(ticker: str, field: str) -> list:
+
+def fetch_financial_data(ticker: str, field: str, client=None) -> list:
     """
     Получает финансовые данные компании с Yahoo Finance.
 
@@ -19,6 +25,11 @@ def fetch_financial_data(ticker: str, field: str) -> list:
 
         field (str): Название поля таблицы (например, Total Revenue).
 
+        client: Клиент с методом get (httpx.Client или совместимый),
+            по умолчанию CLIENT. Ошибками запроса считаются классы
+            из атрибута client.errors (как у HttpSession), если он есть,
+            иначе httpx.RequestError.
+
     Возвращает:
         list: Список значений для запрашиваемого поля.
 
@@ -34,10 +45,12 @@ def fetch_financial_data(ticker: str, field: str) -> list:
         Gecko/20100101 Firefox/133.0"
     }
 
+    client = CLIENT if client is None else client
+    errors = getattr(client, "errors", (httpx.RequestError,))
     try:
-        response = httpx.get(url, headers=headers, timeout=10)
+        response = client.get(url, headers=headers, timeout=10)
         response.raise_for_status()
-    except httpx.RequestError as ex:
+    except errors as ex:
         raise ValueError(f"Error fetching URL: {url}") from ex
 
     soup = BeautifulSoup(response.text, "html.parser")
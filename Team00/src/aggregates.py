@@ -0,0 +1,176 @@
+"""
+Модуль с общим кешем агрегатов оценок.
+
+Содержит класс RatingAggregates — базовый для RatingsStore и RatingsSummary.
+Он хранит посчитанные агрегаты (распределения по времени и рейтингам,
+GroupStats и RatingHistogram по группам, лидерборды) и при дозаписи новой
+порции оценок обновляет их на месте, затрагивая только группы из порции.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+from group_stats import GroupStats
+from time_buckets import bucket_labels, check_granularity, rebucket
+from topk import Leaderboard
+
+
+def add_counts(left: pd.Series, right: pd.Series) -> pd.Series:
+    """
+    Складывает два распределения количеств с объединением индексов.
+    """
+    if left.empty:
+        return right
+    if right.empty:
+        return left
+    return left.add(right, fill_value=0).astype(np.int64).sort_index()
+
+
+class RatingAggregates(ABC):
+    """
+    Кеш агрегатов оценок с поддержкой дозаписи.
+
+    Наследники реализуют _bucket_counts — подсчет оценок по временным
+    бакетам, когда количества по часам еще не посчитаны.
+
+    Ключи кеша — пары (вид агрегата, колонка или параметр):
+    ('times', гранулярность), ('buckets', 'timestamp'), ('ratings', 'rating'),
+    ('index' | 'stats' | 'histogram', movieId | userId)
+    и ('leaderboard', (имя, колонка, n)).
+
+    Методы:
+        time_counts(granularity): Количество оценок по временным бакетам.
+        time_distribution(granularity): То же с подписями бакетов.
+        year_counts(): Количество оценок по годам.
+        leaderboard(name, key, n, score): Закешированный лидерборд.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой кеш агрегатов.
+        """
+        self._cache = {}
+
+    def __getstate__(self) -> dict:
+        """
+        Лидерборды держат ссылки на функции и не сохраняются в pickle.
+        """
+        state = self.__dict__.copy()
+        state["_cache"] = {
+            entry: value
+            for entry, value in self._cache.items()
+            if entry[0] != "leaderboard"
+        }
+        return state
+
+    def _cached(self, name: str, key, build):
+        """
+        Возвращает закешированный результат build() для пары (name, key).
+        """
+        if (name, key) not in self._cache:
+            self._cache[(name, key)] = build()
+        return self._cache[(name, key)]
+
+    @abstractmethod
+    def _bucket_counts(self, granularity: str) -> pd.Series:
+        """
+        Считает количество оценок по временным бакетам без кеша.
+        """
+
+    def time_counts(self, granularity: str = "hour") -> pd.Series:
+        """
+        Возвращает количество оценок по временным бакетам.
+
+        Если посчитаны количества по часам, более крупные бакеты собираются
+        из них, без прохода по строкам.
+
+        Аргументы:
+            granularity: str, одно из year, month, week, day, hour.
+
+        Возвращает:
+            pd.Series {начало бакета в секундах: количество}, по возрастанию.
+        """
+        check_granularity(granularity)
+
+        def build():
+            hours = self._cache.get(("times", "hour"))
+            if hours is not None:
+                return rebucket(hours, granularity)
+            return self._bucket_counts(granularity)
+
+        return self._cached("times", granularity, build)
+
+    def time_distribution(self, granularity: str) -> pd.Series:
+        """
+        Возвращает количество оценок по временным бакетам с подписями.
+
+        Аргументы:
+            granularity: str, одно из year, month, week, day, hour.
+
+        Возвращает:
+            pd.Series {подпись бакета: количество}, по возрастанию времени.
+        """
+        counts = self.time_counts(granularity)
+        return pd.Series(
+            counts.to_numpy(), index=bucket_labels(counts.index, granularity)
+        )
+
+    def year_counts(self) -> pd.Series:
+        """
+        Возвращает количество оценок по годам timestamp, отсортировано по году.
+        """
+        return self.time_distribution("year")
+
+    def leaderboard(self, name: str, key: str, n: int, score) -> Leaderboard:
+        """
+        Возвращает лидерборд top-n групп колонки key, построенный один раз.
+
+        Аргументы:
+            name: str, имя метрики лидерборда.
+            key: str, movieId или userId.
+            n: int, размер лидерборда.
+            score: функция значений метрики для Leaderboard.
+
+        Возвращает:
+            Leaderboard, обновляемый при дозаписи оценок.
+        """
+        return self._cached(
+            "leaderboard", (name, key, n), lambda: Leaderboard(n, score)
+        )
+
+    def _append_aggregates(self, batch, row_offset: int):
+        """
+        Добавляет агрегаты порции оценок к уже посчитанным агрегатам.
+
+        Непосчитанные агрегаты не строятся: они будут посчитаны при первом
+        запросе уже с учетом порции. Групповые индексы и номера временных
+        бакетов по строкам сбрасываются.
+
+        Аргументы:
+            batch: RatingsStore с новыми оценками.
+            row_offset: int, номер первой строки порции во всех данных.
+        """
+        for (name, key), value in list(self._cache.items()):
+            if name in ("index", "buckets"):
+                del self._cache[(name, key)]
+            elif name == "times":
+                self._cache[(name, key)] = add_counts(value, batch.time_counts(key))
+            elif name == "ratings":
+                self._cache[(name, key)] = add_counts(value, batch.rating_counts())
+            elif name == "stats":
+                part = batch.group_stats(key)
+                value.update(
+                    GroupStats(
+                        part.keys,
+                        part.counts,
+                        part.sums,
+                        part.sums_of_squares,
+                        part.first_rows + row_offset,
+                    )
+                )
+            elif name == "histogram":
+                value.update(batch.rating_histogram(key))
+        for (name, key), value in self._cache.items():
+            if name == "leaderboard":
+                value.update(batch.group_stats(key[1]).keys)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк задержки запросов с постоянными соединениями и без них.
+
+Поднимает ReplayServer по HTTPS с самоподписанным сертификатом
+(создается через openssl), выполняет запросы через requests.get (новое
+соединение и TLS-рукопожатие на каждый запрос) и через HttpSession
+(пул постоянных соединений) и печатает среднюю задержку, p50 и p99.
+
+Запуск из Team00/src:
+    python benchmarks/bench_http_session.py [число запросов]
+Без аргумента выполняется 200 запросов.
+"""
+
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from http_session import HttpSession
+from replay import ReplayServer
+
+REQUESTS = 200
+PATH = "/title/tt0114709/"
+PAGE = "<html><h1>Movie</h1>" + "x" * 50_000 + "</html>"
+
+
+def make_certificate(directory: str) -> tuple:
+    """
+    Создает самоподписанный сертификат для 127.0.0.1.
+    """
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def report(name: str, latencies):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(
+        f"{name:<22} mean {np.mean(latencies) * 1000:6.2f} ms"
+        f"  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        with ReplayServer({PATH: PAGE}, ssl_context=context) as server:
+            url = server.rewrite(PATH)
+
+            latencies = []
+            for _ in range(count):
+                start = time.perf_counter()
+                requests.get(url, verify=cert, timeout=10).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+            report("requests.get", latencies)
+
+            with HttpSession(verify=cert) as session:
+                for _ in range(count):
+                    session.get(url).raise_for_status()
+                report("HttpSession", session.latencies)
+
+
+if __name__ == "__main__":
+    main()
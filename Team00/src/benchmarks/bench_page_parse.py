@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк разбора страниц IMDb для отчетов Links.
+
+Разбирает страницы полным деревом html.parser и функцией parse_page
+(только узлы, которые читают отчеты), проверяет, что извлеченные факты
+совпадают, и печатает время разбора одной страницы.
+
+Запуск из Team00/src:
+    python benchmarks/bench_page_parse.py [каталог с сохраненными *.html]
+Без аргумента используются синтетические страницы размером со страницу
+фильма IMDb.
+"""
+
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from page_parser import FAST_PARSER, FULL_PARSER, parse_page
+
+SYNTHETIC_PAGES = 20
+FILLER_BLOCKS = 1500
+
+
+def synthetic_page(number: int) -> str:
+    """
+    Строит страницу фильма с фактами среди множества посторонних узлов.
+    """
+    filler = "".join(
+        f'<div class="c{i}"><ul><li data-testid="x{i}"><a href="/l{i}">link {i}'
+        f'</a><span class="s">text {i}</span></li></ul></div>'
+        for i in range(FILLER_BLOCKS)
+    )
+    return (
+        f"<html><head><script>{'var a = 1;' * 2000}</script></head><body>"
+        f"{filler}<h1><span>Movie {number}</span></h1><ul>"
+        '<li data-testid="title-pc-principal-credit">Director '
+        f'<a href="/name/nm{number}/">Director {number}</a></li>'
+        '<li data-testid="title-boxoffice-budget"><span class="ipc-metadata-list-'
+        f'item__list-content-item">${number},000,000</span></li>'
+        '<li data-testid="title-boxoffice-cumulativeworldwidegross"><span class='
+        f'"ipc-metadata-list-item__list-content-item">${number}5,000,000</span></li>'
+        f'</ul><span class="sc-d7fcdef3-4 kjcuO">1:{number % 60}</span>'
+        f"{filler}</body></html>"
+    )
+
+
+def load_pages(directory: str) -> list:
+    """
+    Читает сохраненные страницы *.html из каталога.
+    """
+    pages = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                pages.append(file.read())
+    return pages
+
+
+def facts(soup) -> tuple:
+    """
+    Извлекает те же узлы, что и отчеты Links.
+    """
+    nodes = (
+        soup.find("h1"),
+        soup.find("li", {"data-testid": "title-pc-principal-credit"}),
+        soup.find("li", {"data-testid": "title-boxoffice-budget"}),
+        soup.find("li", {"data-testid": "title-boxoffice-cumulativeworldwidegross"}),
+        soup.find("span", {"class": "sc-d7fcdef3-4 kjcuO"}),
+        soup.find("button", {"id": "name-filmography-filter-director"}),
+    )
+    return tuple(node.text.strip() if node else None for node in nodes)
+
+
+def timed(parse, pages: list) -> tuple:
+    start = time.perf_counter()
+    results = [facts(parse(page)) for page in pages]
+    return time.perf_counter() - start, results
+
+
+def main():
+    if len(sys.argv) > 1:
+        pages = load_pages(sys.argv[1])
+    else:
+        pages = [synthetic_page(number) for number in range(1, SYNTHETIC_PAGES + 1)]
+    if not pages:
+        print("No pages to parse.")
+        return
+
+    size = sum(len(page) for page in pages) / len(pages) / 1024
+    print(f"pages={len(pages)} average size={size:.0f} KiB parser={FAST_PARSER}")
+    full, expected = timed(lambda page: BeautifulSoup(page, FULL_PARSER), pages)
+    fast, results = timed(parse_page, pages)
+    if results != expected:
+        print("Extracted facts differ from the full tree.")
+    per_page = 1000 / len(pages)
+    print(f"full tree:  {full * per_page:.1f} ms/page")
+    print(f"parse_page: {fast * per_page:.1f} ms/page, {full / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
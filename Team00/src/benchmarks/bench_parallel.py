@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк параллельного подсчета агрегатов Ratings по шардам.
+
+Считает агрегаты RatingsStore (распределения, GroupStats и гистограммы
+по фильмам и пользователям) в одном процессе и в ProcessPoolExecutor
+с разным числом процессов и печатает ускорение.
+
+Запуск из Team00/src:
+    python benchmarks/bench_parallel.py [путь к ratings.csv]
+Без аргумента используются синтетические 10 млн строк.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ratings_parallel import parallel_summary
+from ratings_store import RatingsStore
+from ratings_stream import RatingsSummary
+
+SYNTHETIC_ROWS = 10_000_000
+
+
+def synthetic_store(rows: int) -> RatingsStore:
+    """
+    Строит хранилище со случайными оценками масштаба ml-25m.
+    """
+    rng = np.random.default_rng(0)
+    return RatingsStore(
+        rng.integers(1, 162_542, rows, dtype=np.int32),
+        rng.integers(1, 209_172, rows, dtype=np.int32),
+        rng.integers(1, 11, rows, dtype=np.uint8),
+        rng.integers(789_652_009, 1_574_327_703, rows, dtype=np.int32),
+    )
+
+
+def main():
+    if len(sys.argv) > 1:
+        store = RatingsStore.load(sys.argv[1])
+    else:
+        store = synthetic_store(SYNTHETIC_ROWS)
+
+    columns = store.to_arrays()
+    start = time.perf_counter()
+    RatingsSummary.from_store(
+        RatingsStore(
+            columns["userId"],
+            columns["movieId"],
+            columns["rating"],
+            columns["timestamp"],
+        )
+    )
+    single = time.perf_counter() - start
+    print(f"rows={len(store)} single process: {single:.2f} s")
+
+    workers = 2
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(workers) as executor:
+            start = time.perf_counter()
+            parallel_summary(store, executor, shards=workers)
+            elapsed = time.perf_counter() - start
+        print(f"{workers:>3} processes: {elapsed:.2f} s, {single / elapsed:.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк скраперов Links и fetch_financial_data на локальном сервере.
+
+Страницы отдает ReplayServer с задержкой LATENCY и долей ошибок
+ERROR_RATE, поэтому замеры не зависят от IMDb и Yahoo. Links обходит
+фильмы и режиссеров (refresh_facts и top_directors) через общий
+links.SESSION, отдельный HttpSession и Fetcher, fetch_financial_data из Day03/src/ex04 загружает
+отчеты по тикерам. Для каждого варианта печатаются запросы в секунду,
+p50 и p99 задержки, в конце — время разбора одной страницы.
+
+Запуск из Team00/src:
+    python benchmarks/bench_scrapers.py [каталог PageArchive]
+Без аргумента используются синтетические страницы. Архив записывается
+через PageArchive(каталог).record(адреса, requests.get, заголовки).
+"""
+
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(
+    os.path.abspath(
+        os.path.join(
+            os.path.dirname(__file__), "..", "..", "..", "Day03", "src", "ex04"
+        )
+    )
+)
+import financial
+import links
+from fetcher import Fetcher
+from http_session import HttpSession
+from links import Links
+from page_parser import parse_page
+from replay import PageArchive, ReplayServer
+
+LATENCY = 0.02
+JITTER = 0.01
+ERROR_RATE = 0.02
+SYNTHETIC_MOVIES = 100
+SYNTHETIC_DIRECTORS = 25
+SYNTHETIC_TICKERS = ("AAPL", "MSFT", "GOOG", "AMZN", "META", "NVDA", "TSLA", "IBM")
+FIELD = "Total Revenue"
+
+
+def movie_page(number: int) -> str:
+    director = number % SYNTHETIC_DIRECTORS
+    filler = "".join(
+        f'<div class="c{i}"><span>text {i}</span></div>' for i in range(300)
+    )
+    return (
+        f"<html><body>{filler}<h1>Movie {number}</h1><ul>"
+        '<li data-testid="title-pc-principal-credit">Director '
+        f'<a href="/name/nm{director:07d}/?ref_=tt">Director {director}</a></li>'
+        '<li data-testid="title-boxoffice-budget"><span class="ipc-metadata-list-'
+        f'item__list-content-item">${number},000,000</span></li>'
+        '<li data-testid="title-boxoffice-cumulativeworldwidegross"><span class='
+        f'"ipc-metadata-list-item__list-content-item">${number * 3},000,000</span>'
+        f'</li></ul><span class="sc-d7fcdef3-4 kjcuO">{1 + number % 3}:{number % 60}'
+        f"</span>{filler}</body></html>"
+    )
+
+
+def director_page(number: int) -> str:
+    return (
+        f"<html><body><h1>Director {number}</h1>"
+        '<button id="name-filmography-filter-director">Director'
+        f'<span class="ipc-chip__count">{number * 2 + 1}</span></button></body></html>'
+    )
+
+
+def financial_page(ticker: str) -> str:
+    rows = "".join(
+        f'<div class="row lv-0 yf-t22klz"><div>{name}</div>'
+        + "".join(f"<div>{len(ticker) * 1000 + year:,}</div>" for year in range(4))
+        + "</div>"
+        for name in (FIELD, "Cost of Revenue", "Gross Profit", "Net Income")
+    )
+    return f'<html><body><div class="tableBody yf-9ft13">{rows}</div></body></html>'
+
+
+def synthetic_pages() -> dict:
+    pages = {}
+    for number in range(1, SYNTHETIC_MOVIES + 1):
+        pages[f"/title/tt{number:07d}/"] = movie_page(number)
+    for number in range(SYNTHETIC_DIRECTORS):
+        pages[f"/name/nm{number:07d}/"] = director_page(number)
+    for ticker in SYNTHETIC_TICKERS:
+        pages[f"/quote/{ticker}/financials"] = financial_page(ticker)
+    return pages
+
+
+class Timer:
+    """
+    Обертка функции запроса, записывающая время каждого вызова.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def wrap(self, get):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return get(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.latencies.append(elapsed)
+
+        return timed
+
+
+class Rewriting:
+    """
+    Клиент, направляющий запросы на ReplayServer.
+    """
+
+    def __init__(self, get, server: ReplayServer):
+        self._get = get
+        self.server = server
+
+    def get(self, url: str, **kwargs):
+        return self._get(self.server.rewrite(url), **kwargs)
+
+
+def report(name: str, server: ReplayServer, hits: int, elapsed: float, latencies):
+    requests_made = server.hits - hits
+    line = f"{name:<36} {requests_made:>5} req {requests_made / elapsed:8.1f} req/s"
+    if latencies:
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        line += f"  p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+    print(line)
+
+
+def crawl(server: ReplayServer, path: str, name: str, **options):
+    """
+    Обходит фильмы и режиссеров через Links и печатает замеры.
+    """
+    fetcher = options.get("fetcher")
+    session = options.get("session")
+    if session is None:
+        session = links.SESSION if fetcher is None else fetcher.session
+    timer = Timer()
+    if session is None:
+        fetcher.fetch = timer.wrap(fetcher.fetch)
+    if session is not None:
+        session.latencies.clear()
+    movies = Links(path, cache=False, **options)
+    hits = server.hits
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        movies.refresh_facts()
+        movies.top_directors(10)
+    elapsed = time.perf_counter() - start
+    if session is not None:
+        latencies = list(session.latencies)
+    else:
+        latencies = timer.latencies
+    report(name, server, hits, elapsed, latencies)
+
+
+def fetch_financials(server: ReplayServer, tickers, name: str, module, client):
+    """
+    Загружает отчеты по тикерам через fetch_financial_data и печатает замеры.
+    """
+    timer = Timer()
+    rewriting = Rewriting(timer.wrap(client.get), server)
+    if hasattr(client, "errors"):
+        rewriting.errors = client.errors
+    hits = server.hits
+    failures = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for ticker in tickers:
+            try:
+                module.fetch_financial_data(ticker, FIELD, rewriting)
+            except Exception:
+                failures += 1
+    elapsed = time.perf_counter() - start
+    report(f"{name} ({failures} failed)", server, hits, elapsed, timer.latencies)
+
+
+def parse_times(pages: dict):
+    """
+    Печатает время разбора одной страницы фильма, режиссера и отчета.
+    """
+    groups = {
+        "movie page (parse_page)": ("/title/", parse_page),
+        "director page (parse_page)": ("/name/", parse_page),
+        "financials (html.parser)": (
+            "/quote/",
+            lambda html: BeautifulSoup(html, "html.parser"),
+        ),
+    }
+    for name, (prefix, parse) in groups.items():
+        htmls = [html for path, html in pages.items() if path.startswith(prefix)]
+        if not htmls:
+            continue
+        start = time.perf_counter()
+        for html in htmls:
+            parse(html)
+        per_page = (time.perf_counter() - start) / len(htmls) * 1000
+        print(f"{name:<36} {per_page:7.2f} ms/page")
+
+
+def main():
+    if len(sys.argv) > 1:
+        pages = PageArchive(sys.argv[1]).load()
+    else:
+        pages = synthetic_pages()
+    imdb_ids = [
+        match.group(1)
+        for match in map(re.compile(r"^/title/tt(\d+)/$").match, pages)
+        if match
+    ]
+    tickers = [
+        match.group(1)
+        for match in map(re.compile(r"^/quote/([^/]+)/financials/?$").match, pages)
+        if match
+    ]
+    print(
+        f"movies={len(imdb_ids)} tickers={len(tickers)} latency={LATENCY * 1000:.0f}"
+        f" ms + {JITTER * 1000:.0f} ms jitter, errors={ERROR_RATE:.0%}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory, ReplayServer(
+        pages, LATENCY, JITTER, ERROR_RATE, seed=0
+    ) as server, patch.object(links, "IMDB_URL", server.url):
+        path = os.path.join(directory, "links.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("movieId,imdbId,tmdbId\n")
+            for number, imdb_id in enumerate(imdb_ids, 1):
+                file.write(f"{number},{imdb_id},\n")
+
+        crawl(server, path, "Links links.SESSION")
+        with HttpSession() as session:
+            crawl(server, path, "Links HttpSession", session=session)
+        with Fetcher(max_workers=8, rate=1000, burst=1000, backoff=0.01) as fetcher:
+            crawl(server, path, "Links Fetcher(8)", fetcher=fetcher)
+        with HttpSession(pool_size=8) as session, Fetcher(
+            max_workers=8, rate=1000, burst=1000, backoff=0.01, session=session
+        ) as fetcher:
+            crawl(server, path, "Links Fetcher(8) + HttpSession", fetcher=fetcher)
+
+        if tickers:
+            with HttpSession() as session:
+                fetch_financials(
+                    server, tickers, "financial HttpSession", financial, session
+                )
+            try:
+                import financial_enhanced
+            except ImportError:
+                print("financial_enhanced: skipped, httpx is not installed")
+            else:
+                fetch_financials(
+                    server,
+                    tickers,
+                    "financial_enhanced CLIENT",
+                    financial_enhanced,
+                    financial_enhanced.CLIENT,
+                )
+    parse_times(pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк выбора top-n: полная сортировка pandas против top_k.
+
+Для разного количества групп и маленьких n сравнивает
+Series.sort_values(ascending=False).head(n), которым раньше пользовались
+методы top_* / most_*, и частичный выбор topk.top_k.
+
+Запуск из Team00/src:
+    python benchmarks/bench_topk.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from topk import top_k
+
+GROUP_COUNTS = (100_000, 1_000_000, 10_000_000)
+TOP_NS = (5, 100)
+REPEAT = 5
+
+
+def best_time(func) -> float:
+    """
+    Возвращает лучшее время одного вызова func из REPEAT запусков в секундах.
+    """
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    header = ("groups", "n", "sort+head, ms", "top_k, ms", "speedup")
+    print("{:>10} {:>5} {:>14} {:>10} {:>8}".format(*header))
+    for groups in GROUP_COUNTS:
+        # Округленные средние оценки: много равенств, как в top_by_ratings.
+        values = pd.Series(np.round(rng.uniform(0.5, 5.0, groups), 2))
+        array = values.to_numpy()
+        for n in TOP_NS:
+            full = best_time(lambda: values.sort_values(ascending=False).head(n))
+            partial = best_time(lambda: values.iloc[top_k(array, n)])
+            print(
+                f"{groups:>10} {n:>5} {full * 1000:>14.1f} "
+                f"{partial * 1000:>10.1f} {full / partial:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
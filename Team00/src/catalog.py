@@ -0,0 +1,117 @@
+"""
+Модуль с типизированным каталогом фильмов из movies.csv.
+
+Содержит класс MovieCatalog: movieId, год выпуска (int16) и битовые маски
+жанров фильмов в массивах NumPy. Год разбирается из названия один раз при
+загрузке векторным извлечением, поэтому фильтры по годам и жанрам
+(например, «комедии 1990–1999») считаются масками массивов, а не
+поиском по строкам.
+"""
+
+import numpy as np
+import pandas as pd
+from genres import GenreMatrix
+from group_index import find_positions
+
+MISSING_YEAR = -1
+YEAR_PATTERN = r"\((\d{4})\)"
+
+
+def parse_release_years(titles: pd.Series) -> np.ndarray:
+    """
+    Извлекает год выпуска из названий вида 'Toy Story (1995)'.
+
+    Берется первое вхождение четырех цифр в скобках, как у re.search.
+
+    Аргументы:
+        titles: pd.Series названий фильмов.
+
+    Возвращает:
+        np.ndarray int16, MISSING_YEAR для названий без года.
+    """
+    years = pd.Series(titles).str.extract(YEAR_PATTERN, expand=False)
+    return years.fillna(MISSING_YEAR).to_numpy(dtype=np.int64).astype(np.int16)
+
+
+class MovieCatalog:
+    """
+    Каталог фильмов на массивах NumPy.
+
+    Атрибуты:
+        movie_ids: массив movieId в порядке строк файла.
+        years: массив int16 годов выпуска, MISSING_YEAR — год неизвестен.
+        genres: GenreMatrix со словарем жанров и масками фильмов.
+
+    Методы:
+        from_frame(df): Строит каталог из DataFrame movies.csv.
+        positions(movie_ids): Номера строк для movieId.
+        filter(genres, years, match): Маска фильмов по жанрам и годам.
+    """
+
+    def __init__(self, movie_ids, years, genres: GenreMatrix):
+        """
+        Инициализирует каталог готовыми массивами.
+
+        Аргументы:
+            movie_ids: массив movieId.
+            years: массив int16 годов выпуска.
+            genres: GenreMatrix по тем же строкам.
+        """
+        self.movie_ids = np.asarray(movie_ids)
+        self.years = np.asarray(years, dtype=np.int16)
+        self.genres = genres
+        self._order = np.argsort(self.movie_ids, kind="stable")
+        self._sorted_ids = self.movie_ids[self._order]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "MovieCatalog":
+        """
+        Строит каталог из DataFrame с колонками movieId, title, genres.
+        """
+        return cls(
+            df["movieId"].to_numpy(),
+            parse_release_years(df["title"]),
+            GenreMatrix.from_strings(df["genres"]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.movie_ids)
+
+    def positions(self, movie_ids) -> np.ndarray:
+        """
+        Возвращает номера строк для movieId, -1 для отсутствующих.
+
+        Аргументы:
+            movie_ids: массив искомых movieId.
+
+        Возвращает:
+            np.ndarray номеров строк.
+        """
+        found = find_positions(self._sorted_ids, movie_ids)
+        if not len(self._order):
+            return found
+        return np.where(found >= 0, self._order[found], -1)
+
+    def filter(self, genres=None, years=None, match: str = "all") -> np.ndarray:
+        """
+        Возвращает маску фильмов, подходящих под жанры и годы.
+
+        Аргументы:
+            genres: набор названий жанров или None.
+            years: кортеж (первый, последний) год включительно или None;
+                фильмы без года не подходят.
+            match: str, 'all' — есть все жанры, 'any' — хотя бы один.
+
+        Возвращает:
+            np.ndarray bool длины len(self).
+        """
+        if match not in ("all", "any"):
+            raise ValueError("Invalid match. Use 'all' or 'any'.")
+        selected = np.ones(len(self), dtype=bool)
+        if genres is not None:
+            selected &= self.genres.matches(genres, match)
+        if years is not None:
+            first, last = years
+            selected &= (self.years >= first) & (self.years <= last)
+            selected &= self.years != MISSING_YEAR
+        return selected
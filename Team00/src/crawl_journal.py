@@ -0,0 +1,119 @@
+"""
+Модуль с журналом обхода страниц IMDb.
+
+Содержит класс CrawlJournal: каждая обработанная страница (фильм по
+imdbId или режиссер по ссылке) и извлеченный с нее результат сразу
+дописываются строкой JSON в конец файла. Если обход Links прервался
+(сбой, таймаут, Ctrl-C), повторный запуск с тем же журналом пропускает
+уже обработанные страницы и продолжает с места остановки.
+"""
+
+import json
+import os
+
+
+class CrawlJournal:
+    """
+    Журнал обработанных страниц в файле JSON Lines.
+
+    Строка журнала — {"kind": вид страницы, "key": ключ, "result": результат};
+    для повторяющегося ключа действует последняя строка. Недописанная
+    последняя строка (процесс прервался во время записи) пропускается.
+
+    Атрибуты:
+        path: str, путь к файлу журнала.
+        sync: bool, сбрасывать ли каждую запись на диск через os.fsync
+            (иначе запись переживает падение процесса, но не системы).
+
+    Методы:
+        done(kind, key): Обработана ли страница.
+        get(kind, key): Результат обработанной страницы.
+        record(kind, key, result): Дописывает результат в журнал.
+        processed(kind): Ключи обработанных страниц вида kind.
+        clear(): Очищает журнал для нового обхода.
+        close(): Закрывает файл.
+    """
+
+    def __init__(self, path: str, sync: bool = False):
+        """
+        Открывает журнал, загружая уже записанные результаты.
+
+        Аргументы:
+            path: str, путь к файлу журнала; создается при необходимости.
+            sync: bool, вызывать os.fsync после каждой записи.
+        """
+        self.path = path
+        self.sync = sync
+        self._entries = {}
+        needs_newline = False
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    needs_newline = not line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                        key = (entry["kind"], entry["key"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    self._entries[key] = entry.get("result")
+        self._file = open(path, "a", encoding="utf-8")
+        if needs_newline:
+            self._file.write("\n")
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def done(self, kind: str, key: str) -> bool:
+        """
+        Проверяет, записан ли результат страницы.
+        """
+        return (kind, key) in self._entries
+
+    def get(self, kind: str, key: str):
+        """
+        Возвращает записанный результат страницы или None.
+        """
+        return self._entries.get((kind, key))
+
+    def record(self, kind: str, key: str, result):
+        """
+        Дописывает результат страницы в журнал.
+
+        Аргументы:
+            kind: str, вид страницы, например 'movie' или 'director'.
+            key: str, ключ страницы (imdbId, ссылка на режиссера).
+            result: результат, сериализуемый в JSON.
+        """
+        line = json.dumps({"kind": kind, "key": key, "result": result})
+        self._file.write(line + "\n")
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._entries[(kind, key)] = result
+
+    def processed(self, kind: str) -> set:
+        """
+        Возвращает ключи обработанных страниц вида kind.
+        """
+        return {key for entry_kind, key in self._entries if entry_kind == kind}
+
+    def clear(self):
+        """
+        Очищает журнал, чтобы следующий обход загрузил все страницы заново.
+        """
+        self._file.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._entries = {}
+
+    def close(self):
+        """
+        Закрывает файл журнала.
+        """
+        self._file.close()
@@ -0,0 +1,127 @@
+"""
+Модуль с постоянным хранилищем фактов о фильмах.
+
+Содержит класс FactsStore: разобранные со страниц IMDb факты (название,
+режиссер, бюджет, сборы, длительность) и время загрузки страницы хранятся
+в SQLite по ключу imdbId. После первого обхода отчеты Links загружают
+факты из базы за миллисекунды, не скачивая и не разбирая HTML; заново
+загружаются только новые фильмы из links.csv и устаревшие записи.
+"""
+
+import sqlite3
+import time
+
+from movie_facts import FACT_COLUMNS
+
+FACT_FIELDS = FACT_COLUMNS + ("fetched_at",)
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else None
+
+
+class FactsStore:
+    """
+    Хранилище фактов о фильмах в SQLite.
+
+    Атрибуты:
+        path: str, путь к файлу базы (':memory:' — база в памяти).
+        max_age: float, возраст записи в секундах, после которого она
+            считается устаревшей, или None (записи не устаревают).
+
+    Методы:
+        load(): Все записи {imdbId: запись}.
+        save(records): Добавляет или заменяет записи.
+        is_stale(record, max_age): Нужно ли загрузить запись заново.
+        close(): Закрывает базу.
+    """
+
+    def __init__(self, path: str, max_age: float = None):
+        """
+        Открывает базу, создавая таблицу при необходимости.
+
+        Аргументы:
+            path: str, путь к файлу базы.
+            max_age: float, срок годности записи в секундах или None.
+        """
+        self.path = path
+        self.max_age = max_age
+        self._connection = sqlite3.connect(path)
+        columns = ", ".join(
+            f"{name} REAL" if name == "fetched_at" else f"{name} TEXT"
+            for name in FACT_FIELDS[1:]
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS facts "
+                f"(imdbId TEXT PRIMARY KEY, {columns})"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
+
+    def load(self) -> dict:
+        """
+        Возвращает все записи хранилища.
+
+        Возвращает:
+            dict {imdbId: словарь с ключами FACT_FIELDS}.
+        """
+        cursor = self._connection.execute(
+            f"SELECT {', '.join(FACT_FIELDS)} FROM facts"
+        )
+        return {row[0]: dict(zip(FACT_FIELDS, row)) for row in cursor}
+
+    def save(self, records):
+        """
+        Добавляет или заменяет записи по imdbId.
+
+        Аргументы:
+            records: словари с ключами FACT_FIELDS; без fetched_at
+                записывается текущее время, значения, не являющиеся
+                строками, записываются как NULL.
+        """
+        now = time.time()
+        rows = [
+            tuple(_text(record.get(name)) for name in FACT_COLUMNS)
+            + (float(record.get("fetched_at") or now),)
+            for record in records
+        ]
+        placeholders = ", ".join("?" for _ in FACT_FIELDS)
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO facts ({', '.join(FACT_FIELDS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+
+    def is_stale(self, record: dict, max_age: float = None) -> bool:
+        """
+        Проверяет, нужно ли загрузить запись заново.
+
+        Аргументы:
+            record: запись из load() или None, если записи нет.
+            max_age: float, срок годности в секундах; None — self.max_age.
+
+        Возвращает:
+            bool: True для отсутствующей или устаревшей записи.
+        """
+        if record is None:
+            return True
+        max_age = self.max_age if max_age is None else max_age
+        if max_age is None:
+            return False
+        fetched_at = record.get("fetched_at")
+        return fetched_at is None or time.time() - fetched_at >= max_age
+
+    def close(self):
+        """
+        Закрывает базу.
+        """
+        self._connection.close()
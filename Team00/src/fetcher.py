@@ -0,0 +1,240 @@
+"""
+Модуль с параллельной загрузкой HTML страниц.
+
+Содержит класс TokenBucket — ограничитель частоты запросов — и класс
+Fetcher: страницы загружаются пулом потоков с ограниченным числом
+одновременных запросов, к каждому хосту — не чаще заданной частоты.
+Неудачные запросы (ошибки соединения, таймауты, 429 и 5xx) повторяются
+с экспоненциальной задержкой и случайным разбросом, каждый поток
+переиспользует соединения через свою requests.Session или все потоки —
+через общий HttpSession, который записывает задержки запросов.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+from http_session import HttpSession
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты «ведро токенов».
+
+    Атрибуты:
+        rate: float, скорость пополнения, токенов в секунду.
+        capacity: float, размер ведра — сколько запросов можно сделать подряд.
+
+    Методы:
+        acquire(): Ждет и забирает один токен.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Инициализирует полное ведро.
+
+        Аргументы:
+            rate: float, токенов в секунду.
+            capacity: float, размер ведра, не меньше 1.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Забирает токен, при необходимости ожидая его появления.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class Fetcher:
+    """
+    Параллельная загрузка страниц с ограничением частоты и повторами.
+
+    Атрибуты:
+        max_workers: int, наибольшее число одновременных запросов.
+        rate: float, запросов в секунду к одному хосту.
+        burst: int, сколько запросов к хосту можно сделать подряд.
+        retries: int, число повторов неудачного запроса.
+        backoff: float, базовая задержка повтора в секундах; перед повтором
+            номер k ждем случайное время от 0 до backoff * 2**k.
+        max_delay: float, наибольшая задержка повтора в секундах; если
+            Retry-After ответа больше, страница считается незагруженной.
+        timeout: float, таймаут запроса в секундах.
+        session: HttpSession, общий пул соединений или None (у каждого
+            потока своя requests.Session).
+        requests_sent, retried, failed: int, счетчики запросов.
+
+    Методы:
+        fetch(url, headers): Текст страницы или None.
+        fetch_many(urls, headers): Параллельно загружает страницы.
+        close(): Останавливает пул потоков и закрывает соединения.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate: float = 4.0,
+        burst: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10,
+        session: HttpSession = None,
+        max_delay: float = 60,
+    ):
+        """
+        Инициализирует загрузчик; пул потоков создается при первом вызове.
+
+        Сессию session закрывает вызывающий код, а не close().
+        """
+        self.max_workers = max_workers
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_delay = max_delay
+        self.session = session
+        self.requests_sent = 0
+        self.retried = 0
+        self.failed = 0
+        self._buckets = {}
+        self._sessions = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _delay(self, attempt: int, response=None) -> float:
+        """
+        Возвращает задержку перед повтором или None, если Retry-After
+        ответа больше max_delay.
+        """
+        delay = min(random.uniform(0, self.backoff * 2**attempt), self.max_delay)
+        retry_after = None
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            if float(retry_after) > self.max_delay:
+                return None
+            delay = max(delay, float(retry_after))
+        return delay
+
+    def fetch(self, url: str, headers: dict = None) -> str:
+        """
+        Загружает страницу с повторами.
+
+        Аргументы:
+            url: str, адрес страницы.
+            headers: dict, заголовки запроса.
+
+        Возвращает:
+            str, текст страницы или None, если загрузить не удалось.
+        """
+        bucket = self._bucket(url)
+        if self.session is None:
+            get = self._session().get
+            retry_errors = (requests.ConnectionError, requests.Timeout)
+            errors = (requests.RequestException,)
+        else:
+            get = self.session.get
+            retry_errors, errors = self.session.retry_errors, self.session.errors
+        for attempt in range(self.retries + 1):
+            bucket.acquire()
+            self._count("requests_sent")
+            response = None
+            try:
+                response = get(url, headers=headers, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.text
+            except retry_errors:
+                pass
+            except errors:
+                break
+            if attempt < self.retries:
+                delay = self._delay(attempt, response)
+                if delay is None:
+                    break
+                self._count("retried")
+                time.sleep(delay)
+        self._count("failed")
+        return None
+
+    def fetch_many(self, urls, headers: dict = None) -> dict:
+        """
+        Параллельно загружает страницы.
+
+        Аргументы:
+            urls: итерируемый набор адресов.
+            headers: dict, заголовки запросов.
+
+        Возвращает:
+            dict {адрес: текст страницы или None} в порядке адресов.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        pages = self._pool.map(lambda url: self.fetch(url, headers), urls)
+        return dict(zip(urls, pages))
+
+    def close(self):
+        """
+        Останавливает пул потоков и закрывает собственные сессии потоков.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
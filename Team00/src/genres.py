@@ -0,0 +1,153 @@
+"""
+Модуль с матрицей «фильм x жанр» для movies.csv.
+
+Содержит класс GenreMatrix: словарь жанров и битовая маска жанров для
+каждого фильма (uint32, либо uint64, если жанров больше 32). Если жанров
+больше 64, вместо масок хранится булева матрица «фильм x жанр». Строки жанров
+разбираются один раз при загрузке, а количества фильмов по жанрам,
+количества жанров у фильмов и матрица совместной встречаемости жанров
+считаются векторными суммами по строкам и столбцам.
+"""
+
+import numpy as np
+import pandas as pd
+
+GENRE_SEPARATOR = "|"
+MAX_MASK_GENRES = 64
+
+
+class GenreMatrix:
+    """
+    Словарь жанров и битовые маски жанров фильмов.
+
+    Атрибуты:
+        vocabulary: np.ndarray названий жанров в порядке первого появления.
+        masks: np.ndarray масок, бит j маски фильма установлен, если у фильма
+            есть жанр vocabulary[j]; при словаре больше MAX_MASK_GENRES —
+            булева матрица (фильмы x жанры).
+
+    Методы:
+        from_strings(genres): Строит матрицу из колонки genres.
+        indicators(): Плотная матрица 0/1 размера (фильмы x жанры).
+        genre_counts(): Количество фильмов по жанрам.
+        movie_counts(): Количество жанров у каждого фильма.
+        cooccurrence(): Матрица совместной встречаемости жанров.
+        mask(names): Маска из набора жанров.
+        matches(names, match): Фильмы со всеми или любым из жанров.
+    """
+
+    def __init__(self, vocabulary, masks):
+        """
+        Инициализирует матрицу готовыми словарем и масками.
+        """
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.masks = np.asarray(masks)
+
+    @classmethod
+    def from_strings(cls, genres: pd.Series) -> "GenreMatrix":
+        """
+        Разбирает строки жанров вида 'Comedy|Drama' в битовые маски.
+
+        Жанр, повторенный в строке одного фильма, учитывается один раз.
+
+        Аргументы:
+            genres: pd.Series строк жанров через '|'; NaN — фильм без жанров.
+
+        Возвращает:
+            GenreMatrix.
+        """
+        genres = pd.Series(genres).reset_index(drop=True)
+        exploded = genres.str.split(GENRE_SEPARATOR).explode()
+        codes, vocabulary = pd.factorize(exploded, sort=False)
+        present = codes >= 0
+        rows, codes = exploded.index.to_numpy()[present], codes[present]
+        if len(vocabulary) > MAX_MASK_GENRES:
+            masks = np.zeros((len(genres), len(vocabulary)), dtype=bool)
+            masks[rows, codes] = True
+            return cls(vocabulary.to_numpy(dtype=object), masks)
+        dtype = np.uint32 if len(vocabulary) <= 32 else np.uint64
+        masks = np.zeros(len(genres), dtype=dtype)
+        np.bitwise_or.at(masks, rows, np.left_shift(dtype(1), codes.astype(dtype)))
+        return cls(vocabulary.to_numpy(dtype=object), masks)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def indicators(self) -> np.ndarray:
+        """
+        Возвращает плотную матрицу 0/1 размера (фильмы x жанры), uint8.
+        """
+        if self.masks.ndim == 2:
+            return self.masks.astype(np.uint8)
+        bits = np.arange(len(self.vocabulary), dtype=self.masks.dtype)
+        return ((self.masks[:, None] >> bits) & 1).astype(np.uint8)
+
+    def genre_counts(self) -> np.ndarray:
+        """
+        Возвращает количество фильмов с каждым жанром словаря.
+        """
+        return self.indicators().sum(axis=0, dtype=np.int64)
+
+    def movie_counts(self) -> np.ndarray:
+        """
+        Возвращает количество жанров у каждого фильма.
+        """
+        if self.masks.ndim == 2:
+            return self.masks.sum(axis=1, dtype=np.int64)
+        return np.bitwise_count(self.masks).astype(np.int64)
+
+    def cooccurrence(self) -> pd.DataFrame:
+        """
+        Возвращает матрицу совместной встречаемости жанров.
+
+        Возвращает:
+            pd.DataFrame: на пересечении жанров a и b — количество фильмов,
+            у которых есть оба жанра; на диагонали — количество фильмов жанра.
+        """
+        indicators = self.indicators().astype(np.int64)
+        return pd.DataFrame(
+            indicators.T @ indicators, index=self.vocabulary, columns=self.vocabulary
+        )
+
+    def mask(self, names) -> int:
+        """
+        Возвращает маску из набора жанров.
+
+        Аргументы:
+            names: итерируемый набор названий жанров.
+
+        Возвращает:
+            Маска того же типа, что и masks (для булевой матрицы — булев
+            массив длины словаря); неизвестный жанр — KeyError.
+        """
+        positions = {name: bit for bit, name in enumerate(self.vocabulary)}
+        if self.masks.ndim == 2:
+            result = np.zeros(len(self.vocabulary), dtype=bool)
+            for name in names:
+                if name not in positions:
+                    raise KeyError(f"Unknown genre: {name}")
+                result[positions[name]] = True
+            return result
+        scalar = self.masks.dtype.type
+        result = scalar(0)
+        for name in names:
+            if name not in positions:
+                raise KeyError(f"Unknown genre: {name}")
+            result |= scalar(1) << scalar(positions[name])
+        return result
+
+    def matches(self, names, match: str = "all") -> np.ndarray:
+        """
+        Возвращает фильмы, у которых есть все (match='all') или хотя бы один
+        (match='any') из жанров names.
+
+        Возвращает:
+            np.ndarray bool длины len(self).
+        """
+        wanted = self.mask(names)
+        common = self.masks & wanted
+        if self.masks.ndim == 2:
+            if match == "all":
+                return (common == wanted).all(axis=1)
+            return common.any(axis=1)
+        return (common == wanted) if match == "all" else (common != 0)
@@ -0,0 +1,136 @@
+"""
+Модуль с групповым индексом в стиле CSR.
+
+Содержит класс GroupIndex: строки таблицы один раз сортируются по ключу
+группы (например, movieId или userId), а границы групп хранятся в массиве
+смещений. Агрегации по группам после этого считаются сегментными
+редукциями NumPy без повторного groupby.
+"""
+
+import numpy as np
+
+
+def find_positions(sorted_keys, keys) -> np.ndarray:
+    """
+    Возвращает позиции ключей в отсортированном массиве, -1 для отсутствующих.
+
+    Аргументы:
+        sorted_keys: отсортированный массив уникальных ключей.
+        keys: массив искомых ключей.
+
+    Возвращает:
+        np.ndarray позиций.
+    """
+    keys = np.asarray(keys)
+    found = np.searchsorted(sorted_keys, keys)
+    found = np.minimum(found, max(len(sorted_keys) - 1, 0))
+    hit = (
+        sorted_keys[found] == keys
+        if len(sorted_keys)
+        else np.zeros(keys.shape, dtype=bool)
+    )
+    return np.where(hit, found, -1)
+
+
+class GroupIndex:
+    """
+    Индекс групп по массиву ключей.
+
+    Атрибуты:
+        keys: отсортированный массив уникальных ключей групп.
+        order: перестановка строк, упорядочивающая их по ключу (стабильно).
+        offsets: массив длины len(keys) + 1, строки группы i лежат
+            в order[offsets[i]:offsets[i + 1]].
+
+    Методы:
+        counts(): Количество строк в каждой группе.
+        first_rows(): Номер первой строки каждой группы в исходной таблице.
+        sum(values): Сумма значений по группам.
+        positions(keys): Номера групп для переданных ключей.
+        rows(key): Номера строк одной группы.
+    """
+
+    def __init__(self, keys):
+        """
+        Строит индекс по массиву ключей.
+
+        Аргументы:
+            keys: массив ключей групп, по одному на строку таблицы.
+        """
+        keys = np.asarray(keys)
+        self.order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[self.order]
+        if len(sorted_keys):
+            starts = np.flatnonzero(
+                np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            )
+        else:
+            starts = np.empty(0, dtype=np.intp)
+        self.keys = sorted_keys[starts]
+        self.offsets = np.append(starts, len(sorted_keys))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def counts(self) -> np.ndarray:
+        """
+        Возвращает количество строк в каждой группе.
+        """
+        return np.diff(self.offsets)
+
+    def first_rows(self) -> np.ndarray:
+        """
+        Возвращает номер первой строки каждой группы в исходной таблице.
+        """
+        return self.order[self.offsets[:-1]]
+
+    def group_ids(self) -> np.ndarray:
+        """
+        Возвращает номер группы для каждой строки в порядке order.
+        """
+        return np.repeat(np.arange(len(self.keys)), self.counts())
+
+    def sum(self, values, dtype=None) -> np.ndarray:
+        """
+        Возвращает сумму значений по группам.
+
+        Аргументы:
+            values: массив значений, по одному на строку таблицы.
+            dtype: тип накопителя суммы.
+
+        Возвращает:
+            np.ndarray длины len(keys).
+        """
+        segments = np.asarray(values)[self.order]
+        if dtype is not None:
+            segments = segments.astype(dtype, copy=False)
+        if not len(segments):
+            return np.zeros(0, dtype=segments.dtype)
+        return np.add.reduceat(segments, self.offsets[:-1])
+
+    def positions(self, keys) -> np.ndarray:
+        """
+        Возвращает номера групп для ключей, -1 для отсутствующих ключей.
+
+        Аргументы:
+            keys: массив искомых ключей.
+
+        Возвращает:
+            np.ndarray номеров групп.
+        """
+        return find_positions(self.keys, keys)
+
+    def rows(self, key) -> np.ndarray:
+        """
+        Возвращает номера строк группы с ключом key.
+
+        Аргументы:
+            key: ключ группы.
+
+        Возвращает:
+            np.ndarray номеров строк, пустой если группы нет.
+        """
+        position = self.positions([key])[0]
+        if position < 0:
+            return self.order[:0]
+        return self.order[self.offsets[position] : self.offsets[position + 1]]
@@ -0,0 +1,166 @@
+"""
+Модуль с агрегатами оценок по группам (фильмам или пользователям).
+
+Содержит класс GroupStats: количество, сумма и сумма квадратов оценок
+для каждой группы. Из них считаются среднее и выборочная дисперсия
+без повторной группировки исходной таблицы.
+"""
+
+import numpy as np
+import pandas as pd
+from group_index import GroupIndex, find_positions
+
+
+class GroupStats:
+    """
+    Агрегаты оценок по группам.
+
+    Атрибуты:
+        keys: отсортированный массив ключей групп.
+        counts: количество оценок в группе.
+        sums: сумма оценок в группе.
+        sums_of_squares: сумма квадратов оценок в группе.
+        first_rows: номер строки, в которой группа встретилась впервые.
+
+    Методы:
+        from_index(index, ratings): Считает агрегаты по групповому индексу.
+        merge(other): Объединяет агрегаты двух частей данных.
+        update(other): Добавляет агрегаты новой части на месте.
+        positions(keys): Номера групп для переданных ключей.
+        take(positions): Агрегаты выбранных групп.
+        mean(): Средняя оценка по группам.
+        var(): Выборочная дисперсия оценок по группам.
+        series(values): Оборачивает массив значений в Series с ключами групп.
+    """
+
+    def __init__(self, keys, counts, sums, sums_of_squares, first_rows):
+        """
+        Инициализирует агрегаты готовыми массивами одинаковой длины.
+        """
+        self.keys = keys
+        self.counts = counts
+        self.sums = sums
+        self.sums_of_squares = sums_of_squares
+        self.first_rows = first_rows
+
+    @classmethod
+    def from_index(cls, index: GroupIndex, ratings) -> "GroupStats":
+        """
+        Считает агрегаты сегментными редукциями по индексу групп.
+
+        Аргументы:
+            index: GroupIndex по колонке movieId или userId.
+            ratings: массив оценок float64 в исходном порядке строк.
+
+        Возвращает:
+            GroupStats.
+        """
+        ratings = np.asarray(ratings, dtype=np.float64)
+        return cls(
+            index.keys,
+            index.counts(),
+            index.sum(ratings),
+            index.sum(ratings * ratings),
+            index.first_rows(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def merge(self, other: "GroupStats") -> "GroupStats":
+        """
+        Объединяет агрегаты двух непересекающихся частей данных.
+
+        Количества и суммы складываются (слияние Чана в виде сырых моментов:
+        для оценок, кратных 0.5, суммы точные), first_rows берется минимальный,
+        поэтому first_rows другой части должны быть уже сдвинуты на ее начало.
+
+        Аргументы:
+            other: GroupStats другой части данных.
+
+        Возвращает:
+            GroupStats по объединению групп.
+        """
+        keys = np.union1d(self.keys, other.keys)
+        counts = np.zeros(len(keys), dtype=np.int64)
+        sums = np.zeros(len(keys), dtype=np.float64)
+        sums_of_squares = np.zeros(len(keys), dtype=np.float64)
+        first_rows = np.full(len(keys), np.iinfo(np.int64).max, dtype=np.int64)
+        for part in (self, other):
+            positions = np.searchsorted(keys, part.keys)
+            counts[positions] += part.counts
+            sums[positions] += part.sums
+            sums_of_squares[positions] += part.sums_of_squares
+            first_rows[positions] = np.minimum(first_rows[positions], part.first_rows)
+        return GroupStats(keys, counts, sums, sums_of_squares, first_rows)
+
+    def update(self, other: "GroupStats"):
+        """
+        Добавляет агрегаты новой части данных на месте.
+
+        Счетчики уже известных групп увеличиваются только в их позициях;
+        новые группы вставляются с сохранением порядка ключей. Стоимость
+        зависит от числа групп в other, а не от числа групп в self (кроме
+        копирования массивов при вставке новых групп).
+
+        Аргументы:
+            other: GroupStats новой части с уже сдвинутыми first_rows.
+        """
+        positions = self.positions(other.keys)
+        found = positions >= 0
+        hit = positions[found]
+        self.counts[hit] += other.counts[found]
+        self.sums[hit] += other.sums[found]
+        self.sums_of_squares[hit] += other.sums_of_squares[found]
+        self.first_rows[hit] = np.minimum(self.first_rows[hit], other.first_rows[found])
+        if found.all():
+            return
+        new = ~found
+        at = np.searchsorted(self.keys, other.keys[new])
+        self.keys = np.insert(self.keys, at, other.keys[new])
+        self.counts = np.insert(self.counts, at, other.counts[new])
+        self.sums = np.insert(self.sums, at, other.sums[new])
+        self.sums_of_squares = np.insert(
+            self.sums_of_squares, at, other.sums_of_squares[new]
+        )
+        self.first_rows = np.insert(self.first_rows, at, other.first_rows[new])
+
+    def positions(self, keys) -> np.ndarray:
+        """
+        Возвращает номера групп для ключей, -1 для отсутствующих ключей.
+        """
+        return find_positions(self.keys, keys)
+
+    def take(self, positions) -> "GroupStats":
+        """
+        Возвращает агрегаты групп с номерами positions.
+        """
+        return GroupStats(
+            self.keys[positions],
+            self.counts[positions],
+            self.sums[positions],
+            self.sums_of_squares[positions],
+            self.first_rows[positions],
+        )
+
+    def mean(self) -> np.ndarray:
+        """
+        Возвращает среднюю оценку по группам.
+        """
+        return self.sums / self.counts
+
+    def var(self) -> np.ndarray:
+        """
+        Возвращает выборочную дисперсию (ddof=1), NaN для групп из одной оценки.
+        """
+        counts = self.counts.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = counts * self.sums_of_squares - self.sums * self.sums
+            var = np.maximum(spread, 0) / (counts * (counts - 1))
+        return np.where(counts > 1, var, np.nan)
+
+    def series(self, values) -> pd.Series:
+        """
+        Оборачивает массив значений по группам в Series с ключами групп.
+        """
+        return pd.Series(values, index=self.keys)
@@ -0,0 +1,166 @@
+"""
+Модуль с общим HTTP-клиентом для загрузки страниц.
+
+Содержит класс HttpSession: запросы идут через пул постоянных
+соединений (keep-alive), поэтому DNS, TCP и TLS оплачиваются один раз
+на соединение, а не на каждый запрос. По умолчанию используется
+requests.Session с HTTPAdapter ограниченного размера, с http2=True —
+httpx.Client с HTTP/2 (нужен пакет httpx[http2]). Для каждого запроса
+записывается время ответа; хранятся только последние LATENCY_WINDOW
+замеров, stats() возвращает по ним среднее и перцентили.
+"""
+
+import threading
+from collections import deque
+import time
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+POOL_SIZE = 10
+LATENCY_WINDOW = 10_000
+
+
+class HttpSession:
+    """
+    HTTP-клиент с пулом постоянных соединений и замером задержек.
+
+    Атрибуты:
+        pool_size: int, наибольшее число соединений к одному хосту.
+        timeout: float, таймаут запроса в секундах по умолчанию.
+        http2: bool, используется ли httpx с HTTP/2.
+        errors: tuple, классы исключений клиента для except.
+        retry_errors: tuple, классы ошибок соединения и таймаутов, после
+            которых запрос имеет смысл повторить.
+        latencies: deque, время последних max_latencies запросов в секундах.
+        requests_sent: int, число всех выполненных запросов.
+
+    Методы:
+        get(url, headers, timeout): Выполняет GET-запрос.
+        stats(): Число запросов, средняя задержка, p50 и p99.
+        close(): Закрывает соединения.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = POOL_SIZE,
+        timeout: float = 10,
+        http2: bool = False,
+        headers: dict = None,
+        verify=True,
+        max_latencies: int = LATENCY_WINDOW,
+    ):
+        """
+        Создает клиент с пулом соединений.
+
+        Аргументы:
+            pool_size: int, размер пула соединений к хосту.
+            timeout: float, таймаут запроса в секундах.
+            http2: bool, использовать httpx с HTTP/2.
+            headers: dict, заголовки всех запросов.
+            verify: bool или str, проверка сертификата (путь к файлу CA).
+            max_latencies: int, сколько последних замеров задержки хранить;
+                память общей долгоживущей сессии не растет с числом запросов.
+        """
+        if pool_size < 1:
+            raise ValueError("Pool size must be positive.")
+        if max_latencies < 1:
+            raise ValueError("Latency window must be positive.")
+        if http2 and httpx is None:
+            raise ImportError("HTTP/2 requires httpx: pip install 'httpx[http2]'.")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.http2 = http2
+        self.latencies = deque(maxlen=max_latencies)
+        self.requests_sent = 0
+        self._lock = threading.Lock()
+        if http2:
+            self._client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=pool_size, max_keepalive_connections=pool_size
+                ),
+                headers=headers,
+                verify=verify,
+            )
+            self.errors = (httpx.HTTPError,)
+            self.retry_errors = (httpx.TransportError,)
+            self._options = {}
+        else:
+            self._client = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True
+            )
+            self._client.mount("http://", adapter)
+            self._client.mount("https://", adapter)
+            self._client.headers.update(headers or {})
+            self.errors = (requests.RequestException,)
+            self.retry_errors = (requests.ConnectionError, requests.Timeout)
+            # Session.verify уступает переменным окружения REQUESTS_CA_BUNDLE
+            # и CURL_CA_BUNDLE, поэтому verify передается в каждый запрос.
+            self._options = {"verify": verify}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, url: str, headers: dict = None, timeout: float = None):
+        """
+        Выполняет GET-запрос через пул соединений.
+
+        Аргументы:
+            url: str, адрес.
+            headers: dict, дополнительные заголовки запроса.
+            timeout: float, таймаут в секундах; None — self.timeout.
+
+        Возвращает:
+            Ответ клиента (requests.Response или httpx.Response).
+        """
+        start = time.perf_counter()
+        try:
+            return self._client.get(
+                url,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout,
+                **self._options,
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies.append(elapsed)
+                self.requests_sent += 1
+
+    def stats(self) -> dict:
+        """
+        Возвращает статистику задержек последних запросов.
+
+        Возвращает:
+            dict с ключами requests (все запросы), mean, p50, p99 (секунды,
+            по последним max_latencies запросам; None, если запросов не было).
+        """
+        with self._lock:
+            latencies = np.array(self.latencies, dtype=float)
+            requests_sent = self.requests_sent
+        if latencies.size == 0:
+            return {"requests": 0, "mean": None, "p50": None, "p99": None}
+        p50, p99 = np.percentile(latencies, [50, 99])
+        return {
+            "requests": requests_sent,
+            "mean": float(latencies.mean()),
+            "p50": float(p50),
+            "p99": float(p99),
+        }
+
+    def close(self):
+        """
+        Закрывает соединения пула.
+        """
+        self._client.close()
@@ -0,0 +1,158 @@
+"""
+Модуль с индексом идентификаторов из links.csv.
+
+Содержит класс LinkIndex: movieId, imdbId и tmdbId строк links.csv
+разбираются один раз в компактные целочисленные массивы. Одиночный поиск
+imdbId по movieId идет по словарю, пакетное сопоставление любых двух
+идентификаторов — через searchsorted по отсортированным массивам, поэтому
+сопоставление тысяч идентификаторов стоит одного прохода.
+"""
+
+import numpy as np
+import pandas as pd
+from group_index import find_positions
+
+MISSING_ID = -1
+ID_COLUMNS = ("movieId", "imdbId", "tmdbId")
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def check_id_column(name: str):
+    """
+    Проверяет имя колонки идентификаторов.
+
+    Аргументы:
+        name: str, одно из movieId, imdbId, tmdbId.
+    """
+    if name not in ID_COLUMNS:
+        raise ValueError("Invalid id column. Use 'movieId', 'imdbId' or 'tmdbId'.")
+
+
+def parse_ids(values) -> np.ndarray:
+    """
+    Разбирает строковые идентификаторы в целые числа.
+
+    Ведущие нули и префикс 'tt' у imdbId отбрасываются: '0114709'
+    и 'tt0114709' дают 114709.
+
+    Аргументы:
+        values: последовательность строк или None.
+
+    Возвращает:
+        np.ndarray int32 (int64, если значения не помещаются в int32),
+        MISSING_ID для пустых и нечисловых значений.
+    """
+    text = pd.Series(list(values), dtype=object).fillna("").astype(str).str.strip()
+    text = text.str.replace(r"^tt", "", regex=True)
+    numbers = pd.to_numeric(text.where(text.str.fullmatch(r"\d+")), errors="coerce")
+    ids = numbers.fillna(MISSING_ID).to_numpy(dtype=np.int64)
+    if len(ids) and ids.max() > INT32_MAX:
+        return ids
+    return ids.astype(np.int32)
+
+
+class LinkIndex:
+    """
+    Индекс movieId, imdbId и tmdbId по строкам links.csv.
+
+    Атрибуты:
+        rows: список словарей-строк, по которому построен индекс.
+        columns: dict {имя колонки: np.ndarray идентификаторов}, MISSING_ID
+            для пустых и нечисловых значений.
+
+    Методы:
+        imdb_id(movie_id): imdbId строкой, как в файле.
+        positions(ids, source): Номера строк для идентификаторов.
+        resolve(ids, source, target): Пакетное сопоставление идентификаторов.
+    """
+
+    def __init__(self, rows: list):
+        """
+        Строит индекс по строкам links.csv.
+
+        Аргументы:
+            rows: список словарей с ключами movieId, imdbId, tmdbId или None.
+        """
+        self.rows = rows
+        rows = rows or []
+        self.columns = {
+            name: parse_ids(row.get(name) for row in rows) for name in ID_COLUMNS
+        }
+        self._imdb_strings = [row.get("imdbId") for row in rows]
+        movie_ids = self.columns["movieId"]
+        present = np.flatnonzero(
+            (movie_ids != MISSING_ID)
+            & np.array([value is not None for value in self._imdb_strings], bool)
+        )
+        # При повторах movieId побеждает первая строка, как при проходе по файлу.
+        self._rows_by_movie = dict(
+            zip(movie_ids[present[::-1]].tolist(), present[::-1].tolist())
+        )
+        self._sorted = {}
+
+    def __len__(self) -> int:
+        return len(self._imdb_strings)
+
+    def imdb_id(self, movie_id) -> str:
+        """
+        Возвращает imdbId для movieId строкой, как в файле.
+
+        Возвращает:
+            str (например, '0114709') или None, если movieId нет.
+        """
+        try:
+            position = self._rows_by_movie.get(movie_id)
+        except TypeError:
+            return None
+        if position is None:
+            return None
+        return self._imdb_strings[position]
+
+    def _sorted_column(self, name: str) -> tuple:
+        """
+        Возвращает отсортированные значения колонки без MISSING_ID
+        и номера их строк.
+        """
+        if name not in self._sorted:
+            values = self.columns[name]
+            valid = np.flatnonzero(values != MISSING_ID)
+            order = valid[np.argsort(values[valid], kind="stable")]
+            self._sorted[name] = values[order], order
+        return self._sorted[name]
+
+    def positions(self, ids, source: str = "movieId") -> np.ndarray:
+        """
+        Возвращает номера строк для идентификаторов, -1 для отсутствующих.
+
+        Аргументы:
+            ids: массив целых идентификаторов.
+            source: str, колонка идентификаторов (movieId, imdbId, tmdbId).
+
+        Возвращает:
+            np.ndarray номеров строк; при повторах — первая строка.
+        """
+        check_id_column(source)
+        sorted_values, order = self._sorted_column(source)
+        found = find_positions(sorted_values, np.asarray(ids, dtype=np.int64))
+        if not len(order):
+            return found
+        return np.where(found >= 0, order[found], -1)
+
+    def resolve(self, ids, source: str = "movieId", target: str = "imdbId"):
+        """
+        Сопоставляет идентификаторы одной колонки идентификаторам другой.
+
+        Аргументы:
+            ids: массив целых идентификаторов.
+            source: str, колонка исходных идентификаторов.
+            target: str, колонка искомых идентификаторов.
+
+        Возвращает:
+            np.ndarray int64, MISSING_ID для отсутствующих.
+        """
+        check_id_column(target)
+        positions = self.positions(ids, source)
+        values = self.columns[target].astype(np.int64)
+        if not len(values):
+            return np.full(positions.shape, MISSING_ID, dtype=np.int64)
+        return np.where(positions >= 0, values[positions], MISSING_ID)
@@ -7,11 +7,28 @@
 """
 
 import csv
-import re
-import requests
+import time
 import pandas as pd
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
+from crawl_journal import CrawlJournal
+from facts_store import FactsStore
+from fetcher import Fetcher
+from http_session import HttpSession
+from link_index import LinkIndex
+from movie_facts import MovieFacts, parse_amount, parse_runtime
+from page_cache import PageCache
+from page_parser import parse_page
+from sidecar import cached_object
+from topk import RunningTop
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:133.0)\
+                Gecko/20100101 Firefox/133.0"
+}
+IMDB_URL = "https://www.imdb.com/"
+PREFETCH_WINDOW = 64
+SESSION = HttpSession()
 
 
 class Links:
@@ -28,17 +45,58 @@ class Links:
         most_profitable(n): Возвращает словарь с топ-n самых прибыльных фильмов и их прибылью.
         longest(n): Возвращает словарь с топ-n самых длинных фильмов и их продолжительностью в мин.
         top_cost_per_minute(n): Возвращает словарь с топ-n фильмов по стоимости за минуту.
+        id_index(): Индекс movieId, imdbId и tmdbId.
+        resolve(ids, source, target): Пакетно сопоставляет идентификаторы.
+        facts(): Таблица фактов о фильмах, общая для всех отчетов.
+        refresh_facts(max_age): Перестраивает таблицу фактов, загружая только
+            новые и устаревшие страницы.
+        iter_movie_records(max_age): Факты о фильмах по мере загрузки страниц.
+        iter_most_expensive(n), iter_most_profitable(n), iter_longest(n),
+        iter_top_cost_per_minute(n): Текущий top-n после каждого фильма.
     """
 
-    def __init__(self, path_to_the_file: str):
+    def __init__(
+        self,
+        path_to_the_file: str,
+        cache: bool = True,
+        page_cache: PageCache = None,
+        fetcher: Fetcher = None,
+        facts_store: FactsStore = None,
+        session: HttpSession = None,
+        journal: CrawlJournal = None,
+    ):
         """
         Инициализирует класс Links с путем к файлу links.csv.
 
         Атрибуты:
             path_to_the_file: str, путь к CSV файлу.
+            cache: bool, сохранять прочитанные строки в бинарный кеш рядом с CSV
+                и загружать из него при следующих запусках.
+            page_cache: PageCache, дисковый кеш страниц IMDb или None
+                (каждая страница скачивается заново).
+            fetcher: Fetcher, параллельная загрузка страниц окнами
+                по PREFETCH_WINDOW фильмов или None (страницы скачиваются
+                по одной).
+            facts_store: FactsStore, хранилище разобранных фактов о фильмах
+                или None (факты извлекаются со страниц при каждом запуске).
+            session: HttpSession, пул постоянных соединений для загрузки
+                страниц по одной или None (общий для модуля SESSION).
+            journal: CrawlJournal, журнал обхода: обработанные страницы
+                фильмов и режиссеров пропускаются при повторном запуске,
+                или None.
         """
         self.path = path_to_the_file
-        self.links_data = self.__load_links()
+        self.page_cache = page_cache
+        self.fetcher = fetcher
+        self.facts_store = facts_store
+        self.session = session
+        self.journal = journal
+        self._prefetched = {}
+        self._facts = None
+        self.links_data = cached_object(
+            path_to_the_file, "rows", self.__load_links, cache
+        )
+        self._id_index = LinkIndex(self.links_data)
 
     def __load_links(self) -> list:
         """
@@ -72,7 +130,41 @@ class Links:
             print("Invalid IMDb ID passed to __get_soup")
             return None
 
-        url = "https://www.imdb.com/"
+        url = self.__page_url(imdb_id)
+        print(f"url = {url}")
+        if url in self._prefetched:
+            if self._prefetched[url] is None:
+                print(f"Error fetching URL: {url}")
+                return None
+            return parse_page(self._prefetched[url])
+
+        page_cache = self.page_cache
+        html = page_cache.get(url) if page_cache is not None else None
+        session = self.session or SESSION
+        try:
+            if html is None:
+                response = session.get(url, headers=HEADERS, timeout=10)
+                response.raise_for_status()
+                html = response.text
+                if page_cache is not None:
+                    page_cache.put(url, html)
+            soup = parse_page(html)
+            return soup
+        except session.errors:
+            print(f"Error fetching URL: {url}")
+            return None
+
+    def __page_url(self, imdb_id: str) -> str:
+        """
+        Возвращает адрес страницы IMDb для идентификатора фильма или человека.
+
+        Атрибуты:
+            imdb_id: str, например '0114709', 'tt0114709' или 'name/nm0000229'.
+
+        Возвращает:
+            str, адрес страницы.
+        """
+        url = IMDB_URL
         imdb_id = imdb_id.strip("/")
 
         if imdb_id.isdigit():
@@ -88,21 +180,57 @@ class Links:
             url = f"{url}{imdb_id}/"
         else:
             url = f"{url}{imdb_id}/"
+        return url
 
-        print(f"url = {url}")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:133.0)\
-                Gecko/20100101 Firefox/133.0"
-        }
+    def __prefetch(self, imdb_ids):
+        """
+        Параллельно загружает страницы через fetcher для следующих __get_soup.
 
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            return soup
-        except requests.exceptions.RequestException as ex:
-            print(f"Error fetching URL: {url}")
-            return None
+        Страницы из page_cache не загружаются, загруженные сохраняются в него.
+
+        Атрибуты:
+            imdb_ids: идентификаторы страниц; пустые значения пропускаются.
+        """
+        urls = [
+            self.__page_url(imdb_id)
+            for imdb_id in imdb_ids
+            if imdb_id and isinstance(imdb_id, str)
+        ]
+        page_cache = self.page_cache
+        pages = {}
+        missing = []
+        for url in dict.fromkeys(urls):
+            html = page_cache.get(url) if page_cache is not None else None
+            if html is None:
+                missing.append(url)
+            else:
+                pages[url] = html
+        for url, html in self.fetcher.fetch_many(missing, HEADERS).items():
+            pages[url] = html
+            if html is not None and page_cache is not None:
+                page_cache.put(url, html)
+        self._prefetched = pages
+
+    def __with_pages(self, items, imdb_id_of=lambda row: row.get("imdbId")):
+        """
+        Перебирает items, заранее загружая их страницы окнами через fetcher.
+
+        Без fetcher items перебираются как есть, страницы загружаются
+        в __get_soup по одной.
+
+        Атрибуты:
+            items: строки links_data или другие элементы.
+            imdb_id_of: функция, возвращающая идентификатор страницы элемента.
+        """
+        if self.fetcher is None:
+            yield from items
+            return
+        items = list(items)
+        for start in range(0, len(items), PREFETCH_WINDOW):
+            window = items[start : start + PREFETCH_WINDOW]
+            self.__prefetch([imdb_id_of(item) for item in window])
+            yield from window
+        self._prefetched = {}
 
     def get_imdb(self, movie_ids: list, list_of_fields: list) -> list[list]:
         """
@@ -117,7 +245,7 @@ class Links:
             Список списков фильмов отсортированных по убыванию.
         """
         imdb_info = []
-        for movie_id in movie_ids:
+        for movie_id in self.__with_pages(movie_ids, self.__get_imdb_id):
             imdb_id = self.__get_imdb_id(movie_id)
             if imdb_id:
                 movie_data = [movie_id]
@@ -143,13 +271,34 @@ class Links:
         Возвращает:
             str, идентификатор IMDb или None.
         """
-        for row in self.links_data:
-            try:
-                if int(row["movieId"]) == movie_id:
-                    return row["imdbId"]
-            except (ValueError, KeyError):
-                continue
-        return None
+        return self.id_index().imdb_id(movie_id)
+
+    def id_index(self) -> LinkIndex:
+        """
+        Возвращает индекс идентификаторов по links_data.
+
+        Индекс строится при загрузке и перестраивается, если links_data
+        заменили другим списком.
+        """
+        index = self._id_index
+        if index is None or index.rows is not self.links_data:
+            index = self._id_index = LinkIndex(self.links_data)
+        return index
+
+    def resolve(self, ids, source: str = "movieId", target: str = "imdbId"):
+        """
+        Пакетно сопоставляет идентификаторы фильмов.
+
+        Аргументы:
+            ids: массив целых идентификаторов.
+            source: str, колонка исходных идентификаторов (movieId, imdbId, tmdbId).
+            target: str, колонка искомых идентификаторов.
+
+        Возвращает:
+            np.ndarray int64, -1 для отсутствующих; imdbId — числом без
+            ведущих нулей и префикса 'tt'.
+        """
+        return self.id_index().resolve(ids, source, target)
 
     def __extract_field(self, soup: BeautifulSoup, field: str) -> str:
         """
@@ -258,49 +407,270 @@ class Links:
         except AttributeError:
             return None
 
-    def top_directors(self, n: int) -> dict:
+    def __get_title(self, soup: BeautifulSoup) -> str:
         """
-        Возвращает словарь с топ-n режиссерами и количеством их фильмов.
+        Достаем название фильма из заголовка h1
 
-        Аргументы:
-            n: int, количество лучших режиссеров для возврата.
+        Атрибуты:
+            soup: объект BeautifulSoup.
 
         Возвращает:
-            dict, {имя_режиссера: количество_фильмов}, sort по кол-ву фильмов по убыванию.
+            str, название фильма или None
         """
-        directors_count = {}
-        processed_urls = set()
+        try:
+            return soup.find("h1").text.strip()
+        except AttributeError:
+            return None
 
-        for row in self.links_data:
-            imdb_id = row.get("imdbId")
-            if not imdb_id:
-                continue
+    def __get_director_href(self, soup: BeautifulSoup) -> str:
+        """
+        Достаем ссылку на страницу режиссера без параметров запроса
+
+        Атрибуты:
+            soup: объект BeautifulSoup.
+
+        Возвращает:
+            str, ссылка вида 'name/nm0000229' или None
+        """
+        try:
+            credit_block = soup.find("li", {"data-testid": "title-pc-principal-credit"})
+            director_tag = credit_block.find("a") if credit_block else None
+            director_href = director_tag.get("href") if director_tag else None
+        except AttributeError:
+            return None
+        if not director_href or not isinstance(director_href, str):
+            return None
+        return urlparse(director_href)._replace(query="").geturl().strip("/")
+
+    def __movie_record(self, imdb_id: str, soup: BeautifulSoup) -> dict:
+        """
+        Извлекает все факты о фильме с одной страницы.
+
+        Атрибуты:
+            imdb_id: str, идентификатор IMDb.
+            soup: объект BeautifulSoup страницы фильма.
+
+        Возвращает:
+            dict с ключами movie_facts.FACT_COLUMNS.
+        """
+        return {
+            "imdbId": imdb_id,
+            "title": self.__get_title(soup),
+            "director": self.__extract_field(soup, "Director"),
+            "director_href": self.__get_director_href(soup),
+            "budget": self.__extract_field(soup, "Budget"),
+            "gross": self.__extract_field(soup, "Cumulative Worldwide Gross"),
+            "runtime": self.__extract_field(soup, "Runtime"),
+            "fetched_at": time.time(),
+        }
+
+    def facts(self) -> MovieFacts:
+        """
+        Возвращает таблицу фактов о фильмах из links_data.
 
+        Каждая страница фильма загружается и разбирается один раз, таблица
+        переиспользуется всеми отчетами и перестраивается, если links_data
+        заменили другим списком.
+
+        Возвращает:
+            MovieFacts.
+        """
+        cached = self._facts
+        if cached is not None and cached[0] is self.links_data:
+            return cached[1]
+        return self.refresh_facts()
+
+    def __stored_and_stale(self, max_age: float = None) -> tuple:
+        """
+        Делит фильмы links_data на сохраненные и требующие загрузки.
+
+        Атрибуты:
+            max_age: float, срок годности записи в секундах или None.
+
+        Возвращает:
+            tuple (записи facts_store {imdbId: запись}, список уникальных
+            imdbId, которых нет в хранилище или записи которых устарели).
+        """
+        store = self.facts_store
+        stored = store.load() if store is not None else {}
+        imdb_ids = list(dict.fromkeys(row.get("imdbId") for row in self.links_data))
+        stale = [
+            imdb_id
+            for imdb_id in imdb_ids
+            if imdb_id
+            and (store is None or store.is_stale(stored.get(imdb_id), max_age))
+        ]
+        return stored, stale
+
+    def __fetch_records(self, imdb_ids, max_age: float = None):
+        """
+        Загружает страницы фильмов и по одной выдает извлеченные факты.
+
+        С journal сначала выдаются записанные в нем факты, загружаются
+        только остальные страницы, и факты каждой сразу записываются.
+        С facts_store записи журнала старше max_age загружаются заново,
+        как устаревшие записи хранилища.
+
+        Атрибуты:
+            imdb_ids: уникальные идентификаторы IMDb.
+            max_age: float, срок годности записи в секундах; None — срок
+                facts_store.max_age.
+
+        Возвращает:
+            генератор словарей __movie_record; фильмы, страницы которых
+            не удалось загрузить, пропускаются.
+        """
+        journal = self.journal
+        store = self.facts_store
+        if journal is not None:
+            missing = []
+            for imdb_id in imdb_ids:
+                record = journal.get("movie", imdb_id)
+                if record is not None and (
+                    store is None or not store.is_stale(record, max_age)
+                ):
+                    yield record
+                else:
+                    missing.append(imdb_id)
+            imdb_ids = missing
+        for imdb_id in self.__with_pages(imdb_ids, lambda imdb_id: imdb_id):
             soup = self.__get_soup(imdb_id)
             if soup is None:
                 continue
+            record = self.__movie_record(imdb_id, soup)
+            if journal is not None:
+                journal.record("movie", imdb_id, record)
+            yield record
 
-            credit_block = soup.find("li", {"data-testid": "title-pc-principal-credit"})
-            if not credit_block:
-                continue
+    def refresh_facts(self, max_age: float = None) -> MovieFacts:
+        """
+        Перестраивает таблицу фактов о фильмах из links_data.
 
-            director_tag = credit_block.find("a")
-            if not director_tag:
-                continue
+        С facts_store страницы загружаются только для фильмов, которых нет
+        в хранилище или записи которых старше max_age; новые записи
+        сохраняются в хранилище. Без него загружаются все страницы.
+        Каждая страница загружается один раз, даже если imdbId повторяется.
+
+        Аргументы:
+            max_age: float, срок годности записи в секундах; None — срок
+                facts_store.max_age.
 
-            director_name = director_tag.text.strip()
-            director_href = director_tag.get("href")
+        Возвращает:
+            MovieFacts.
+        """
+        store = self.facts_store
+        stored, stale = self.__stored_and_stale(max_age)
+        fetched = {
+            record["imdbId"]: record
+            for record in self.__fetch_records(stale, max_age)
+        }
+        if store is not None and fetched:
+            store.save(fetched.values())
+        # Устаревшая запись остается, если страницу не удалось загрузить.
+        known = {**stored, **fetched}
+        records = [
+            known[row.get("imdbId")]
+            for row in self.links_data
+            if row.get("imdbId") in known
+        ]
+        facts = MovieFacts.from_records(records)
+        self._facts = (self.links_data, facts)
+        return facts
+
+    def iter_movie_records(self, max_age: float = None):
+        """
+        Выдает факты о фильмах по мере загрузки страниц.
 
-            if not director_href:
-                continue
+        Сначала выдаются свежие записи facts_store, затем — факты со страниц
+        новых и устаревших фильмов сразу после их разбора; каждый imdbId
+        выдается один раз. Загруженные записи сохраняются в facts_store
+        пачками по PREFETCH_WINDOW, в том числе при досрочной остановке.
+        Устаревшая запись выдается в конце, если страницу не удалось
+        загрузить.
 
-            parsed_href = urlparse(director_href)._replace(query="").geturl()
-            director_href = parsed_href.strip("/")
+        Аргументы:
+            max_age: float, срок годности записи в секундах; None — срок
+                facts_store.max_age.
 
-            if director_href in processed_urls:
-                continue
-            processed_urls.add(director_href)
+        Возвращает:
+            генератор словарей с ключами movie_facts.FACT_COLUMNS и fetched_at.
+        """
+        store = self.facts_store
+        stored, stale = self.__stored_and_stale(max_age)
+        pending = set(stale)
+        for imdb_id in dict.fromkeys(row.get("imdbId") for row in self.links_data):
+            if imdb_id in stored and imdb_id not in pending:
+                yield stored[imdb_id]
+
+        batch = []
+        try:
+            for record in self.__fetch_records(stale, max_age):
+                pending.discard(record["imdbId"])
+                batch.append(record)
+                if store is not None and len(batch) >= PREFETCH_WINDOW:
+                    store.save(batch)
+                    batch = []
+                yield record
+        finally:
+            if store is not None and batch:
+                store.save(batch)
+        for imdb_id in stale:
+            if imdb_id in pending and imdb_id in stored:
+                yield stored[imdb_id]
+
+    def __iter_top(self, n: int, rank, by_title: bool = True):
+        """
+        Ведет top-n по потоку фактов о фильмах.
+
+        Память — O(n) независимо от числа фильмов: RunningTop хранит
+        не более 3n названий.
+
+        Аргументы:
+            n: int, размер top-n.
+            rank: функция записи, возвращающая (значение для сравнения,
+                значение в отчете) или None, если фильм не участвует.
+            by_title: bool, одно место на название с последним значением,
+                как у отчетов на movie_facts._top; иначе top-n фильмов,
+                собранный в словарь, как в most_expensive.
+
+        Возвращает:
+            генератор словарей {название_фильма: значение} по убыванию,
+            один после каждого фильма; последний совпадает с отчетом
+            по тем же фильмам, если by_title равен False или значение
+            уменьшалось у повторных названий не более n раз.
+        """
+        top = RunningTop(n)
+        for record in self.iter_movie_records():
+            title = record.get("title")
+            ranked = rank(record) if title is not None else None
+            if ranked is not None:
+                top.push(ranked[0], (title, ranked[1]), title if by_title else None)
+            yield dict(top.items())
+
+    def top_directors(self, n: int) -> dict:
+        """
+        Возвращает словарь с топ-n режиссерами и количеством их фильмов.
 
+        Аргументы:
+            n: int, количество лучших режиссеров для возврата.
+
+        Возвращает:
+            dict, {имя_режиссера: количество_фильмов}, sort по кол-ву фильмов по убыванию.
+        """
+        directors = self.facts().directors()
+        journal = self.journal
+        processed_urls = journal.processed("director") if journal else set()
+        film_counts = {
+            director_href: journal.get("director", director_href)
+            for director_href in processed_urls
+        }
+
+        # Режиссеры берутся из таблицы фактов, их страницы загружаются вторым
+        # проходом, чтобы fetcher мог скачивать их параллельно.
+        for director_name, director_href in self.__with_pages(
+            [director for director in directors if director[1] not in processed_urls],
+            lambda director: director[1],
+        ):
             director_soup = self.__get_soup(director_href)
 
             if director_soup is None:
@@ -315,11 +685,17 @@ class Links:
                     if count_button
                     else None
                 )
-                if count_span:
-                    film_count = int(count_span.text.strip())
-                    directors_count[director_name] = film_count
+                film_count = int(count_span.text.strip()) if count_span else None
             except Exception:
                 continue
+            film_counts[director_href] = film_count
+            if journal is not None:
+                journal.record("director", director_href, film_count)
+
+        directors_count = {}
+        for director_name, director_href in directors:
+            if film_counts.get(director_href) is not None:
+                directors_count[director_name] = film_counts[director_href]
 
         sorted_directors = dict(
             sorted(directors_count.items(), key=lambda x: x[1], reverse=True)[:n]
@@ -336,29 +712,26 @@ class Links:
         Возвращает:
             dict, {название_фильма: бюджет}, отсортированный по бюджету по убыванию.
         """
-        budgets = []
+        return self.facts().most_expensive(n)
 
-        for row in self.links_data:
-            imdb_id = row["imdbId"]
-            soup = self.__get_soup(imdb_id)
-            if soup is None:
-                continue
+    def iter_most_expensive(self, n: int):
+        """
+        Выдает текущий top-n самых дорогих фильмов по мере загрузки страниц.
 
-            budget_str = self.__extract_field(soup, "Budget")
-            if not budget_str:
-                continue
+        Хранит только n фильмов, итог совпадает с most_expensive.
 
-            digits = re.findall(r"\d+", budget_str.replace(",", ""))
-            if not digits:
-                continue
+        Аргументы:
+            n: int, количество лучших фильмов.
 
-            budget_value = int("".join(digits))
-            title = soup.find("h1").text.strip()
-            budgets.append((title, budget_value, budget_str))
+        Возвращает:
+            генератор словарей {название_фильма: бюджет}, как most_expensive.
+        """
 
-        sorted_budgets = sorted(budgets, key=lambda x: x[1], reverse=True)[:n]
+        def rank(record):
+            budget = parse_amount(record.get("budget"))
+            return None if budget is None else (budget, record["budget"])
 
-        return {title: budget_str for title, _, budget_str in sorted_budgets}
+        return self.__iter_top(n, rank, by_title=False)
 
     def most_profitable(self, n: int) -> dict:
         """
@@ -370,23 +743,30 @@ class Links:
         Возвращает:
             dict, {название_фильма: прибыль}, отсортированный по прибыли по убыванию.
         """
-        profits = {}
-        for row in self.links_data:
-            imdb_id = row["imdbId"]
-            soup = self.__get_soup(imdb_id)
-            budget = self.__extract_field(soup, "Budget")
-            gross = self.__extract_field(soup, "Cumulative Worldwide Gross")
-            if budget and gross:
-                title = soup.find("h1").text.strip()
-                profit = int("".join(re.findall(r"\d+", gross))) - int(
-                    "".join(re.findall(r"\d+", budget))
-                )
-                profits[title] = profit
+        return self.facts().most_profitable(n)
 
-        sorted_profits = dict(
-            sorted(profits.items(), key=lambda x: x[1], reverse=True)[:n]
-        )
-        return sorted_profits
+    def iter_most_profitable(self, n: int):
+        """
+        Выдает текущий top-n самых прибыльных фильмов по мере загрузки страниц.
+
+        Хранит не более 3n названий; итог совпадает с most_profitable, пока
+        значение уменьшалось не более чем у n повторных названий.
+
+        Аргументы:
+            n: int, количество лучших фильмов.
+
+        Возвращает:
+            генератор словарей {название_фильма: прибыль}, как most_profitable.
+        """
+
+        def rank(record):
+            budget = parse_amount(record.get("budget"))
+            gross = parse_amount(record.get("gross"))
+            if budget is None or gross is None:
+                return None
+            return gross - budget, gross - budget
+
+        return self.__iter_top(n, rank)
 
     def longest(self, n: int) -> dict:
         """
@@ -398,21 +778,27 @@ class Links:
         Возвращает:
             dict, {название_фильма: продолжительность}, sort по продолжительности по убыванию.
         """
-        runtimes = {}
-        for row in self.links_data:
-            imdb_id = row["imdbId"]
-            soup = self.__get_soup(imdb_id)
-            runtime = self.__extract_field(soup, "Runtime")
-            if runtime:
-                title = soup.find("h1").text.strip()
-                hour = int(runtime.split(":")[0])
-                minute = int(runtime.split(":")[1])
-                runtimes[title] = hour * 60 + minute
-
-        sorted_runtimes = dict(
-            sorted(runtimes.items(), key=lambda x: x[1], reverse=True)[:n]
-        )
-        return sorted_runtimes
+        return self.facts().longest(n)
+
+    def iter_longest(self, n: int):
+        """
+        Выдает текущий top-n самых длинных фильмов по мере загрузки страниц.
+
+        Хранит не более 3n названий; итог совпадает с longest, пока
+        значение уменьшалось не более чем у n повторных названий.
+
+        Аргументы:
+            n: int, количество лучших фильмов.
+
+        Возвращает:
+            генератор словарей {название_фильма: продолжительность}, как longest.
+        """
+
+        def rank(record):
+            runtime = parse_runtime(record.get("runtime"))
+            return None if runtime is None else (runtime, runtime)
+
+        return self.__iter_top(n, rank)
 
     def top_cost_per_minute(self, n: int) -> dict:
         """
@@ -424,27 +810,29 @@ class Links:
         Возвращает:
             dict, {название_фильма: стоимость_за_минуту}, sort по стоимости за минуту по убыванию.
         """
-        cost_per_minute = {}
-        for row in self.links_data:
-            imdb_id = row["imdbId"]
-            soup = self.__get_soup(imdb_id)
-            budget = self.__extract_field(soup, "Budget")
-            runtime = self.__extract_field(soup, "Runtime")
-            if budget and runtime:
-                try:
-                    title = soup.find("h1").text.strip()
-                    hour = int(runtime.split(":")[0])
-                    minute = int(runtime.split(":")[1])
-                    cost = round(
-                        int("".join(re.findall(r"\d+", budget)))
-                        / int(hour * 60 + minute),
-                        2,
-                    )
-                    cost_per_minute[title] = cost
-                except Exception:
-                    continue
+        return self.facts().top_cost_per_minute(n)
 
-        sorted_costs = dict(
-            sorted(cost_per_minute.items(), key=lambda x: x[1], reverse=True)[:n]
-        )
-        return sorted_costs
+    def iter_top_cost_per_minute(self, n: int):
+        """
+        Выдает текущий top-n фильмов по стоимости минуты по мере загрузки.
+
+        Хранит не более 3n названий; итог совпадает с top_cost_per_minute, пока
+        значение уменьшалось не более чем у n повторных названий.
+
+        Аргументы:
+            n: int, количество лучших фильмов.
+
+        Возвращает:
+            генератор словарей {название_фильма: стоимость_за_минуту},
+            как top_cost_per_minute.
+        """
+
+        def rank(record):
+            budget = parse_amount(record.get("budget"))
+            runtime = parse_runtime(record.get("runtime"))
+            if budget is None or not runtime:
+                return None
+            cost = round(budget / runtime, 2)
+            return cost, cost
+
+        return self.__iter_top(n, rank)
@@ -0,0 +1,224 @@
+"""
+Модуль с таблицей фактов о фильмах со страниц IMDb.
+
+Содержит класс MovieFacts: за один проход по страницам фильмов
+извлекаются название, режиссер и ссылка на его страницу, бюджет, сборы
+и длительность. Строки складываются в типизированную таблицу pandas,
+числовые бюджет, сборы и длительность в минутах разбираются векторно
+при построении, а отчеты Links (самые дорогие, прибыльные, длинные
+фильмы, стоимость минуты, режиссеры) считаются запросами к таблице.
+Функции parse_amount и parse_runtime разбирают одно значение так же,
+как векторные parse_amounts и parse_runtimes, — для потоковых отчетов.
+"""
+
+import re
+
+import pandas as pd
+
+TEXT_COLUMNS = ("imdbId", "title", "director", "director_href", "budget", "gross")
+FACT_COLUMNS = TEXT_COLUMNS + ("runtime",)
+RUNTIME_PATTERN = r"^\s*(\d+)\s*:\s*(\d+)\s*(?::.*)?$"
+
+
+def _text(values) -> pd.Series:
+    """
+    Возвращает колонку строк, значения других типов заменяются на None.
+    """
+    return pd.Series(
+        [value if isinstance(value, str) else None for value in values], dtype=object
+    )
+
+
+def parse_amounts(values) -> pd.Series:
+    """
+    Разбирает суммы вида '$150,000,000 (estimated)' в целые числа.
+
+    Как и прежний разбор, склеивает все цифры строки.
+
+    Аргументы:
+        values: последовательность строк.
+
+    Возвращает:
+        pd.Series Int64, <NA> для строк без цифр и пропусков.
+    """
+    digits = _text(values).str.replace(r"\D", "", regex=True)
+    return pd.to_numeric(digits.where(digits != ""), errors="coerce").astype("Int64")
+
+
+def parse_runtimes(values) -> pd.Series:
+    """
+    Разбирает длительность вида 'h:m' в минуты.
+
+    Аргументы:
+        values: последовательность строк.
+
+    Возвращает:
+        pd.Series Int64, <NA> для строк другого вида и пропусков.
+    """
+    parts = _text(values).str.extract(RUNTIME_PATTERN)
+    hours = pd.to_numeric(parts[0], errors="coerce").astype("Int64")
+    minutes = pd.to_numeric(parts[1], errors="coerce").astype("Int64")
+    return hours * 60 + minutes
+
+
+def parse_amount(value) -> int:
+    """
+    Разбирает одну сумму так же, как parse_amounts.
+
+    Возвращает:
+        int или None для строки без цифр и не строки.
+    """
+    if not isinstance(value, str):
+        return None
+    digits = re.sub(r"\D", "", value)
+    return int(digits) if digits else None
+
+
+def parse_runtime(value) -> int:
+    """
+    Разбирает одну длительность 'h:m' в минуты так же, как parse_runtimes.
+
+    Возвращает:
+        int или None для строки другого вида и не строки.
+    """
+    match = re.search(RUNTIME_PATTERN, value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def _top(titles, values, n: int) -> dict:
+    """
+    Возвращает top-n значений по названиям фильмов.
+
+    Для повторяющихся названий берется последнее значение на месте первого
+    появления, равные значения идут в порядке строк — как у словаря,
+    заполненного проходом по фильмам и отсортированного sorted.
+    """
+    frame = pd.DataFrame({"title": titles, "value": values})
+    last = frame.groupby("title", sort=False)["value"].last()
+    top = last.sort_values(ascending=False, kind="stable").head(max(n, 0))
+    return dict(zip(top.index, top.tolist()))
+
+
+class MovieFacts:
+    """
+    Таблица фактов о фильмах со страниц IMDb.
+
+    Атрибуты:
+        table: pd.DataFrame с колонками imdbId, title, director,
+            director_href, budget, gross, runtime (строки со страниц),
+            budget_value, gross_value, runtime_minutes (Int64) и fetched_at
+            (время загрузки страницы в секундах от эпохи, float64).
+
+    Методы:
+        from_records(records): Строит таблицу из словарей по фильмам.
+        most_expensive(n): Самые дорогие фильмы.
+        most_profitable(n): Самые прибыльные фильмы.
+        longest(n): Самые длинные фильмы.
+        top_cost_per_minute(n): Фильмы с самой дорогой минутой.
+        directors(): Режиссеры и ссылки на их страницы.
+    """
+
+    def __init__(self, table: pd.DataFrame):
+        """
+        Инициализирует факты готовой таблицей.
+        """
+        self.table = table
+
+    @classmethod
+    def from_records(cls, records: list) -> "MovieFacts":
+        """
+        Строит таблицу из словарей с ключами FACT_COLUMNS и fetched_at.
+
+        Аргументы:
+            records: список словарей, по одному на фильм.
+
+        Возвращает:
+            MovieFacts.
+        """
+        table = pd.DataFrame(
+            {
+                name: _text(record.get(name) for record in records)
+                for name in FACT_COLUMNS
+            }
+        )
+        table["budget_value"] = parse_amounts(table["budget"])
+        table["gross_value"] = parse_amounts(table["gross"])
+        table["runtime_minutes"] = parse_runtimes(table["runtime"])
+        table["fetched_at"] = pd.to_numeric(
+            pd.Series([record.get("fetched_at") for record in records], dtype=object),
+            errors="coerce",
+        ).astype(float)
+        return cls(table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _titled(self, *columns) -> pd.DataFrame:
+        """
+        Возвращает строки с названием и непустыми колонками columns.
+        """
+        table = self.table
+        present = table["title"].notna()
+        for column in columns:
+            present &= table[column].notna()
+        return table[present]
+
+    def most_expensive(self, n: int) -> dict:
+        """
+        Возвращает top-n самых дорогих фильмов.
+
+        Возвращает:
+            dict {название: бюджет строкой со страницы}, по убыванию бюджета.
+        """
+        rows = self._titled("budget_value")
+        top = rows.sort_values("budget_value", ascending=False, kind="stable")
+        top = top.head(max(n, 0))
+        return dict(zip(top["title"], top["budget"]))
+
+    def most_profitable(self, n: int) -> dict:
+        """
+        Возвращает top-n фильмов по прибыли (сборы минус бюджет).
+
+        Возвращает:
+            dict {название: прибыль}, по убыванию прибыли.
+        """
+        rows = self._titled("budget_value", "gross_value")
+        return _top(rows["title"], rows["gross_value"] - rows["budget_value"], n)
+
+    def longest(self, n: int) -> dict:
+        """
+        Возвращает top-n самых длинных фильмов.
+
+        Возвращает:
+            dict {название: длительность в минутах}, по убыванию.
+        """
+        rows = self._titled("runtime_minutes")
+        return _top(rows["title"], rows["runtime_minutes"], n)
+
+    def top_cost_per_minute(self, n: int) -> dict:
+        """
+        Возвращает top-n фильмов по стоимости минуты (бюджет / длительность).
+
+        Возвращает:
+            dict {название: стоимость минуты, округленная до 2 знаков}.
+        """
+        rows = self._titled("budget_value", "runtime_minutes")
+        rows = rows[rows["runtime_minutes"] != 0]
+        costs = rows["budget_value"].astype(float) / rows["runtime_minutes"]
+        return _top(rows["title"], [round(cost, 2) for cost in costs.tolist()], n)
+
+    def directors(self) -> list:
+        """
+        Возвращает режиссеров с уникальными ссылками на страницы.
+
+        Возвращает:
+            list кортежей (имя, ссылка) в порядке фильмов; для повторяющейся
+            ссылки — имя из первого фильма.
+        """
+        rows = self.table[
+            self.table["director"].notna() & self.table["director_href"].notna()
+        ]
+        rows = rows.drop_duplicates("director_href")
+        return list(zip(rows["director"], rows["director_href"]))
@@ -11,7 +11,13 @@ import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
+from fetcher import Fetcher
+from http_session import HttpSession
 from links import Links
 from movies import Movies
+from page_cache import PageCache
 from ratings import Ratings
+from ratings_store import RatingsStore
+from ratings_stream import RatingsSummary
+from result_format import get_result_format, set_result_format
 from tags import Tags
@@ -5,10 +5,13 @@
 фильмов по годам, жанрам и количеству жанров.
 """
 
-from collections import Counter
 from collections import OrderedDict
+import numpy as np
 import pandas as pd
-import re
+from catalog import MISSING_YEAR, MovieCatalog
+from result_format import format_result, resolve_format
+from sidecar import cached_object
+from topk import top_k
 
 
 class Movies:
@@ -17,75 +20,141 @@ class Movies:
 
     Атрибуты:
         path_to_the_file: str — путь к файлу movies.csv.
+        catalog: MovieCatalog — movieId, годы выпуска и маски жанров в массивах.
+        genres: GenreMatrix — словарь жанров и битовые маски жанров фильмов.
 
     Методы:
         dist_by_release(): Возвращает словарь с количеством фильмов по годам.
         dist_by_genres(): Возвращает словарь с количеством фильмов по жанрам.
         most_genres(n): Возвращает словарь с топ-n фильмов по количеству жанров.
+        genre_cooccurrence(): Возвращает матрицу совместной встречаемости жанров.
+        filter(genres, years, match): Возвращает фильмы с жанрами и годами выпуска.
     """
 
-    def __init__(self, path_to_the_file: str):
+    def __init__(self, path_to_the_file: str, cache: bool = True):
         """
         Инициализирует класс Movies с путем к файлу movies.csv.
 
         Аргументы:
             path_to_the_file: str, путь к CSV файлу.
+            cache: bool, сохранять разобранный файл в бинарный кеш рядом с CSV
+                и загружать из него при следующих запусках.
         """
         self.path = path_to_the_file
-        self.data = pd.read_csv(path_to_the_file)
+        self.data = cached_object(
+            path_to_the_file, "frame", lambda: pd.read_csv(path_to_the_file), cache
+        )
+        self.catalog = cached_object(
+            path_to_the_file,
+            "catalog",
+            lambda: MovieCatalog.from_frame(self.data),
+            cache,
+        )
+        self.genres = self.catalog.genres
 
-    def dist_by_release(self) -> OrderedDict:
+    def dist_by_release(self, output: str = None) -> OrderedDict:
         """
         Возвращает количество фильмов, выпущенных в каждый год.
 
-        Извлекает год выпуска из названия фильма (например, "Toy Story (1995)")
-        и считает количество фильмов для каждого года.
+        Год выпуска разобран из названия фильма (например, "Toy Story (1995)")
+        при загрузке; фильмы без года не учитываются. При равенстве раньше
+        идет год, который встретился в файле первым.
+
+        Аргументы:
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
 
         Возвращает:
             OrderedDict — словарь вида {год: количество}, отсортированный по убыванию.
         """
-        years = self.data["title"].apply(lambda title: re.search(r"\((\d{4})\)", title))
-        year_list = [match.group(1) for match in years if match]
-        counter = Counter(year_list)
+        years = self.catalog.years
+        codes, uniques = pd.factorize(years[years != MISSING_YEAR], sort=False)
+        counts = np.bincount(codes, minlength=len(uniques))
+        order = np.argsort(-counts, kind="stable")
         sorted_years = OrderedDict(
-            sorted(counter.items(), key=lambda x: x[1], reverse=True)
+            (f"{year:04d}", count)
+            for year, count in zip(uniques[order].tolist(), counts[order].tolist())
         )
-        return sorted_years
+        return format_result(sorted_years, output)
 
-    def dist_by_genres(self) -> dict:
+    def dist_by_genres(self, output: str = None) -> dict:
         """
         Возвращает количество фильмов по каждому жанру.
 
-        Разбивает строку жанров (через '|') и подсчитывает общее количество
-        появлений каждого жанра во всех фильмах.
+        Количества — суммы по столбцам матрицы жанров, построенной при загрузке.
+        При равенстве раньше идет жанр, который встретился в файле первым.
+        Жанр, повторенный в строке одного фильма, считается один раз.
+
+        Аргументы:
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
 
         Возвращает:
             dict — словарь вида {жанр: количество}, отсортированный по убыванию.
         """
-        all_genres = self.data["genres"].str.split("|").sum()
-        counter = Counter(all_genres)
-        sorted_genres = dict(sorted(counter.items(), key=lambda x: x[1], reverse=True))
-        return sorted_genres
-
-    def most_genres(self, n: int) -> dict:
+        counts = self.genres.genre_counts()
+        order = np.argsort(-counts, kind="stable")
+        genres, counts = self.genres.vocabulary[order], counts[order]
+        if resolve_format(output) == "dict":
+            return dict(zip(genres.tolist(), counts.tolist()))
+        return format_result(pd.Series(counts, index=genres), output)
+
+    def most_genres(self, n: int, output: str = None) -> dict:
         """
         Возвращает топ-n фильмов с наибольшим количеством жанров.
 
-        Для каждого фильма считает количество жанров и возвращает n фильмов
-        с наибольшим значением.
+        Количество жанров фильма — число единичных битов его маски жанров.
+        При равенстве раньше идет фильм из начала файла.
 
         Аргументы:
             n: int — количество фильмов в результате.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
 
         Возвращает:
             dict — словарь вида {название_фильма: количество_жанров}, отсортированный по убыванию.
         """
-        self.data["genre_count"] = self.data["genres"].apply(
-            lambda g: len(g.split("|")) if isinstance(g, str) else 0
-        )
-        top_n = (
-            self.data[["title", "genre_count"]]
-            .sort_values(by="genre_count", ascending=False)
-            .head(n)
+        counts = self.genres.movie_counts()
+        top = top_k(counts, n)
+        if resolve_format(output) == "dict":
+            return dict(zip(self.data["title"].iloc[top], counts[top].tolist()))
+        titles = self.data["title"].to_numpy()[top]
+        return format_result(pd.Series(counts[top], index=titles), output)
+
+    def genre_cooccurrence(self) -> pd.DataFrame:
+        """
+        Возвращает матрицу совместной встречаемости жанров.
+
+        Считается одним произведением матрицы «фильм x жанр» на себя.
+
+        Возвращает:
+            pd.DataFrame — на пересечении жанров a и b количество фильмов
+            с обоими жанрами, на диагонали — количество фильмов жанра.
+        """
+        return self.genres.cooccurrence()
+
+    def filter(
+        self, genres=None, years=None, match: str = "all", output: str = None
+    ) -> dict:
+        """
+        Возвращает фильмы с заданными жанрами и годами выпуска.
+
+        Фильтр считается масками по массивам каталога, например
+        filter(["Comedy"], (1990, 1999)) — комедии 1990–1999 годов.
+
+        Аргументы:
+            genres: список жанров или None.
+            years: кортеж (первый, последний) год включительно или None.
+            match: str, 'all' — у фильма есть все жанры, 'any' — хотя бы один.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
+
+        Возвращает:
+            dict — словарь вида {movieId: название}, в порядке файла.
+        """
+        selected = self.catalog.filter(genres, years, match)
+        result = pd.Series(
+            self.data["title"].to_numpy()[selected],
+            index=self.catalog.movie_ids[selected],
         )
-        return dict(zip(top_n["title"], top_n["genre_count"]))
+        return format_result(result, output)
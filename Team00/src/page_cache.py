@@ -0,0 +1,200 @@
+"""
+Модуль с дисковым кешем HTML страниц.
+
+Содержит класс PageCache: страницы хранятся в папке кеша сжатыми zlib,
+имя файла — хеш нормализованного URL. У записи есть время жизни (TTL),
+общий размер кеша ограничен, при превышении удаляются давно не читанные
+страницы (LRU). Счетчики попаданий и промахов показывают, сколько
+запросов к сети удалось избежать.
+"""
+
+import hashlib
+import os
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+HEADER = struct.Struct("<d")
+PAGE_SUFFIX = ".page"
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def normalize_url(url: str) -> str:
+    """
+    Приводит URL к каноническому виду для ключа кеша.
+
+    Схема и хост — в нижнем регистре, параметры запроса отсортированы,
+    фрагмент отброшен, пустой путь заменен на '/'.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, "")
+    )
+
+
+def page_key(url: str) -> str:
+    """
+    Возвращает ключ кеша — BLAKE2b хеш нормализованного URL.
+    """
+    digest = hashlib.blake2b(normalize_url(url).encode("utf-8"), digest_size=20)
+    return digest.hexdigest()
+
+
+class PageCache:
+    """
+    Дисковый кеш HTML страниц по URL.
+
+    Атрибуты:
+        directory: str, папка кеша.
+        ttl: float, время жизни страницы в секундах или None (бессрочно).
+        max_bytes: int, предельный общий размер файлов кеша.
+        level: int, уровень сжатия zlib.
+        hits, misses, evictions: int, счетчики попаданий, промахов
+            и удаленных по размеру или TTL страниц.
+
+    Методы:
+        get(url): Страница из кеша или None.
+        put(url, text): Сохраняет страницу.
+        clear(): Удаляет все страницы.
+        stats(): Счетчики и размер кеша.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        level: int = 6,
+    ):
+        """
+        Открывает кеш в папке directory, создавая ее при необходимости.
+
+        Аргументы:
+            directory: str, папка кеша.
+            ttl: float, время жизни страницы в секундах или None.
+            max_bytes: int, предельный общий размер файлов кеша.
+            level: int, уровень сжатия zlib от 1 до 9.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._entries = self._scan()
+        self._bytes = sum(self._entries.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + PAGE_SUFFIX)
+
+    def _scan(self) -> OrderedDict:
+        """
+        Читает размеры страниц в папке кеша в порядке последнего чтения.
+        """
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(PAGE_SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[: -len(PAGE_SUFFIX)], stat))
+        found.sort()
+        return OrderedDict((key, stat.st_size) for _, key, stat in found)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        self._bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def get(self, url: str) -> str:
+        """
+        Возвращает страницу из кеша.
+
+        Аргументы:
+            url: str, адрес страницы.
+
+        Возвращает:
+            str, текст страницы или None, если ее нет или истек TTL.
+        """
+        key = page_key(url)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            (stored_at,) = HEADER.unpack_from(data)
+            if self.ttl is not None and time.time() - stored_at >= self.ttl:
+                self._remove(key)
+                self.evictions += 1
+                raise LookupError(key)
+            text = zlib.decompress(data[HEADER.size :]).decode("utf-8")
+        except (OSError, LookupError, struct.error, zlib.error, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        # Время изменения файла — время последнего чтения для LRU.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._entries[key] = len(data)
+            self._bytes += len(data)
+        self.hits += 1
+        return text
+
+    def put(self, url: str, text: str):
+        """
+        Сохраняет страницу и удаляет старые, если превышен max_bytes.
+        Ошибки записи (например, папка только для чтения) игнорируются.
+
+        Аргументы:
+            url: str, адрес страницы.
+            text: str, текст страницы.
+        """
+        key = page_key(url)
+        data = HEADER.pack(time.time()) + zlib.compress(
+            text.encode("utf-8"), self.level
+        )
+        tmp_path = self._path(key) + ".tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+        self._bytes += len(data) - self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Удаляет все страницы кеша.
+        """
+        for key in list(self._entries):
+            self._remove(key)
+
+    def stats(self) -> dict:
+        """
+        Возвращает счетчики кеша.
+
+        Возвращает:
+            dict с ключами hits, misses, evictions, pages, bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "pages": len(self._entries),
+            "bytes": self._bytes,
+        }
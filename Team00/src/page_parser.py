@@ -0,0 +1,76 @@
+"""
+Модуль с быстрым разбором страниц IMDb.
+
+Отчеты Links читают со страницы лишь несколько узлов: заголовок h1,
+блоки title-pc-principal-credit, title-boxoffice-budget,
+title-boxoffice-cumulativeworldwidegross, span с длительностью и кнопку
+с числом фильмов режиссера. Функция parse_page строит дерево только
+из этих узлов (фильтр FactFilter, парсер lxml, если он установлен),
+а полное дерево html.parser строит, лишь если на странице нет h1.
+"""
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    FAST_PARSER = "html.parser"
+else:
+    FAST_PARSER = "lxml"
+
+FULL_PARSER = "html.parser"
+FACT_TEST_IDS = frozenset(
+    {
+        "title-pc-principal-credit",
+        "title-boxoffice-budget",
+        "title-boxoffice-cumulativeworldwidegross",
+    }
+)
+RUNTIME_CLASS = "sc-d7fcdef3-4 kjcuO"
+DIRECTOR_COUNT_ID = "name-filmography-filter-director"
+
+
+class FactFilter(ElementFilter):
+    """
+    Фильтр разбора, оставляющий только узлы, которые читают отчеты Links.
+
+    Узлы проверяются, пока они не вложены в уже принятый узел; потомки
+    принятого узла сохраняются целиком, текст вне принятых узлов
+    отбрасывается.
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if name == "h1":
+            return True
+        if name == "li":
+            return attrs.get("data-testid") in FACT_TEST_IDS
+        if name == "span":
+            return attrs.get("class") == RUNTIME_CLASS
+        if name == "button":
+            return attrs.get("id") == DIRECTOR_COUNT_ID
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+FACT_FILTER = FactFilter()
+
+
+def parse_page(html: str) -> BeautifulSoup:
+    """
+    Разбирает страницу IMDb, сохраняя только нужные отчетам узлы.
+
+    Аргументы:
+        html: str, текст страницы.
+
+    Возвращает:
+        BeautifulSoup: дерево из узлов FactFilter или, если на странице
+        нет заголовка h1 (не страница фильма или человека), полное дерево.
+    """
+    soup = BeautifulSoup(html, FAST_PARSER, parse_only=FACT_FILTER)
+    if soup.find("h1") is None:
+        return BeautifulSoup(html, FULL_PARSER)
+    return soup
@@ -0,0 +1,187 @@
+"""
+Модуль с гистограммами оценок по группам.
+
+Оценки MovieLens принимают только 10 значений (0.5, 1.0, ..., 5.0),
+поэтому для каждой группы (фильма или пользователя) достаточно хранить
+10 счетчиков. Из такой матрицы медиана, любые квантили, мода и дисперсия
+читаются за O(1) на группу без сортировки оценок.
+"""
+
+import numpy as np
+import pandas as pd
+from group_index import GroupIndex, find_positions
+
+NUM_BINS = 10
+BIN_VALUES = np.arange(1, NUM_BINS + 1) * 0.5
+
+
+class RatingHistogram:
+    """
+    Матрица количеств оценок размера (число групп x 10).
+
+    Атрибуты:
+        keys: отсортированный массив ключей групп.
+        counts: матрица int64, counts[i, j] — число оценок (j + 1) / 2 в группе i.
+
+    Методы:
+        from_index(index, codes): Строит матрицу по групповому индексу.
+        merge(other): Объединяет гистограммы двух частей данных.
+        update(other): Добавляет гистограммы новой части на месте.
+        positions(keys): Номера групп для переданных ключей.
+        take(positions): Гистограммы выбранных групп.
+        totals(): Количество оценок в каждой группе.
+        quantile(q): Квантили оценок по группам.
+        median(): Медианы оценок по группам.
+        mode(): Самая частая оценка в каждой группе.
+        mean(): Средняя оценка по группам.
+        var(): Выборочная дисперсия оценок по группам.
+        series(values): Оборачивает массив значений в Series с ключами групп.
+    """
+
+    def __init__(self, keys, counts):
+        """
+        Инициализирует гистограмму готовыми ключами и матрицей количеств.
+        """
+        self.keys = keys
+        self.counts = counts
+
+    @classmethod
+    def from_index(cls, index: GroupIndex, codes) -> "RatingHistogram":
+        """
+        Строит матрицу количеств одним bincount по строкам таблицы.
+
+        Аргументы:
+            index: GroupIndex по колонке movieId или userId.
+            codes: массив uint8 кодов полузвезд (1..10) в исходном порядке строк.
+
+        Возвращает:
+            RatingHistogram.
+        """
+        bins = np.asarray(codes)[index.order].astype(np.intp) - 1
+        flat = index.group_ids() * NUM_BINS + bins
+        counts = np.bincount(flat, minlength=len(index) * NUM_BINS)
+        return cls(index.keys, counts.reshape(len(index), NUM_BINS))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def merge(self, other: "RatingHistogram") -> "RatingHistogram":
+        """
+        Объединяет гистограммы двух частей данных сложением счетчиков.
+
+        Аргументы:
+            other: RatingHistogram другой части данных.
+
+        Возвращает:
+            RatingHistogram по объединению групп.
+        """
+        keys = np.union1d(self.keys, other.keys)
+        counts = np.zeros((len(keys), NUM_BINS), dtype=np.int64)
+        for part in (self, other):
+            counts[np.searchsorted(keys, part.keys)] += part.counts
+        return RatingHistogram(keys, counts)
+
+    def update(self, other: "RatingHistogram"):
+        """
+        Добавляет гистограммы новой части данных на месте.
+
+        Строки уже известных групп увеличиваются только в их позициях,
+        новые группы вставляются с сохранением порядка ключей.
+
+        Аргументы:
+            other: RatingHistogram новой части данных.
+        """
+        positions = self.positions(other.keys)
+        found = positions >= 0
+        self.counts[positions[found]] += other.counts[found]
+        if found.all():
+            return
+        new = ~found
+        at = np.searchsorted(self.keys, other.keys[new])
+        self.keys = np.insert(self.keys, at, other.keys[new])
+        self.counts = np.insert(self.counts, at, other.counts[new], axis=0)
+
+    def positions(self, keys) -> np.ndarray:
+        """
+        Возвращает номера групп для ключей, -1 для отсутствующих ключей.
+        """
+        return find_positions(self.keys, keys)
+
+    def take(self, positions) -> "RatingHistogram":
+        """
+        Возвращает гистограммы групп с номерами positions.
+        """
+        return RatingHistogram(self.keys[positions], self.counts[positions])
+
+    def totals(self) -> np.ndarray:
+        """
+        Возвращает количество оценок в каждой группе.
+        """
+        return self.counts.sum(axis=1)
+
+    def _order_statistic(self, ranks) -> np.ndarray:
+        """
+        Возвращает оценку с номером ranks (с нуля) в отсортированной группе.
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        bins = (cumulative <= ranks[:, None]).sum(axis=1)
+        return BIN_VALUES[np.minimum(bins, NUM_BINS - 1)]
+
+    def quantile(self, q) -> np.ndarray:
+        """
+        Возвращает квантиль q оценок по группам.
+
+        Используется линейная интерполяция между соседними порядковыми
+        статистиками, как в pandas и NumPy по умолчанию.
+
+        Аргументы:
+            q: float от 0 до 1.
+
+        Возвращает:
+            np.ndarray float64 длины len(keys), NaN для пустых групп.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        totals = self.totals()
+        position = np.maximum(totals - 1, 0) * q
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        low_value = self._order_statistic(low)
+        high_value = self._order_statistic(high)
+        result = low_value + (high_value - low_value) * (position - low)
+        return np.where(totals > 0, result, np.nan)
+
+    def median(self) -> np.ndarray:
+        """
+        Возвращает медиану оценок по группам.
+        """
+        return self.quantile(0.5)
+
+    def mode(self) -> np.ndarray:
+        """
+        Возвращает самую частую оценку в группе (при равенстве — меньшую).
+        """
+        return BIN_VALUES[np.argmax(self.counts, axis=1)]
+
+    def mean(self) -> np.ndarray:
+        """
+        Возвращает среднюю оценку по группам.
+        """
+        return (self.counts @ BIN_VALUES) / self.totals()
+
+    def var(self) -> np.ndarray:
+        """
+        Возвращает выборочную дисперсию (ddof=1), NaN для групп из одной оценки.
+        """
+        totals = self.totals().astype(np.float64)
+        sums = self.counts @ BIN_VALUES
+        sums_of_squares = self.counts @ (BIN_VALUES * BIN_VALUES)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (totals * sums_of_squares - sums * sums) / (totals * (totals - 1))
+        return np.where(totals > 1, var, np.nan)
+
+    def series(self, values) -> pd.Series:
+        """
+        Оборачивает массив значений по группам в Series с ключами групп.
+        """
+        return pd.Series(values, index=self.keys)
@@ -6,10 +6,150 @@
 
 Предоставляет методы для анализа распределений по годам, оценкам,
 поиска самых популярных, противоречивых фильмов и пользователей.
+Формат результатов (dict по умолчанию, pd.Series, массивы NumPy, Arrow)
+задается через result_format.set_result_format или аргумент output.
 """
 
 import pandas as pd
+from concurrent.futures import Executor
 from datetime import datetime
+from ratings_parallel import parallel_summary
+from ratings_store import RatingsStore
+from ratings_stream import DEFAULT_MEMORY_BUDGET, RatingsSummary
+from result_format import format_result
+from sidecar import cached_arrays, cached_object
+
+
+def _frame_columns(df: pd.DataFrame) -> dict:
+    """
+    Возвращает колонки DataFrame в виде словаря массивов NumPy.
+    """
+    return {name: column.to_numpy() for name, column in df.items()}
+
+
+def _group_scores(store: RatingsStore, key: str, metric: str, keys=None) -> tuple:
+    """
+    Возвращает значения метрики лидерборда по группам колонки key.
+
+    Аргументы:
+        store: RatingsStore или RatingsSummary с данными оценок.
+        key: str, movieId или userId.
+        metric: str, 'count', 'average', 'median' или 'variance'.
+        keys: отсортированный массив ключей групп или None для всех групп.
+
+    Возвращает:
+        tuple (ключи, значения, tiebreak): по количеству оценок при равенстве
+        раньше идет группа, встретившаяся в данных первой, иначе меньший ключ;
+        средние, медианы и дисперсии округлены до 2 знаков.
+    """
+    if metric == "median" and not store.half_stars:
+        median = _float_quantile(store, key, 0.5)
+        if keys is not None:
+            median = median.reindex(keys)
+        return median.index.to_numpy(), median.to_numpy().round(2), None
+    if metric == "median":
+        groups = store.rating_histogram(key)
+    else:
+        groups = store.group_stats(key)
+    if keys is not None:
+        groups = groups.take(groups.positions(keys))
+    if metric == "count":
+        return groups.keys, groups.counts, groups.first_rows
+    if metric == "average":
+        values = groups.mean()
+    elif metric == "median":
+        values = groups.median()
+    elif metric == "variance":
+        values = groups.var()
+    else:
+        raise ValueError("Invalid metric. Use 'average' or 'median'.")
+    return groups.keys, values.round(2), None
+
+
+def _leaderboard(store: RatingsStore, key: str, metric: str, n: int) -> pd.Series:
+    """
+    Возвращает top-n групп колонки key по метрике из кеша лидербордов.
+
+    Лидерборд считается частичным выбором top_k один раз, а после
+    Ratings.append обновляется только по изменившимся группам.
+
+    Аргументы:
+        store: RatingsStore или RatingsSummary с данными оценок.
+        key: str, movieId или userId.
+        metric: str, метрика для _group_scores.
+        n: int, количество групп для возврата.
+
+    Возвращает:
+        pd.Series: {ключ группы: значение}, сортировка по убыванию,
+        NaN пропускаются.
+    """
+    board = store.leaderboard(
+        metric, key, n, lambda keys: _group_scores(store, key, metric, keys)
+    )
+    return board.series()
+
+
+def _float_quantile(store: RatingsStore, key: str, q: float) -> pd.Series:
+    """
+    Возвращает квантиль q оценок по группам колонки key без гистограмм.
+
+    Используется, когда оценки DataFrame не кратны 0.5 и не помещаются
+    в коды полузвезд RatingHistogram.
+
+    Возвращает:
+        pd.Series: {ключ группы: квантиль}, отсортировано по ключу.
+    """
+    result = pd.Series(store.ratings).groupby(store.column(key)).quantile(q)
+    result.index.name = None
+    return result
+
+
+def _rating_metric(store: RatingsStore, key: str, metric: str) -> pd.Series:
+    """
+    Возвращает среднюю или медианную оценку по группам колонки key.
+
+    Аргументы:
+        store: RatingsStore с данными оценок.
+        key: str, movieId или userId.
+        metric: str, 'average' или 'median'.
+
+    Возвращает:
+        pd.Series: {ключ группы: значение метрики}, отсортировано по ключу.
+    """
+    stats = store.group_stats(key)
+    if metric == "average":
+        return stats.series(stats.mean())
+    if metric == "median" and not store.half_stars:
+        return _float_quantile(store, key, 0.5)
+    if metric == "median":
+        histogram = store.rating_histogram(key)
+        return histogram.series(histogram.median())
+    raise ValueError("Invalid metric. Use 'average' or 'median'.")
+
+
+def _rating_quantile(store: RatingsStore, key: str, q: float, ids) -> pd.Series:
+    """
+    Возвращает квантиль q оценок по группам колонки key.
+
+    Аргументы:
+        store: RatingsStore с данными оценок.
+        key: str, movieId или userId.
+        q: float от 0 до 1.
+        ids: список ключей групп или None для всех групп.
+
+    Возвращает:
+        pd.Series: {ключ группы: квантиль}, отсортировано по ключу.
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("Quantile must be between 0 and 1.")
+    if store.half_stars:
+        histogram = store.rating_histogram(key)
+        result = histogram.series(histogram.quantile(q))
+    else:
+        result = _float_quantile(store, key, q)
+    if ids is not None:
+        result = result[result.index.isin(ids)]
+    return result
 
 
 class Ratings:
@@ -18,22 +158,90 @@ class Ratings:
 
     Атрибуты:
         path: путь к файлу ratings.csv
-        data: DataFrame с данными из файла
+        data: DataFrame с данными из файла, RatingsStore в компактном режиме
+            или RatingsSummary в потоковом режиме
+
+    Методы:
+        append(batch): Дописывает новые оценки с обновлением агрегатов.
 
     Вложенные классы:
         Movies: Методы анализа по фильмам
         Users: Методы анализа по пользователям
     """
 
-    def __init__(self, path_to_the_file: str):
+    def __init__(
+        self,
+        path_to_the_file: str,
+        compact: bool = False,
+        streaming: bool = False,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        cache: bool = True,
+        executor: Executor = None,
+        shards: int = None,
+    ):
         """
         Инициализирует класс Ratings с путем к файлу ratings.csv.
 
         Атрибуты:
             path_to_the_file: str, путь к CSV файлу.
+            compact: bool, хранить данные в компактном колоночном RatingsStore
+                (int32 id, uint8 коды оценок) вместо DataFrame.
+            streaming: bool, читать файл частями и хранить только агрегаты
+                RatingsSummary, для файлов больше оперативной памяти.
+            memory_budget: int, бюджет памяти на одну часть файла в байтах
+                для потокового режима.
+            cache: bool, сохранять разобранный файл в бинарный кеш рядом с CSV
+                и загружать из него при следующих запусках.
+            executor: concurrent.futures.Executor для подсчета агрегатов
+                по шардам movieId (например, ProcessPoolExecutor); данные
+                при этом хранятся в RatingsStore.
+            shards: int, количество шардов; по умолчанию число процессоров.
         """
         self.path = path_to_the_file
-        self.data = pd.read_csv(path_to_the_file)
+        if streaming:
+            self.data = cached_object(
+                path_to_the_file,
+                "summary",
+                lambda: RatingsSummary.from_csv(path_to_the_file, memory_budget),
+                cache,
+            )
+        elif compact or executor is not None:
+            self.data = RatingsStore.load(path_to_the_file, cache)
+            if executor is not None:
+                self.data.use_aggregates(
+                    parallel_summary(self.data, executor, shards)
+                )
+        else:
+            columns = cached_arrays(
+                path_to_the_file,
+                "frame",
+                lambda: _frame_columns(pd.read_csv(path_to_the_file)),
+                cache,
+            )
+            self.data = pd.DataFrame(columns)
+
+    def append(self, batch):
+        """
+        Дописывает новые оценки без повторного чтения ratings.csv.
+
+        В компактном и потоковом режимах агрегаты по фильмам и пользователям
+        (количества, средние и дисперсии, гистограммы для медиан),
+        распределения по годам и рейтингам и лидерборды обновляются только
+        по группам из порции. DataFrame дополняется строками порции, агрегаты
+        по нему считаются заново в Movies и Users.
+
+        Аргументы:
+            batch: DataFrame или dict массивов с колонками userId, movieId,
+                rating, timestamp, либо двумерный массив с колонками в этом
+                порядке.
+        """
+        part = RatingsStore.from_batch(batch)
+        if isinstance(self.data, pd.DataFrame):
+            frame = part.to_frame()
+            frame = frame.astype(self.data.dtypes[frame.columns].to_dict())
+            self.data = pd.concat([self.data, frame], ignore_index=True)
+        else:
+            self.data.append(part)
 
     class Movies:
         """
@@ -41,10 +249,13 @@ class Ratings:
 
         Методы:
             dist_by_year(): Распределение количества оценок по годам.
+            dist_by(granularity): Распределение количества оценок по году,
+                месяцу, ISO-неделе, дню или часу.
             dist_by_rating(): Распределение количества оценок по рейтингу.
             top_by_num_of_ratings(n): Топ-n фильмов по числу оценок.
             top_by_ratings(n, metric): Топ-n фильмов по среднему или медианному рейтингу.
             top_controversial(n): Топ-n самых противоречивых фильмов (по дисперсии).
+            rating_quantile(q, movie_ids): Квантиль оценок по фильмам.
         """
 
         def __init__(self, ratings_df: pd.DataFrame):
@@ -52,76 +263,120 @@ class Ratings:
             Инициализирует вложенный класс Movies с переданным DataFrame.
 
             Аргументы:
-                ratings_df: DataFrame с колонками userId, movieId, rating, timestamp.
+                ratings_df: DataFrame с колонками userId, movieId, rating, timestamp,
+                    RatingsStore или RatingsSummary.
             """
             self.data = ratings_df
+            self._store = RatingsStore.wrap(ratings_df)
 
-        def dist_by_year(self) -> dict:
+        def dist_by_year(self, output: str = None) -> dict:
             """
             Возвращает распределение оценок по годам на основе timestamp.
 
+            Аргументы:
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
             Возвращает:
                 dict: {год: количество оценок}, отсортировано по возрастанию года.
             """
-            self.data["year"] = pd.to_datetime(self.data["timestamp"], unit="s").dt.year
-            return dict(self.data["year"].value_counts().sort_index())
+            return format_result(self._store.year_counts(), output)
 
-        def dist_by_rating(self) -> dict:
+        def dist_by(self, granularity: str = "year", output: str = None) -> dict:
+            """
+            Возвращает распределение оценок по временным бакетам timestamp (UTC).
+
+            Аргументы:
+                granularity: str, 'year', 'month', 'week' (ISO-неделя),
+                    'day' или 'hour'.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
+            Возвращает:
+                dict: {подпись бакета: количество оценок}, по возрастанию времени;
+                подписи — год (int) или строки '2000-01', '2000-W05',
+                '2000-01-31', '2000-01-31 13:00'.
+            """
+            return format_result(self._store.time_distribution(granularity), output)
+
+        def dist_by_rating(self, output: str = None) -> dict:
             """
             Возвращает распределение оценок по значениям рейтингов.
 
+            Аргументы:
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
             Возвращает:
                 dict: {рейтинг: количество}, отсортировано по возрастанию рейтинга.
             """
-            return dict(self.data["rating"].value_counts().sort_index())
+            return format_result(self._store.rating_counts(), output)
 
-        def top_by_num_of_ratings(self, n: int) -> dict:
+        def top_by_num_of_ratings(self, n: int, output: str = None) -> dict:
             """
             Возвращает top-n фильмов по количеству оценок.
 
             Аргументы:
                 n: int, количество фильмов для возврата.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {movieId: число оценок}, сортировка по убыванию.
             """
-            result = self.data["movieId"].value_counts().head(n)
-            return dict(result)
+            result = _leaderboard(self._store, "movieId", "count", n)
+            return format_result(result, output)
 
-        def top_by_ratings(self, n: int, metric: str = "average") -> dict:
+        def top_by_ratings(
+            self, n: int, metric: str = "average", output: str = None
+        ) -> dict:
             """
             Возвращает top-n фильмов по среднему или медианному рейтингу.
 
             Аргументы:
                 n: int, количество фильмов для возврата.
                 metric: str, 'average' или 'median'.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {movieId: значение метрики}, сортировка по убыванию.
             """
-            grouped = self.data.groupby("movieId")["rating"]
-            if metric == "average":
-                agg = grouped.mean()
-            elif metric == "median":
-                agg = grouped.median()
-            else:
-                raise ValueError("Invalid metric. Use 'average' or 'median'.")
-            agg = agg.round(2).sort_values(ascending=False).head(n)
-            return dict(agg)
+            result = _leaderboard(self._store, "movieId", metric, n)
+            return format_result(result, output)
 
-        def top_controversial(self, n: int) -> dict:
+        def top_controversial(self, n: int, output: str = None) -> dict:
             """
             Возвращает top-n фильмов по дисперсии оценок.
 
             Аргументы:
                 n: int, количество фильмов для возврата.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {movieId: дисперсия}, отсортировано по убыванию.
             """
-            var = self.data.groupby("movieId")["rating"].var().round(2)
-            var = var.dropna().sort_values(ascending=False).head(n)
-            return dict(var)
+            result = _leaderboard(self._store, "movieId", "variance", n)
+            return format_result(result, output)
+
+        def rating_quantile(
+            self, q: float, movie_ids: list = None, output: str = None
+        ) -> dict:
+            """
+            Возвращает квантиль q оценок для каждого фильма.
+
+            Аргументы:
+                q: float от 0 до 1, например 0.5 для медианы.
+                movie_ids: list, фильмы для возврата; по умолчанию все.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
+            Возвращает:
+                dict: {movieId: квантиль}, отсортировано по movieId.
+            """
+            result = _rating_quantile(self._store, "movieId", q, movie_ids)
+            return format_result(result, output)
 
     class Users:
         """
@@ -131,6 +386,7 @@ class Ratings:
             dist_by_num_of_ratings(): Распределение пользователей по числу оценок.
             dist_by_rating(metric): Распределение пользователей по среднему или медианному рейтингу.
             top_controversial(n): Топ-n пользователей по дисперсии оценок.
+            rating_quantile(q, user_ids): Квантиль оценок по пользователям.
         """
 
         def __init__(self, ratings_df: pd.DataFrame):
@@ -138,61 +394,85 @@ class Ratings:
             Инициализирует вложенный класс Users с переданным DataFrame.
 
             Аргументы:
-                ratings_df: DataFrame с колонками userId, movieId, rating, timestamp.
+                ratings_df: DataFrame с колонками userId, movieId, rating, timestamp,
+                    RatingsStore или RatingsSummary.
             """
             self.data = ratings_df
+            self._store = RatingsStore.wrap(ratings_df)
 
-        def dist_by_num_of_ratings(self) -> dict:
+        def dist_by_num_of_ratings(self, output: str = None) -> dict:
             """
             Возвращает распределение пользователей по количеству оценок.
 
+            Аргументы:
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
             Возвращает:
                 dict: {userId: количество оценок}, отсортировано по userId.
             """
-            return dict(self.data["userId"].value_counts().sort_index())
+            stats = self._store.group_stats("userId")
+            return format_result(stats.series(stats.counts), output)
 
-        def dist_by_rating(self, metric: str = "average") -> dict:
+        def dist_by_rating(self, metric: str = "average", output: str = None) -> dict:
             """
             Возвращает распределение пользователей по средней или медианной оценке.
 
             Аргументы:
                 metric: str, 'average' или 'median'.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {userId: значение метрики}, отсортировано по userId.
             """
-            grouped = self.data.groupby("userId")["rating"]
-            if metric == "average":
-                agg = grouped.mean()
-            elif metric == "median":
-                agg = grouped.median()
-            else:
-                raise ValueError("Invalid metric. Use 'average' or 'median'.")
-            return dict(agg.round(2).sort_index())
+            agg = _rating_metric(self._store, "userId", metric)
+            return format_result(agg.round(2).sort_index(), output)
 
-        def top_controversial(self, n: int) -> dict:
+        def top_controversial(self, n: int, output: str = None) -> dict:
             """
             Возвращает top-n пользователей по дисперсии оценок.
 
             Аргументы:
                 n: int, количество пользователей для возврата.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {userId: дисперсия}, отсортировано по убыванию дисперсии.
             """
-            var = self.data.groupby("userId")["rating"].var().round(2)
-            var = var.dropna().sort_values(ascending=False).head(n)
-            return dict(var)
+            result = _leaderboard(self._store, "userId", "variance", n)
+            return format_result(result, output)
+
+        def rating_quantile(
+            self, q: float, user_ids: list = None, output: str = None
+        ) -> dict:
+            """
+            Возвращает квантиль q оценок для каждого пользователя.
+
+            Аргументы:
+                q: float от 0 до 1, например 0.9 для 90-го перцентиля.
+                user_ids: list, пользователи для возврата; по умолчанию все.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
+
+            Возвращает:
+                dict: {userId: квантиль}, отсортировано по userId.
+            """
+            result = _rating_quantile(self._store, "userId", q, user_ids)
+            return format_result(result, output)
 
-        def most_active_users(self, n: int) -> dict:
+        def most_active_users(self, n: int, output: str = None) -> dict:
             """
             Возвращает top-n пользователей по кол-ву оценок
 
             Аргументы:
                 n: int, количество пользователей для возврата.
+                output: str, формат результата (dict, series, numpy, arrow);
+                    по умолчанию — заданный через set_result_format.
 
             Возвращает:
                 dict: {userId: кол-во оценок}
             """
-            count = self.data["userId"].value_counts().head(n)
-            return dict(count)
+            result = _leaderboard(self._store, "userId", "count", n)
+            return format_result(result, output)
@@ -0,0 +1,76 @@
+"""
+Модуль для параллельного подсчета агрегатов оценок на нескольких процессах.
+
+Строки RatingsStore делятся на шарды по хешу movieId, каждый процесс
+считает RatingsSummary своего шарда (количества, суммы, суммы квадратов,
+гистограммы оценок), а координатор сливает частичные агрегаты.
+Агрегаты по фильмам у шардов не пересекаются, агрегаты по пользователям
+складываются при слиянии.
+"""
+
+import os
+from concurrent.futures import Executor
+
+import numpy as np
+from ratings_store import RatingsStore
+from ratings_stream import RatingsSummary
+
+
+def shard_rows(keys, shards: int) -> list:
+    """
+    Делит номера строк на шарды по хешу ключа (остаток от деления).
+
+    Аргументы:
+        keys: массив ключей (movieId или userId), по одному на строку.
+        shards: int, количество шардов.
+
+    Возвращает:
+        list массивов номеров строк, по одному на шард, в порядке строк.
+    """
+    if shards <= 0:
+        raise ValueError("Number of shards must be positive.")
+    shard_ids = np.asarray(keys, dtype=np.int64) % shards
+    order = np.argsort(shard_ids, kind="stable")
+    bounds = np.cumsum(np.bincount(shard_ids, minlength=shards))[:-1]
+    return np.split(order, bounds)
+
+
+def _summarize_shard(user_ids, movie_ids, ratings, timestamps, rows):
+    """
+    Считает агрегаты одного шарда; выполняется в процессе пула.
+    """
+    store = RatingsStore(user_ids, movie_ids, ratings, timestamps)
+    return RatingsSummary.from_store(store, rows=rows)
+
+
+def parallel_summary(
+    store: RatingsStore, executor: Executor, shards: int = None
+) -> RatingsSummary:
+    """
+    Считает агрегаты хранилища по шардам в пуле executor и сливает их.
+
+    Аргументы:
+        store: RatingsStore с оценками.
+        executor: concurrent.futures.Executor, например ProcessPoolExecutor.
+        shards: int, количество шардов; по умолчанию число процессоров.
+
+    Возвращает:
+        RatingsSummary по всем строкам хранилища.
+    """
+    shards = shards or os.cpu_count() or 1
+    columns = store.to_arrays()
+    futures = [
+        executor.submit(
+            _summarize_shard,
+            columns["userId"][rows],
+            columns["movieId"][rows],
+            columns["rating"][rows],
+            columns["timestamp"][rows],
+            rows,
+        )
+        for rows in shard_rows(store.movie_ids, shards)
+    ]
+    summary = RatingsSummary.empty()
+    for future in futures:
+        summary = summary.merge(future.result())
+    return summary
@@ -0,0 +1,472 @@
+"""
+Модуль с колоночным хранилищем оценок из датасета MovieLens.
+
+Содержит класс RatingsStore, который держит колонки ratings.csv
+в непрерывных массивах NumPy. В компактном режиме идентификаторы
+хранятся как int32, оценки как uint8 коды полузвезд (0.5 -> 1, 5.0 -> 10),
+а timestamp как int32 (или int64, если значения не помещаются в int32).
+"""
+
+import numpy as np
+import pandas as pd
+from aggregates import RatingAggregates
+from group_index import GroupIndex
+from group_stats import GroupStats
+from rating_histogram import RatingHistogram
+from sidecar import cached_arrays
+from time_buckets import TimeBuckets
+
+COLUMNS = ("userId", "movieId", "rating", "timestamp")
+CHUNK_SIZE = 1_000_000
+NUM_RATING_CODES = 10
+
+
+def fits_half_stars(ratings) -> bool:
+    """
+    Проверяет, что все оценки кратны 0.5 и лежат в диапазоне [0.5, 5.0].
+
+    Аргументы:
+        ratings: массив оценок.
+
+    Возвращает:
+        bool: True, если оценки представимы uint8 кодами полузвезд.
+    """
+    values = np.asarray(ratings, dtype=np.float64) * 2
+    codes = np.rint(values)
+    return not len(codes) or bool(
+        np.array_equal(codes, values)
+        and codes.min() >= 1
+        and codes.max() <= NUM_RATING_CODES
+    )
+
+
+def encode_ratings(ratings) -> np.ndarray:
+    """
+    Переводит оценки в uint8 коды полузвезд.
+
+    Аргументы:
+        ratings: массив оценок, кратных 0.5, в диапазоне [0.5, 5.0].
+
+    Возвращает:
+        np.ndarray: массив uint8 со значениями от 1 до 10.
+    """
+    if not fits_half_stars(ratings):
+        raise ValueError("Ratings must be multiples of 0.5 between 0.5 and 5.0.")
+    return np.rint(np.asarray(ratings, dtype=np.float64) * 2).astype(np.uint8)
+
+
+def decode_ratings(codes) -> np.ndarray:
+    """
+    Переводит uint8 коды полузвезд обратно в оценки float64.
+
+    Аргументы:
+        codes: массив кодов от 1 до 10.
+
+    Возвращает:
+        np.ndarray: массив оценок float64.
+    """
+    return np.asarray(codes, dtype=np.float64) * 0.5
+
+
+def narrow_timestamps(timestamps) -> np.ndarray:
+    """
+    Возвращает timestamp как int32, если значения помещаются, иначе как int64.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    info = np.iinfo(np.int32)
+    if len(timestamps) and (
+        timestamps.min() >= info.min and timestamps.max() <= info.max
+    ):
+        return timestamps.astype(np.int32)
+    return timestamps
+
+
+class RatingsStore(RatingAggregates):
+    """
+    Колоночное хранилище оценок на массивах NumPy.
+
+    Атрибуты:
+        user_ids: массив userId.
+        movie_ids: массив movieId.
+        timestamps: массив timestamp в секундах.
+        compact: bool, хранятся ли оценки в виде uint8 кодов.
+        half_stars: bool, кратны ли все оценки 0.5 (только для таких
+            оценок строятся гистограммы rating_histogram).
+
+    Методы:
+        from_frame(df, compact): Строит хранилище из DataFrame.
+        from_batch(batch): Строит компактное хранилище из порции оценок.
+        from_csv(path, chunksize): Читает ratings.csv в компактное хранилище.
+        load(path, cache): Загружает хранилище из бинарного кеша или из CSV.
+        column(name): Возвращает колонку по имени из ratings.csv.
+        to_frame(): Собирает DataFrame с исходными колонками.
+        year_counts(): Количество оценок по годам.
+        time_counts(granularity): Количество оценок по временным бакетам.
+        time_buckets(): Номера временных бакетов строк.
+        rating_counts(): Количество оценок по значениям рейтинга.
+        group_index(key): Групповой индекс по movieId или userId.
+        group_stats(key): Агрегаты оценок по movieId или userId.
+        rating_histogram(key): Гистограммы оценок по movieId или userId.
+        use_aggregates(source): Берет готовые агрегаты из другого источника.
+        append(batch): Дописывает порцию оценок с обновлением агрегатов.
+
+    Индексы и агрегаты строятся один раз и кешируются в хранилище, поэтому
+    колонки менять нельзя; новые оценки добавляются только через append.
+    """
+
+    def __init__(self, user_ids, movie_ids, ratings, timestamps):
+        """
+        Инициализирует хранилище готовыми массивами.
+
+        Аргументы:
+            user_ids: массив userId.
+            movie_ids: массив movieId.
+            ratings: массив uint8 кодов полузвезд или массив оценок float.
+            timestamps: массив timestamp в секундах.
+        """
+        super().__init__()
+        self._columns = {
+            "userId": np.asarray(user_ids),
+            "movieId": np.asarray(movie_ids),
+            "rating": np.asarray(ratings),
+            "timestamp": np.asarray(timestamps),
+        }
+        self._pending = []
+        self._rows = len(self._columns["userId"])
+        self.compact = self._columns["rating"].dtype == np.uint8
+        if any(len(array) != self._rows for array in self._columns.values()):
+            raise ValueError("All rating columns must have the same length.")
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, compact: bool = False) -> "RatingsStore":
+        """
+        Строит хранилище из DataFrame с колонками ratings.csv.
+
+        Аргументы:
+            df: DataFrame с колонками userId, movieId, rating, timestamp.
+            compact: bool, сузить типы колонок. Без него массивы берутся
+                из DataFrame без копирования.
+
+        Возвращает:
+            RatingsStore.
+        """
+        if not compact:
+            return cls(
+                df["userId"].to_numpy(),
+                df["movieId"].to_numpy(),
+                df["rating"].to_numpy(),
+                df["timestamp"].to_numpy(),
+            )
+        return cls(
+            df["userId"].to_numpy(dtype=np.int32),
+            df["movieId"].to_numpy(dtype=np.int32),
+            encode_ratings(df["rating"].to_numpy()),
+            narrow_timestamps(df["timestamp"].to_numpy()),
+        )
+
+    @classmethod
+    def from_batch(cls, batch) -> "RatingsStore":
+        """
+        Строит компактное хранилище из порции новых оценок.
+
+        Аргументы:
+            batch: DataFrame или dict массивов с колонками ratings.csv,
+                двумерный массив с колонками в порядке COLUMNS или RatingsStore.
+
+        Возвращает:
+            RatingsStore.
+        """
+        if isinstance(batch, RatingsStore):
+            return batch
+        if isinstance(batch, dict):
+            batch = pd.DataFrame(batch)
+        elif not isinstance(batch, pd.DataFrame):
+            batch = pd.DataFrame(np.asarray(batch), columns=list(COLUMNS))
+        return cls.from_frame(batch, compact=True)
+
+    @classmethod
+    def from_csv(cls, path: str, chunksize: int = CHUNK_SIZE) -> "RatingsStore":
+        """
+        Читает ratings.csv по частям в компактное хранилище.
+
+        Пиковая память ограничена итоговыми массивами и одной частью файла.
+
+        Аргументы:
+            path: str, путь к ratings.csv.
+            chunksize: int, количество строк в одной части.
+
+        Возвращает:
+            RatingsStore в компактном режиме.
+        """
+        parts = {name: [] for name in COLUMNS}
+        reader = pd.read_csv(
+            path,
+            usecols=list(COLUMNS),
+            dtype={
+                "userId": np.int32,
+                "movieId": np.int32,
+                "rating": np.float32,
+                "timestamp": np.int64,
+            },
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            parts["userId"].append(chunk["userId"].to_numpy())
+            parts["movieId"].append(chunk["movieId"].to_numpy())
+            parts["rating"].append(encode_ratings(chunk["rating"].to_numpy()))
+            parts["timestamp"].append(chunk["timestamp"].to_numpy())
+
+        empty = {
+            "userId": np.int32,
+            "movieId": np.int32,
+            "rating": np.uint8,
+            "timestamp": np.int64,
+        }
+        columns = {
+            name: np.concatenate(arrays) if arrays else np.empty(0, empty[name])
+            for name, arrays in parts.items()
+        }
+        return cls(
+            columns["userId"],
+            columns["movieId"],
+            columns["rating"],
+            narrow_timestamps(columns["timestamp"]),
+        )
+
+    @classmethod
+    def load(cls, path: str, cache: bool = True) -> "RatingsStore":
+        """
+        Загружает компактное хранилище из бинарного кеша рядом с CSV.
+
+        При первом запуске ratings.csv разбирается через from_csv, и колонки
+        сохраняются в .npy; дальше они открываются через memory mapping.
+
+        Аргументы:
+            path: str, путь к ratings.csv.
+            cache: bool, использовать ли бинарный кеш.
+
+        Возвращает:
+            RatingsStore в компактном режиме.
+        """
+        arrays = cached_arrays(
+            path, "store", lambda: cls.from_csv(path).to_arrays(), cache
+        )
+        return cls(
+            arrays["userId"], arrays["movieId"], arrays["rating"], arrays["timestamp"]
+        )
+
+    def to_arrays(self) -> dict:
+        """
+        Возвращает колонки хранилища в исходном представлении.
+
+        Возвращает:
+            dict {userId, movieId, rating, timestamp: np.ndarray}; rating —
+            uint8 коды в компактном режиме.
+        """
+        self._consolidate()
+        return dict(self._columns)
+
+    @classmethod
+    def wrap(cls, data) -> "RatingsStore":
+        """
+        Возвращает хранилище для DataFrame, остальные источники агрегатов
+        (RatingsStore, RatingsSummary) возвращает без изменений.
+        """
+        if isinstance(data, pd.DataFrame):
+            return cls.from_frame(data)
+        return data
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _consolidate(self):
+        """
+        Склеивает дописанные порции с основными колонками.
+        """
+        if not self._pending:
+            return
+        self._columns = {
+            name: np.concatenate(
+                [self._columns[name]] + [part[name] for part in self._pending]
+            )
+            for name in COLUMNS
+        }
+        self._pending = []
+
+    @property
+    def user_ids(self) -> np.ndarray:
+        """
+        Массив userId.
+        """
+        self._consolidate()
+        return self._columns["userId"]
+
+    @property
+    def movie_ids(self) -> np.ndarray:
+        """
+        Массив movieId.
+        """
+        self._consolidate()
+        return self._columns["movieId"]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        Массив timestamp в секундах.
+        """
+        self._consolidate()
+        return self._columns["timestamp"]
+
+    @property
+    def _ratings(self) -> np.ndarray:
+        self._consolidate()
+        return self._columns["rating"]
+
+    @property
+    def ratings(self) -> np.ndarray:
+        """
+        Оценки в виде float64, как в исходном ratings.csv.
+        """
+        if self.compact:
+            return decode_ratings(self._ratings)
+        return self._ratings
+
+    @property
+    def rating_codes(self) -> np.ndarray:
+        """
+        Оценки в виде uint8 кодов полузвезд.
+        """
+        if self.compact:
+            return self._ratings
+        return encode_ratings(self._ratings)
+
+    @property
+    def half_stars(self) -> bool:
+        """
+        Представимы ли все оценки uint8 кодами полузвезд.
+
+        В компактном режиме всегда True; DataFrame с произвольными
+        оценками float хранится как есть, и тогда False.
+        """
+        if self.compact:
+            return True
+        return self._cached(
+            "half_stars", "rating", lambda: fits_half_stars(self._ratings)
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Объем памяти, занятый колонками хранилища, в байтах.
+        """
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Возвращает колонку по имени из ratings.csv.
+
+        Аргументы:
+            name: str, одно из userId, movieId, rating, timestamp.
+
+        Возвращает:
+            np.ndarray с данными колонки.
+        """
+        if name == "userId":
+            return self.user_ids
+        if name == "movieId":
+            return self.movie_ids
+        if name == "rating":
+            return self.ratings
+        if name == "timestamp":
+            return self.timestamps
+        raise KeyError(f"Unknown ratings column: {name}")
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Собирает DataFrame с колонками userId, movieId, rating, timestamp.
+        """
+        return pd.DataFrame({name: self.column(name) for name in COLUMNS})
+
+    def time_buckets(self) -> TimeBuckets:
+        """
+        Возвращает номера временных бакетов строк, посчитанные один раз.
+        """
+        return self._cached(
+            "buckets", "timestamp", lambda: TimeBuckets(self.timestamps)
+        )
+
+    def _bucket_counts(self, granularity: str) -> pd.Series:
+        return self.time_buckets().counts(granularity)
+
+    def rating_counts(self) -> pd.Series:
+        """
+        Возвращает количество оценок по значениям рейтинга, отсортировано по рейтингу.
+        """
+        return self._cached(
+            "ratings",
+            "rating",
+            lambda: pd.Series(self.ratings).value_counts().sort_index(),
+        )
+
+    def group_index(self, key: str) -> GroupIndex:
+        """
+        Возвращает групповой индекс по колонке key (movieId или userId).
+        """
+        return self._cached("index", key, lambda: GroupIndex(self.column(key)))
+
+    def group_stats(self, key: str) -> GroupStats:
+        """
+        Возвращает агрегаты оценок по колонке key (movieId или userId).
+        """
+        return self._cached(
+            "stats",
+            key,
+            lambda: GroupStats.from_index(self.group_index(key), self.ratings),
+        )
+
+    def rating_histogram(self, key: str) -> RatingHistogram:
+        """
+        Возвращает матрицу количеств оценок по колонке key (movieId или userId).
+        """
+        return self._cached(
+            "histogram",
+            key,
+            lambda: RatingHistogram.from_index(
+                self.group_index(key), self.rating_codes
+            ),
+        )
+
+    def use_aggregates(self, source):
+        """
+        Кладет в кеш хранилища агрегаты, посчитанные вне его.
+
+        Используется, когда агрегаты посчитаны параллельно по шардам:
+        дальнейшие запросы берут их из кеша без повторного построения.
+
+        Аргументы:
+            source: RatingsSummary (или другой источник агрегатов) по тем же строкам.
+        """
+        self._cache = {}
+        self._cache[("times", "hour")] = source.time_counts("hour")
+        self._cache[("ratings", "rating")] = source.rating_counts()
+        for key in ("movieId", "userId"):
+            self._cache[("stats", key)] = source.group_stats(key)
+            self._cache[("histogram", key)] = source.rating_histogram(key)
+
+    def append(self, batch: "RatingsStore"):
+        """
+        Дописывает порцию оценок в хранилище.
+
+        Уже посчитанные агрегаты и лидерборды обновляются только по группам
+        из порции; сами строки откладываются и склеиваются с колонками
+        при первом обращении к ним.
+
+        Аргументы:
+            batch: RatingsStore с новыми оценками.
+        """
+        row_offset = len(self)
+        self._append_aggregates(batch, row_offset)
+        part = batch.to_arrays()
+        part["rating"] = batch.rating_codes if self.compact else batch.ratings
+        self._pending.append(part)
+        self._rows += len(batch)
@@ -0,0 +1,227 @@
+"""
+Модуль для потоковой обработки ratings.csv, не помещающегося в память.
+
+Содержит класс RatingsSummary: объединяемые частичные агрегаты оценок
+(распределения по часам и рейтингам, агрегаты и гистограммы по фильмам
+и пользователям). Файл читается частями ограниченного размера, агрегаты
+каждой части сливаются с накопленными, а сами строки не сохраняются.
+"""
+
+import numpy as np
+import pandas as pd
+from aggregates import RatingAggregates, add_counts
+from group_stats import GroupStats
+from rating_histogram import RatingHistogram
+from ratings_store import COLUMNS, RatingsStore
+from time_buckets import rebucket
+
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+BYTES_PER_ROW = 160
+GROUP_KEYS = ("movieId", "userId")
+
+
+def chunk_rows(memory_budget: int) -> int:
+    """
+    Возвращает число строк в части файла для заданного бюджета памяти.
+
+    BYTES_PER_ROW — оценка рабочей памяти на строку: разбор CSV в pandas,
+    компактные колонки и групповые индексы части.
+
+    Аргументы:
+        memory_budget: int, бюджет памяти на одну часть в байтах.
+
+    Возвращает:
+        int, количество строк.
+    """
+    if memory_budget <= 0:
+        raise ValueError("Memory budget must be positive.")
+    return max(1, memory_budget // BYTES_PER_ROW)
+
+
+class RatingsSummary(RatingAggregates):
+    """
+    Объединяемые агрегаты оценок, заменяющие RatingsStore в потоковом режиме.
+
+    Предоставляет те же методы агрегатов, что и RatingsStore, поэтому
+    Ratings.Movies и Ratings.Users работают с ним без изменений.
+
+    Атрибуты:
+        rows: int, количество обработанных строк.
+        half_stars: bool, всегда True: сводка хранит гистограммы полузвезд.
+
+    Методы:
+        from_store(store, row_offset): Агрегаты одной части данных.
+        from_csv(path, memory_budget): Читает файл по частям и сливает агрегаты.
+        merge(other): Объединяет агрегаты двух частей.
+        append(batch): Добавляет агрегаты порции новых оценок на месте.
+        year_counts(): Количество оценок по годам.
+        time_counts(granularity): Количество оценок по временным бакетам.
+        rating_counts(): Количество оценок по значениям рейтинга.
+        group_stats(key): Агрегаты оценок по movieId или userId.
+        rating_histogram(key): Гистограммы оценок по movieId или userId.
+    """
+
+    half_stars = True
+
+    def __init__(self, hour_counts, rating_counts, stats, histograms, rows):
+        """
+        Инициализирует сводку готовыми агрегатами.
+
+        Аргументы:
+            hour_counts: pd.Series {начало часа в секундах: количество}.
+            rating_counts: pd.Series {рейтинг: количество}.
+            stats: dict {movieId/userId: GroupStats}.
+            histograms: dict {movieId/userId: RatingHistogram}.
+            rows: int, количество строк.
+        """
+        super().__init__()
+        self._cache[("times", "hour")] = hour_counts
+        self._cache[("ratings", "rating")] = rating_counts
+        for key in GROUP_KEYS:
+            self._cache[("stats", key)] = stats[key]
+            self._cache[("histogram", key)] = histograms[key]
+        self.rows = rows
+
+    @classmethod
+    def from_store(
+        cls, store: RatingsStore, row_offset: int = 0, rows=None
+    ) -> "RatingsSummary":
+        """
+        Считает агрегаты одной части данных.
+
+        Аргументы:
+            store: RatingsStore с оценками части.
+            row_offset: int, номер первой строки части во всем файле.
+            rows: массив номеров строк части во всем файле для частей
+                из несмежных строк; если задан, row_offset не используется.
+
+        Возвращает:
+            RatingsSummary.
+        """
+        stats = {}
+        for key in GROUP_KEYS:
+            part = store.group_stats(key)
+            if rows is None:
+                first_rows = part.first_rows + row_offset
+            else:
+                first_rows = np.asarray(rows)[part.first_rows]
+            stats[key] = GroupStats(
+                part.keys,
+                part.counts,
+                part.sums,
+                part.sums_of_squares,
+                first_rows,
+            )
+        return cls(
+            store.time_counts("hour"),
+            store.rating_counts(),
+            stats,
+            {key: store.rating_histogram(key) for key in GROUP_KEYS},
+            len(store),
+        )
+
+    @classmethod
+    def from_csv(
+        cls, path: str, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> "RatingsSummary":
+        """
+        Читает ratings.csv частями в пределах бюджета памяти и сливает агрегаты.
+
+        Память на строки ограничена одной частью файла; накопленные агрегаты
+        растут только с числом фильмов и пользователей.
+
+        Аргументы:
+            path: str, путь к ratings.csv.
+            memory_budget: int, бюджет памяти на одну часть в байтах.
+
+        Возвращает:
+            RatingsSummary по всему файлу.
+        """
+        summary = cls.empty()
+        reader = pd.read_csv(
+            path,
+            usecols=list(COLUMNS),
+            dtype={"userId": np.int32, "movieId": np.int32, "timestamp": np.int64},
+            chunksize=chunk_rows(memory_budget),
+        )
+        for chunk in reader:
+            part = RatingsStore.from_frame(chunk, compact=True)
+            summary = summary.merge(cls.from_store(part, summary.rows))
+        return summary
+
+    @classmethod
+    def empty(cls) -> "RatingsSummary":
+        """
+        Возвращает сводку без строк.
+        """
+        return cls.from_store(
+            RatingsStore.from_frame(
+                pd.DataFrame({name: np.empty(0, np.int64) for name in COLUMNS}),
+                compact=True,
+            )
+        )
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def merge(self, other: "RatingsSummary") -> "RatingsSummary":
+        """
+        Объединяет агрегаты двух непересекающихся частей данных.
+
+        Аргументы:
+            other: RatingsSummary другой части.
+
+        Возвращает:
+            RatingsSummary по объединению.
+        """
+        return RatingsSummary(
+            add_counts(self.time_counts("hour"), other.time_counts("hour")),
+            add_counts(self.rating_counts(), other.rating_counts()),
+            {
+                key: self.group_stats(key).merge(other.group_stats(key))
+                for key in GROUP_KEYS
+            },
+            {
+                key: self.rating_histogram(key).merge(other.rating_histogram(key))
+                for key in GROUP_KEYS
+            },
+            self.rows + other.rows,
+        )
+
+    def append(self, batch: RatingsStore):
+        """
+        Добавляет агрегаты порции новых оценок на месте.
+
+        Затрагиваются только группы из порции, поэтому стоимость зависит
+        от размера порции, а не от объема уже обработанных данных.
+
+        Аргументы:
+            batch: RatingsStore с новыми оценками.
+        """
+        self._append_aggregates(batch, self.rows)
+        self.rows += len(batch)
+
+    def _bucket_counts(self, granularity: str) -> pd.Series:
+        """
+        Собирает бакеты из количеств по часам, посчитанных при создании.
+        """
+        return rebucket(self._cache[("times", "hour")], granularity)
+
+    def rating_counts(self) -> pd.Series:
+        """
+        Возвращает количество оценок по значениям рейтинга, отсортировано по рейтингу.
+        """
+        return self._cache[("ratings", "rating")]
+
+    def group_stats(self, key: str) -> GroupStats:
+        """
+        Возвращает агрегаты оценок по колонке key (movieId или userId).
+        """
+        return self._cache[("stats", key)]
+
+    def rating_histogram(self, key: str) -> RatingHistogram:
+        """
+        Возвращает гистограммы оценок по колонке key (movieId или userId).
+        """
+        return self._cache[("histogram", key)]
+
@@ -0,0 +1,278 @@
+"""
+Модуль с записью и воспроизведением страниц для офлайн-замеров.
+
+Содержит класс PageArchive — каталог сохраненных страниц с индексом
+адресов — и класс ReplayServer: локальный HTTP-сервер, который отдает
+страницы архива по пути адреса с настраиваемой задержкой и долей
+ошибок 503. Скраперы направляются на сервер подменой хоста в адресе
+(ReplayServer.rewrite), поэтому замеры не зависят от IMDb и Yahoo
+и воспроизводимы в CI. Тесты и бенчмарки с другими ответами
+переопределяют метод ReplayServer.page.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+INDEX_FILE = "index.json"
+
+
+def page_path(url: str) -> str:
+    """
+    Возвращает путь адреса с параметрами запроса — ключ страницы в архиве.
+
+    Аргументы:
+        url: str, полный адрес или путь.
+
+    Возвращает:
+        str, например '/title/tt0114709/'.
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+class PageArchive:
+    """
+    Каталог сохраненных страниц.
+
+    Страница хранится в отдельном файле, index.json сопоставляет пути
+    адресов с именами файлов.
+
+    Атрибуты:
+        directory: str, каталог архива.
+
+    Методы:
+        save(url, html): Сохраняет страницу.
+        record(urls, get, headers): Загружает и сохраняет страницы.
+        load(): Все страницы {путь: текст}.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Открывает архив, создавая каталог при необходимости.
+
+        Аргументы:
+            directory: str, каталог архива.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, INDEX_FILE)
+        self._index = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as file:
+                self._index = json.load(file)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def save(self, url: str, html: str):
+        """
+        Сохраняет страницу и обновляет индекс.
+
+        Аргументы:
+            url: str, адрес страницы.
+            html: str, текст страницы.
+        """
+        path = page_path(url)
+        name = hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+        with open(
+            os.path.join(self.directory, f"{name}.html"), "w", encoding="utf-8"
+        ) as file:
+            file.write(html)
+        self._index[path] = f"{name}.html"
+        with open(self._index_path, "w", encoding="utf-8") as file:
+            json.dump(self._index, file, indent=1, sort_keys=True)
+
+    def record(self, urls, get, headers: dict = None) -> int:
+        """
+        Загружает страницы с сайта и сохраняет успешно загруженные.
+
+        Аргументы:
+            urls: итерируемый набор адресов.
+            get: функция запроса, например requests.get или HttpSession.get.
+            headers: dict, заголовки запросов.
+
+        Возвращает:
+            int, число сохраненных страниц.
+        """
+        saved = 0
+        for url in dict.fromkeys(urls):
+            try:
+                response = get(url, headers=headers, timeout=10)
+                response.raise_for_status()
+            except Exception:
+                continue
+            self.save(url, response.text)
+            saved += 1
+        return saved
+
+    def load(self) -> dict:
+        """
+        Возвращает все страницы архива.
+
+        Возвращает:
+            dict {путь адреса: текст страницы}.
+        """
+        pages = {}
+        for path, name in self._index.items():
+            with open(os.path.join(self.directory, name), encoding="utf-8") as file:
+                pages[path] = file.read()
+        return pages
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.replay.respond(self)
+
+
+class ReplayServer:
+    """
+    Локальный HTTP-сервер, отдающий страницы архива.
+
+    Атрибуты:
+        pages: dict {путь адреса: текст страницы}.
+        latency: float, задержка ответа в секундах.
+        jitter: float, случайная добавка к задержке от 0 до jitter секунд.
+        error_rate: float, доля запросов, на которые отвечается 503.
+        url: str, адрес сервера вида 'http://127.0.0.1:port/'
+            ('https://...' с ssl_context).
+        hits, errors, missing: int, счетчики запросов, ответов 503 и 404.
+        path_hits: Counter {путь адреса: число запросов}.
+        clients: set адресов клиентов — по одному на соединение.
+
+    Методы:
+        rewrite(url): Адрес той же страницы на сервере.
+        page(path, hits): Статус и текст ответа на путь.
+        close(): Останавливает сервер.
+    """
+
+    def __init__(
+        self,
+        pages: dict,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = None,
+        ssl_context=None,
+    ):
+        """
+        Запускает сервер в фоновом потоке на свободном порту.
+
+        Аргументы:
+            pages: dict {адрес или путь: текст страницы}.
+            latency: float, задержка ответа в секундах.
+            jitter: float, наибольшая случайная добавка к задержке.
+            error_rate: float, доля ответов 503, от 0 до 1.
+            seed: int, зерно генератора задержек и ошибок.
+            ssl_context: ssl.SSLContext с сертификатом сервера для HTTPS
+                или None (HTTP).
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("Error rate must be between 0 and 1.")
+        self.pages = {page_path(url): html for url, html in pages.items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.hits = 0
+        self.errors = 0
+        self.missing = 0
+        self.path_hits = Counter()
+        self.clients = set()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), ReplayHandler)
+        self._server.daemon_threads = True
+        self._server.replay = self
+        scheme = "http"
+        if ssl_context is not None:
+            self._server.socket = ssl_context.wrap_socket(
+                self._server.socket, server_side=True
+            )
+            scheme = "https"
+        self.url = f"{scheme}://127.0.0.1:{self._server.server_address[1]}/"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def rewrite(self, url: str) -> str:
+        """
+        Возвращает адрес страницы url на этом сервере.
+
+        Аргументы:
+            url: str, исходный адрес, например на www.imdb.com.
+        """
+        return self.url.rstrip("/") + page_path(url)
+
+    def page(self, path: str, hits: int) -> tuple:
+        """
+        Возвращает ответ на путь: страницу архива или 404.
+
+        Вызывается из потоков сервера без блокировки.
+
+        Аргументы:
+            path: str, путь адреса с параметрами запроса.
+            hits: int, номер запроса к этому пути, начиная с 1.
+
+        Возвращает:
+            tuple (статус HTTP, текст ответа).
+        """
+        html = self.pages.get(path)
+        return (404, "Not Found") if html is None else (200, html)
+
+    def respond(self, handler: BaseHTTPRequestHandler):
+        """
+        Отвечает на запрос обработчика: 503 или ответ page.
+        """
+        path = page_path(handler.path)
+        with self._lock:
+            self.hits += 1
+            self.path_hits[path] += 1
+            self.clients.add(handler.client_address)
+            hits = self.path_hits[path]
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        time.sleep(delay)
+        if failed:
+            status, body = 503, "Service Unavailable"
+        else:
+            status, body = self.page(path, hits)
+        if status == 404:
+            with self._lock:
+                self.missing += 1
+        data = body.encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def close(self):
+        """
+        Останавливает сервер и освобождает порт.
+        """
+        self._server.shutdown()
+        self._server.server_close()
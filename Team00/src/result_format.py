@@ -0,0 +1,88 @@
+"""
+Модуль с форматами результатов методов анализа.
+
+По умолчанию методы Ratings, Movies и Tags возвращают словари. Для больших
+результатов (сотни тысяч пользователей) упаковка ключей и значений
+в объекты Python дороже самой агрегации, поэтому формат можно сменить
+глобально (set_result_format) или в отдельном вызове (аргумент output):
+
+    dict   — dict {ключ: значение}, как раньше;
+    series — pd.Series с ключами в индексе, без копирования;
+    numpy  — кортеж (ключи, значения) из массивов NumPy, без копирования;
+    arrow  — pyarrow.Table с колонками key и value (нужен pyarrow).
+"""
+
+from collections.abc import Mapping
+
+import pandas as pd
+
+RESULT_FORMATS = ("dict", "series", "numpy", "arrow")
+_result_format = "dict"
+
+
+def _check_format(output: str) -> str:
+    if output not in RESULT_FORMATS:
+        raise ValueError(
+            "Invalid result format. Use 'dict', 'series', 'numpy' or 'arrow'."
+        )
+    return output
+
+
+def set_result_format(output: str):
+    """
+    Задает формат результатов по умолчанию для всех методов анализа.
+
+    Аргументы:
+        output: str, одно из dict, series, numpy, arrow.
+    """
+    global _result_format
+    _result_format = _check_format(output)
+
+
+def get_result_format() -> str:
+    """
+    Возвращает текущий формат результатов по умолчанию.
+    """
+    return _result_format
+
+
+def resolve_format(output: str = None) -> str:
+    """
+    Возвращает формат результата вызова: output или формат по умолчанию.
+
+    Методы с дорогой сборкой словаря проверяют формат заранее и строят
+    словарь только для dict.
+    """
+    return _check_format(_result_format if output is None else output)
+
+
+def format_result(values, output: str = None):
+    """
+    Переводит результат метода анализа в запрошенный формат.
+
+    Аргументы:
+        values: pd.Series {ключ: значение} или готовый словарь
+            (возвращается как есть в формате dict).
+        output: str, формат результата; None — формат по умолчанию.
+
+    Возвращает:
+        dict, pd.Series, кортеж (ключи, значения) np.ndarray или pyarrow.Table.
+    """
+    output = resolve_format(output)
+    if output == "dict":
+        if isinstance(values, Mapping):
+            return values
+        if not values.index.is_unique:
+            return dict(zip(values.index, values))
+        return dict(values)
+    if isinstance(values, Mapping):
+        values = pd.Series(values)
+    if output == "series":
+        return values
+    if output == "numpy":
+        return values.index.to_numpy(), values.to_numpy()
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError("Result format 'arrow' requires pyarrow.") from error
+    return pa.table({"key": values.index.to_numpy(), "value": values.to_numpy()})
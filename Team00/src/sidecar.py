@@ -0,0 +1,271 @@
+"""
+Модуль с бинарным кешем рядом с CSV файлами MovieLens.
+
+Результат разбора CSV сохраняется в скрытую папку рядом с файлом
+(например, ml-latest-small/.ratings.csv.cache/). Числовые колонки хранятся
+в .npy и загружаются через memory mapping, остальные объекты — в pickle.
+Кеш действителен, пока у CSV совпадают размер и mtime; если изменился только
+mtime, сверяется хеш содержимого.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+
+CACHE_VERSION = 4
+HASH_BLOCK_SIZE = 2**20
+META_FILE = "meta.json"
+
+
+def sidecar_dir(csv_path: str) -> str:
+    """
+    Возвращает путь к папке кеша для CSV файла.
+    """
+    directory, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(directory, f".{name}.cache")
+
+
+def file_hash(path: str) -> str:
+    """
+    Возвращает BLAKE2b хеш содержимого файла.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Sidecar:
+    """
+    Кеш одного результата разбора CSV файла.
+
+    Атрибуты:
+        csv_path: str, путь к исходному CSV.
+        name: str, имя результата (например, 'store' или 'frame').
+        directory: str, папка кеша.
+
+    Методы:
+        load_arrays(): Загружает словарь массивов через memory mapping.
+        save_arrays(arrays): Сохраняет словарь массивов в .npy.
+        load_object(): Загружает объект из pickle.
+        save_object(obj): Сохраняет объект в pickle.
+    """
+
+    def __init__(self, csv_path: str, name: str):
+        """
+        Инициализирует кеш для CSV файла и имени результата.
+
+        Аргументы:
+            csv_path: str, путь к исходному CSV.
+            name: str, имя результата.
+        """
+        self.csv_path = csv_path
+        self.name = name
+        self.directory = sidecar_dir(csv_path)
+
+    def _path(self, suffix: str) -> str:
+        return os.path.join(self.directory, f"{self.name}.{suffix}")
+
+    def _signature(self) -> dict:
+        """
+        Возвращает размер и mtime CSV файла или None, если файла нет.
+        """
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _read_meta(self) -> dict:
+        try:
+            with open(self._path(META_FILE), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _replace(self, suffix: str, write, mode: str = "wb"):
+        """
+        Записывает файл кеша во временный файл и подменяет им прежний.
+
+        Прежний файл не перезаписывается на месте: массивы, уже открытые
+        через memory mapping другими экземплярами, остаются целыми.
+        """
+        tmp_path = self._path(suffix) + ".tmp"
+        encoding = "utf-8" if "b" not in mode else None
+        with open(tmp_path, mode, encoding=encoding) as file:
+            write(file)
+        os.replace(tmp_path, self._path(suffix))
+
+    def _write_meta(self, meta: dict):
+        self._replace(META_FILE, lambda file: json.dump(meta, file), "w")
+
+    def is_valid(self) -> bool:
+        """
+        Проверяет, что кеш соответствует текущему содержимому CSV.
+
+        Возвращает:
+            bool: True, если кеш можно использовать.
+        """
+        signature = self._signature()
+        meta = self._read_meta()
+        if signature is None or meta is None:
+            return False
+        if meta.get("version") != CACHE_VERSION or meta["size"] != signature["size"]:
+            return False
+        if meta["mtime_ns"] == signature["mtime_ns"]:
+            return True
+        if meta["hash"] != file_hash(self.csv_path):
+            return False
+        meta["mtime_ns"] = signature["mtime_ns"]
+        try:
+            self._write_meta(meta)
+        except OSError:
+            pass
+        return True
+
+    def _start_save(self) -> dict:
+        """
+        Готовит папку кеша и возвращает метаданные CSV или None, если его нет.
+        """
+        signature = self._signature()
+        if signature is None:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            os.remove(self._path(META_FILE))
+        except OSError:
+            pass
+        return {
+            "version": CACHE_VERSION,
+            "hash": file_hash(self.csv_path),
+            **signature,
+        }
+
+    def load_arrays(self) -> dict:
+        """
+        Загружает словарь массивов через memory mapping.
+
+        Возвращает:
+            dict {имя: np.ndarray} или None, если кеш недействителен.
+        """
+        if not self.is_valid():
+            return None
+        meta = self._read_meta()
+        try:
+            return {
+                key: np.load(self._path(f"{key}.npy"), mmap_mode="r")
+                for key in meta["arrays"]
+            }
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save_arrays(self, arrays: dict):
+        """
+        Сохраняет словарь массивов в .npy файлы.
+
+        Аргументы:
+            arrays: dict {имя: np.ndarray}.
+        """
+        meta = self._start_save()
+        if meta is None:
+            return
+        for key, array in arrays.items():
+            self._replace(
+                f"{key}.npy",
+                lambda file, array=array: np.save(file, np.ascontiguousarray(array)),
+            )
+        meta["arrays"] = list(arrays)
+        self._write_meta(meta)
+
+    def load_object(self):
+        """
+        Загружает объект из pickle.
+
+        Возвращает:
+            Объект или None, если кеш недействителен.
+        """
+        if not self.is_valid():
+            return None
+        try:
+            with open(self._path("pkl"), "rb") as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def save_object(self, obj):
+        """
+        Сохраняет объект в pickle.
+
+        Аргументы:
+            obj: объект для сохранения.
+        """
+        meta = self._start_save()
+        if meta is None:
+            return
+        self._replace(
+            "pkl",
+            lambda file: pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        self._write_meta(meta)
+
+
+def cached_object(csv_path: str, name: str, build, cache: bool = True):
+    """
+    Возвращает объект из кеша или строит его функцией build и сохраняет.
+
+    Ошибки записи кеша (например, папка только для чтения) игнорируются.
+    None не кешируется.
+
+    Аргументы:
+        csv_path: str, путь к исходному CSV.
+        name: str, имя результата.
+        build: функция без аргументов, строящая объект из CSV.
+        cache: bool, использовать ли кеш.
+
+    Возвращает:
+        Объект из кеша или результат build().
+    """
+    if not cache:
+        return build()
+    sidecar = Sidecar(csv_path, name)
+    obj = sidecar.load_object()
+    if obj is not None:
+        return obj
+    obj = build()
+    if obj is not None:
+        try:
+            sidecar.save_object(obj)
+        except OSError:
+            pass
+    return obj
+
+
+def cached_arrays(csv_path: str, name: str, build, cache: bool = True) -> dict:
+    """
+    Возвращает словарь массивов из кеша или строит его функцией build и сохраняет.
+
+    Аргументы:
+        csv_path: str, путь к исходному CSV.
+        name: str, имя результата.
+        build: функция без аргументов, возвращающая dict {имя: np.ndarray}.
+        cache: bool, использовать ли кеш.
+
+    Возвращает:
+        dict {имя: np.ndarray}; из кеша массивы открыты только для чтения.
+    """
+    if not cache:
+        return build()
+    sidecar = Sidecar(csv_path, name)
+    arrays = sidecar.load_arrays()
+    if arrays is not None:
+        return arrays
+    arrays = build()
+    try:
+        sidecar.save_arrays(arrays)
+    except OSError:
+        pass
+    return arrays
@@ -0,0 +1,199 @@
+"""
+Модуль с поисковым индексом по уникальным тегам.
+
+Содержит класс TagSearchIndex: для тегов в нижнем регистре строятся
+обратный индекс «слово -> номера тегов» для поиска целых слов и индекс
+n-грамм длиной от 1 до 3 символов «n-грамма -> номера тегов» для поиска
+подстрок. Запросы до 3 символов отвечаются одним списком номеров,
+кандидаты для более длинных подстрок и regex проверяются перед возвратом,
+поэтому результат совпадает с полным просмотром, а время поиска зависит
+от числа кандидатов, а не всех тегов.
+"""
+
+import re
+
+import numpy as np
+
+NGRAM = 3
+REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _ngrams(text: str, size: int = NGRAM) -> set:
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def required_literals(pattern: str) -> list:
+    """
+    Возвращает подстроки, которые содержит каждое совпадение regex pattern.
+
+    Разбираются шаблоны из обычных символов, экранированных символов
+    (например '\\.'), точек и якорей ^ в начале и $ в конце: 'r.i.p'
+    дает ['r', 'i', 'p'].
+
+    Аргументы:
+        pattern: str, регулярное выражение.
+
+    Возвращает:
+        list непустых подстрок или None, если в шаблоне есть другие
+        конструкции regex (квантификаторы, классы, группы, '|').
+    """
+    pieces, current = [], ""
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == "\\":
+            escaped = pattern[position + 1 : position + 2]
+            if not escaped or (escaped.isascii() and escaped.isalnum()):
+                return None
+            current += escaped
+            position += 1
+        elif char == "." or (char == "^" and position == 0):
+            pieces.append(current)
+            current = ""
+        elif char == "$" and position == len(pattern) - 1:
+            pieces.append(current)
+            current = ""
+        elif char in REGEX_CHARS:
+            return None
+        else:
+            current += char
+        position += 1
+    pieces.append(current)
+    return [piece for piece in pieces if piece]
+
+
+def _postings(index: dict) -> dict:
+    return {key: np.array(ids, dtype=np.int64) for key, ids in index.items()}
+
+
+class TagSearchIndex:
+    """
+    Индекс слов и n-грамм по уникальным тегам.
+
+    Атрибуты:
+        tags: np.ndarray уникальных тегов (строки).
+        lowered: list тегов в нижнем регистре.
+
+    Методы:
+        contains(query): Номера тегов, содержащих подстроку или regex.
+        with_word(word): Номера тегов, содержащих слово или фразу целиком.
+    """
+
+    def __init__(self, tags):
+        """
+        Строит индексы слов и n-грамм длиной от 1 до NGRAM.
+
+        Аргументы:
+            tags: массив уникальных тегов; значения, не являющиеся строками,
+                в поиск не попадают.
+        """
+        self.tags = np.asarray(tags, dtype=object)
+        self.lowered = [tag.lower() if isinstance(tag, str) else None for tag in tags]
+        self._strings = np.array(
+            [i for i, tag in enumerate(self.lowered) if tag is not None],
+            dtype=np.int64,
+        )
+        tokens, ngrams = {}, {}
+        self._tokens = []
+        for i, tag in enumerate(self.lowered):
+            words = TOKEN_PATTERN.findall(tag) if tag is not None else []
+            self._tokens.append(words)
+            for word in set(words):
+                tokens.setdefault(word, []).append(i)
+            for size in range(1, NGRAM + 1) if tag is not None else ():
+                for ngram in _ngrams(tag, size):
+                    ngrams.setdefault(ngram, []).append(i)
+        self._token_index = _postings(tokens)
+        self._ngram_index = _postings(ngrams)
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def _intersect(self, index: dict, keys) -> np.ndarray:
+        """
+        Пересекает списки номеров для ключей, начиная с самого короткого.
+        """
+        postings = sorted((index.get(key, self._strings[:0]) for key in keys), key=len)
+        result = postings[0]
+        for ids in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def _candidates(self, literal: str) -> np.ndarray:
+        """
+        Возвращает номера тегов, которые могут содержать literal.
+
+        Для literal не длиннее NGRAM символов список точный.
+        """
+        if len(literal) <= NGRAM:
+            return self._ngram_index.get(literal, self._strings[:0])
+        return self._intersect(self._ngram_index, _ngrams(literal))
+
+    def contains(self, query: str) -> np.ndarray:
+        """
+        Возвращает номера тегов, в нижнем регистре содержащих query.
+
+        Как и str.contains, query — регулярное выражение. Подстроки
+        до NGRAM символов берутся из индекса без проверки, кандидаты
+        для более длинных подстрок и regex из required_literals
+        проверяются; полным просмотром тегов проверяются только regex
+        с квантификаторами, классами, группами и '|'.
+
+        Аргументы:
+            query: str, подстрока в нижнем регистре.
+
+        Возвращает:
+            np.ndarray номеров тегов по возрастанию.
+        """
+        if not REGEX_CHARS.intersection(query):
+            if not query:
+                return self._strings
+            candidates = self._candidates(query)
+            if len(query) <= NGRAM:
+                return candidates
+            return np.array(
+                [i for i in candidates if query in self.lowered[i]], dtype=np.int64
+            )
+
+        pattern = re.compile(query)
+        literals = required_literals(query)
+        candidates = self._strings
+        for literal in sorted(literals or (), key=len, reverse=True):
+            candidates = np.intersect1d(
+                candidates, self._candidates(literal), assume_unique=True
+            )
+        return np.array(
+            [i for i in candidates if pattern.search(self.lowered[i])],
+            dtype=np.int64,
+        )
+
+    def with_word(self, word: str) -> np.ndarray:
+        """
+        Возвращает номера тегов, содержащих слово или фразу целиком.
+
+        Аргументы:
+            word: str, слово или фраза; сравнение без учета регистра,
+                слова — последовательности букв, цифр и '_'.
+
+        Возвращает:
+            np.ndarray номеров тегов по возрастанию.
+        """
+        words = TOKEN_PATTERN.findall(word.lower())
+        if not words:
+            return self._strings[:0]
+        candidates = self._intersect(self._token_index, set(words))
+        size = len(words)
+        return np.array(
+            [
+                i
+                for i in candidates
+                if any(
+                    self._tokens[i][start : start + size] == words
+                    for start in range(len(self._tokens[i]) - size + 1)
+                )
+            ],
+            dtype=np.int64,
+        )
@@ -0,0 +1,72 @@
+"""
+Модуль со словарем уникальных тегов из tags.csv.
+
+Содержит класс TagVocabulary: колонка tag кодируется один раз — номер
+уникального тега для каждой строки и массив уникальных тегов в порядке
+первого появления, — и для уникальных тегов заранее считаются длина
+в символах и количество слов. Запросы «самые длинные» и «самые
+многословные» теги становятся выбором top-k по готовым массивам.
+"""
+
+import numpy as np
+import pandas as pd
+
+MISSING_LENGTH = -1
+
+
+class TagVocabulary:
+    """
+    Словарное кодирование колонки tag.
+
+    Атрибуты:
+        codes: np.ndarray int32, номер уникального тега для каждой строки.
+        tags: np.ndarray уникальных тегов в порядке первого появления
+            (как у drop_duplicates, NaN — отдельный тег).
+        lengths: np.ndarray int32 длин тегов в символах,
+            MISSING_LENGTH для значений, не являющихся строками.
+        word_counts: np.ndarray int32 количеств слов, как len(str(tag).split()).
+
+    Методы:
+        from_series(tags): Строит словарь из колонки tag.
+        code(tag): Номер уникального тега.
+    """
+
+    def __init__(self, codes, tags, lengths, word_counts):
+        """
+        Инициализирует словарь готовыми массивами.
+        """
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.tags = np.asarray(tags, dtype=object)
+        self.lengths = np.asarray(lengths, dtype=np.int32)
+        self.word_counts = np.asarray(word_counts, dtype=np.int32)
+        self._codes_by_tag = None
+
+    @classmethod
+    def from_series(cls, tags: pd.Series) -> "TagVocabulary":
+        """
+        Кодирует колонку tag и считает длины и количества слов.
+
+        Аргументы:
+            tags: pd.Series тегов.
+
+        Возвращает:
+            TagVocabulary.
+        """
+        codes, uniques = pd.factorize(pd.Series(tags), use_na_sentinel=False)
+        uniques = pd.Series(np.asarray(uniques, dtype=object))
+        lengths = uniques.str.len().fillna(MISSING_LENGTH)
+        word_counts = uniques.astype(str).str.split().str.len()
+        return cls(codes, uniques.to_numpy(), lengths, word_counts)
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def code(self, tag) -> int:
+        """
+        Возвращает номер уникального тега, -1 для отсутствующего тега.
+
+        Словарь «тег -> номер» строится при первом вызове.
+        """
+        if self._codes_by_tag is None:
+            self._codes_by_tag = {name: i for i, name in enumerate(self.tags)}
+        return self._codes_by_tag.get(tag, -1)
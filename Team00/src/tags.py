@@ -6,7 +6,14 @@
 поиск по ключевому слову.
 """
 
+import numpy as np
 import pandas as pd
+from group_index import GroupIndex
+from result_format import format_result
+from sidecar import cached_object
+from tag_index import TagSearchIndex
+from tag_vocabulary import MISSING_LENGTH, TagVocabulary
+from topk import top_k
 
 
 class Tags:
@@ -16,47 +23,74 @@ class Tags:
     Атрибуты:
         path: Путь к файлу tags.csv.
         data: DataFrame с загруженными данными.
+        vocabulary: TagVocabulary с кодами, длинами и количествами слов тегов.
 
     Методы:
         most_words(n): Возвращает top-n тегов с наибольшим количеством слов.
         longest(n): Возвращает top-n самых длинных тегов по количеству символов.
         most_words_and_longest(n): Возвращает пересечение самых длинных и самых словесных тегов.
         most_popular(n): Возвращает top-n самых популярных тегов по количеству упоминаний.
-        tags_with(word): Возвращает уникальные теги, содержащие заданное слово.
+        tags_with(word, whole_word): Возвращает уникальные теги, содержащие
+            заданное слово; поиск идет по индексу, построенному один раз.
+        movie_tags(movie_id), user_tags(user_id): Теги фильма или пользователя.
+        tag_movies(tag): movieId фильмов с тегом.
+        top_movie_tags(movie_id, n), top_user_tags(user_id, n): top-n тегов
+            фильма или пользователя по количеству упоминаний.
     """
 
-    def __init__(self, path_to_the_file: str):
+    def __init__(self, path_to_the_file: str, cache: bool = True):
         """
         Инициализирует класс Tags с путем к файлу tags.csv.
 
         Атрибуты:
             path_to_the_file: str, путь к CSV файлу.
+            cache: bool, сохранять разобранный файл в бинарный кеш рядом с CSV
+                и загружать из него при следующих запусках.
         """
         self.path = path_to_the_file
-        self.data = pd.read_csv(path_to_the_file)
-
-    def most_words(self, n: int) -> dict:
+        self.data = cached_object(
+            path_to_the_file, "frame", lambda: pd.read_csv(path_to_the_file), cache
+        )
+        self.vocabulary = cached_object(
+            path_to_the_file,
+            "vocabulary",
+            lambda: TagVocabulary.from_series(self.data["tag"]),
+            cache,
+        )
+        self._search_index = None
+        self._indexes = {}
+
+    def most_words(self, n: int, output: str = None) -> dict:
         """
         Возвращает top-n тегов с наибольшим количеством слов внутри.
 
+        Аргументы:
+            n: int, количество тегов для возврата.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
+
         Возвращает:
-            dict: {тег: количество_слов}, отсортировано по убыванию.
+            dict: {тег: количество_слов}, отсортировано по убыванию,
+            при равенстве — в порядке первого появления тега.
         """
-        tags = self.data["tag"].drop_duplicates()
-        tag_word_counts = tags.apply(lambda x: len(str(x).split()))
-        top = tag_word_counts.sort_values(ascending=False).head(n)
-        return dict(zip(tags[top.index], top))
+        vocabulary = self.vocabulary
+        top = top_k(vocabulary.word_counts, n)
+        return format_result(
+            dict(zip(vocabulary.tags[top], vocabulary.word_counts[top].tolist())),
+            output,
+        )
 
     def longest(self, n: int) -> list:
         """
         Возвращает top-n самых длинных тегов по количеству символов.
 
         Возвращает:
-            list: список тегов, отсортированных по убыванию длины.
+            list: список тегов, отсортированных по убыванию длины,
+            при равенстве — в порядке первого появления тега.
         """
-        tags = self.data["tag"].drop_duplicates()
-        sorted_tags = tags.sort_values(key=lambda x: x.str.len(), ascending=False)
-        return sorted_tags.head(n).tolist()
+        lengths = self.vocabulary.lengths
+        top = top_k(lengths, n)
+        return self.vocabulary.tags[top[lengths[top] != MISSING_LENGTH]].tolist()
 
     def most_words_and_longest(self, n: int) -> list:
         """
@@ -65,28 +99,152 @@ class Tags:
         Возвращает:
             list: список уникальных тегов в пересечении, отсортированный.
         """
-        most_words_set = set(self.most_words(n).keys())
-        longest_set = set(self.longest(n))
-        return sorted(most_words_set & longest_set)
-
-    def most_popular(self, n: int) -> dict:
+        vocabulary = self.vocabulary
+        most_words = top_k(vocabulary.word_counts, n)
+        longest = top_k(vocabulary.lengths, n)
+        common = np.intersect1d(most_words, longest)
+        common = common[vocabulary.lengths[common] != MISSING_LENGTH]
+        return sorted(vocabulary.tags[common].tolist())
+
+    def most_popular(self, n: int, output: str = None) -> dict:
         """
         Возвращает top-n самых популярных тегов по количеству упоминаний.
 
+        Аргументы:
+            n: int, количество тегов для возврата.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
+
         Возвращает:
             dict: {тег: количество}, отсортировано по убыванию количества.
         """
         tag_counts = self.data["tag"].value_counts()
-        return tag_counts.head(n).to_dict()
+        return format_result(tag_counts.head(n).to_dict(), output)
+
+    def group_index(self, key: str) -> GroupIndex:
+        """
+        Возвращает CSR-индекс строк по колонке key, построенный один раз.
+
+        Аргументы:
+            key: str, movieId, userId или tag (группы — номера тегов
+                из vocabulary).
+
+        Возвращает:
+            GroupIndex.
+        """
+        if key not in self._indexes:
+            if key == "tag":
+                keys = self.vocabulary.codes
+            else:
+                keys = self.data[key].to_numpy()
+            self._indexes[key] = GroupIndex(keys)
+        return self._indexes[key]
+
+    def _group_tags(self, key: str, value) -> tuple:
+        """
+        Возвращает номера тегов группы, их количества и первые вхождения.
+        """
+        codes = self.vocabulary.codes[self.group_index(key).rows(value)]
+        codes, first, counts = np.unique(codes, return_index=True, return_counts=True)
+        return codes, first, counts
+
+    def _tags_of(self, key: str, value) -> list:
+        codes, first, _ = self._group_tags(key, value)
+        return self.vocabulary.tags[codes[np.argsort(first)]].tolist()
+
+    def _top_tags_of(self, key: str, value, n: int, output: str) -> dict:
+        codes, first, counts = self._group_tags(key, value)
+        top = top_k(counts, n, first)
+        return format_result(
+            dict(zip(self.vocabulary.tags[codes[top]], counts[top].tolist())), output
+        )
+
+    def movie_tags(self, movie_id) -> list:
+        """
+        Возвращает уникальные теги фильма.
+
+        Возвращает:
+            list: теги в порядке первого появления, пустой для фильма без тегов.
+        """
+        return self._tags_of("movieId", movie_id)
+
+    def user_tags(self, user_id) -> list:
+        """
+        Возвращает уникальные теги, поставленные пользователем.
+
+        Возвращает:
+            list: теги в порядке первого появления, пустой для пользователя
+            без тегов.
+        """
+        return self._tags_of("userId", user_id)
 
-    def tags_with(self, word: str) -> list:
+    def tag_movies(self, tag: str) -> list:
+        """
+        Возвращает фильмы, отмеченные тегом (точное совпадение).
+
+        Возвращает:
+            list: отсортированный список movieId, пустой для неизвестного тега.
+        """
+        code = self.vocabulary.code(tag)
+        if code < 0:
+            return []
+        rows = self.group_index("tag").rows(code)
+        return np.unique(self.data["movieId"].to_numpy()[rows]).tolist()
+
+    def top_movie_tags(self, movie_id, n: int, output: str = None) -> dict:
+        """
+        Возвращает top-n тегов фильма по количеству упоминаний.
+
+        Аргументы:
+            movie_id: movieId фильма.
+            n: int, количество тегов для возврата.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
+
+        Возвращает:
+            dict: {тег: количество}, отсортировано по убыванию,
+            при равенстве — в порядке первого появления тега у фильма.
+        """
+        return self._top_tags_of("movieId", movie_id, n, output)
+
+    def top_user_tags(self, user_id, n: int, output: str = None) -> dict:
+        """
+        Возвращает top-n тегов пользователя по количеству упоминаний.
+
+        Аргументы:
+            user_id: userId пользователя.
+            n: int, количество тегов для возврата.
+            output: str, формат результата (dict, series, numpy, arrow);
+                по умолчанию — заданный через set_result_format.
+
+        Возвращает:
+            dict: {тег: количество}, отсортировано по убыванию,
+            при равенстве — в порядке первого появления тега у пользователя.
+        """
+        return self._top_tags_of("userId", user_id, n, output)
+
+    def search_index(self) -> TagSearchIndex:
+        """
+        Возвращает поисковый индекс по уникальным тегам, построенный один раз.
+        """
+        if self._search_index is None:
+            self._search_index = TagSearchIndex(self.vocabulary.tags)
+        return self._search_index
+
+    def tags_with(self, word: str, whole_word: bool = False) -> list:
         """
         Возвращает все уникальные теги, содержащие заданное слово (без учета регистра).
 
+        Аргументы:
+            word: str, искомая подстрока (как в str.contains, допускается regex).
+            whole_word: bool, искать слово или фразу целиком, а не подстроку.
+
         Возвращает:
             list: отсортированный список тегов, содержащих слово.
         """
-        word_lower = word.lower()
-        tags = self.data["tag"].drop_duplicates()
-        filtered_tags = tags[tags.str.lower().str.contains(word_lower, na=False)]
-        return sorted(filtered_tags.tolist())
+        index = self.search_index()
+        if whole_word:
+            found = index.with_word(word)
+        else:
+            found = index.contains(word.lower())
+        return sorted(index.tags[found].tolist())
@@ -0,0 +1,37 @@
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from replay import ReplayServer
+
+
+class StubServer(ReplayServer):
+    """
+    ReplayServer для тестов загрузки страниц.
+
+    /flaky... отвечает 503 на первые два запроса, адреса с 'missing' — 404,
+    /title/tt... — страница фильма с бюджетом из последних цифр imdbId,
+    остальные пути — текст 'page <путь>'.
+    """
+
+    def page(self, path: str, hits: int) -> tuple:
+        if path.startswith("/flaky") and hits <= 2:
+            return 503, "busy"
+        if "missing" in path:
+            return 404, "missing"
+        if path.startswith("/title/"):
+            imdb_id = path.strip("/").split("/")[-1]
+            return 200, (
+                f"<html><h1>Movie {imdb_id}</h1>"
+                '<li data-testid="title-boxoffice-budget">'
+                '<span class="ipc-metadata-list-item__list-content-item">'
+                f"${imdb_id[-3:]},000</span></li></html>"
+            )
+        return 200, f"page {path}"
+
+
+@pytest.fixture
+def stub_server():
+    with StubServer({}, latency=0.05) as server:
+        yield server
@@ -0,0 +1,50 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from catalog import MISSING_YEAR, MovieCatalog, parse_release_years
+
+
+@pytest.fixture
+def catalog():
+    df = pd.DataFrame(
+        {
+            "movieId": [30, 10, 20, 40],
+            "title": [
+                "Heat (1995)",
+                "Casino (1995)",
+                "Clerks (1994)",
+                "Untitled",
+            ],
+            "genres": ["Action|Crime", "Crime|Drama", "Comedy", "Drama"],
+        }
+    )
+    return MovieCatalog.from_frame(df)
+
+
+def test_parse_release_years():
+    years = parse_release_years(
+        pd.Series(["A (1995)", "B (2010) (1999)", "C", "1984 (Remake)"])
+    )
+    assert years.dtype == np.int16
+    assert years.tolist() == [1995, 2010, MISSING_YEAR, MISSING_YEAR]
+
+
+def test_positions(catalog):
+    assert catalog.positions([10, 40, 99]).tolist() == [1, 3, -1]
+
+
+def test_filter(catalog):
+    assert catalog.filter(["Crime"]).tolist() == [True, True, False, False]
+    assert catalog.filter(["Crime", "Drama"]).tolist() == [False, True, False, False]
+    mask = catalog.filter(["Comedy", "Action"], match="any")
+    assert mask.tolist() == [True, False, True, False]
+    assert catalog.filter(years=(1994, 1994)).tolist() == [False, False, True, False]
+    assert catalog.filter(["Drama"], (1990, 1999)).tolist() == [
+        False, True, False, False
+    ]
+    with pytest.raises(ValueError):
+        catalog.filter(match="none")
@@ -0,0 +1,47 @@
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from crawl_journal import CrawlJournal
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "crawl.jsonl")
+
+
+def test_record_and_reload(path):
+    with CrawlJournal(path) as journal:
+        journal.record("movie", "0114709", {"title": "Toy Story"})
+        journal.record("director", "name/nm1", 42)
+        journal.record("director", "name/nm1", 43)
+        journal.record("director", "name/nm2", None)
+    with CrawlJournal(path, sync=True) as journal:
+        assert len(journal) == 3
+        assert journal.get("movie", "0114709") == {"title": "Toy Story"}
+        assert journal.get("director", "name/nm1") == 43
+        assert journal.done("director", "name/nm2")
+        assert not journal.done("movie", "name/nm2")
+        assert journal.processed("director") == {"name/nm1", "name/nm2"}
+
+
+def test_truncated_line_is_skipped(path):
+    with CrawlJournal(path) as journal:
+        journal.record("movie", "1", {"title": "A"})
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"kind": "movie", "key": "2", "res')
+    with CrawlJournal(path) as journal:
+        assert journal.processed("movie") == {"1"}
+        journal.record("movie", "3", {"title": "C"})
+    with CrawlJournal(path) as journal:
+        assert journal.processed("movie") == {"1", "3"}
+
+
+def test_clear(path):
+    with CrawlJournal(path) as journal:
+        journal.record("movie", "1", None)
+        journal.clear()
+        assert len(journal) == 0
+    with CrawlJournal(path) as journal:
+        assert len(journal) == 0
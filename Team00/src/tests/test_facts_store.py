@@ -0,0 +1,46 @@
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import facts_store
+from facts_store import FactsStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with FactsStore(str(tmp_path / "facts.sqlite")) as store:
+        yield store
+
+
+def test_save_and_load(store, tmp_path):
+    store.save(
+        [
+            {"imdbId": "0114709", "title": "Toy Story", "budget": "$30,000,000"},
+            {"imdbId": "0113497", "title": "Jumanji", "fetched_at": 10.0},
+        ]
+    )
+    store.save([{"imdbId": "0113497", "title": "Jumanji (1995)", "fetched_at": 20.0}])
+    reopened = FactsStore(store.path)
+    records = reopened.load()
+    reopened.close()
+    assert len(records) == 2
+    assert records["0114709"]["budget"] == "$30,000,000"
+    assert records["0114709"]["gross"] is None
+    assert records["0113497"]["title"] == "Jumanji (1995)"
+    assert records["0113497"]["fetched_at"] == 20.0
+
+
+def test_non_string_values_stored_as_null(store):
+    store.save([{"imdbId": "1", "title": object()}])
+    assert store.load()["1"]["title"] is None
+
+
+def test_is_stale(store, monkeypatch):
+    monkeypatch.setattr(facts_store.time, "time", lambda: 1000.0)
+    assert store.is_stale(None)
+    assert not store.is_stale({"fetched_at": 0.0})
+    assert store.is_stale({"fetched_at": 0.0}, max_age=500)
+    store.max_age = 500
+    assert not store.is_stale({"fetched_at": 600.0})
+    assert store.is_stale({"fetched_at": 400.0})
@@ -0,0 +1,83 @@
+import sys
+import os
+import time
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import links
+from fetcher import Fetcher, TokenBucket
+from http_session import HttpSession
+from links import Links
+
+
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_fetch_many_concurrent_and_reuses_connections(stub_server):
+    urls = [f"{stub_server.url}page/{i}" for i in range(16)]
+    with Fetcher(max_workers=8, rate=1000, burst=1000) as fetcher:
+        start = time.monotonic()
+        pages = fetcher.fetch_many(urls)
+        elapsed = time.monotonic() - start
+        fetcher.fetch_many(urls)
+    assert list(pages) == urls
+    assert pages[urls[3]] == "page /page/3"
+    assert elapsed < 16 * stub_server.latency / 2
+    assert len(stub_server.clients) <= 8
+
+
+def test_retries_with_backoff(stub_server):
+    with Fetcher(retries=3, backoff=0.01, rate=1000, burst=1000) as fetcher:
+        assert fetcher.fetch(stub_server.url + "flaky") == "page /flaky"
+        assert fetcher.fetch(stub_server.url + "missing") is None
+    assert stub_server.path_hits["/flaky"] == 3
+    assert stub_server.path_hits["/missing"] == 1
+    assert (fetcher.retried, fetcher.failed) == (2, 1)
+
+
+def test_retries_exhausted(stub_server):
+    with Fetcher(retries=1, backoff=0.01, rate=1000, burst=1000) as fetcher:
+        assert fetcher.fetch(stub_server.url + "flaky") is None
+    assert stub_server.path_hits["/flaky"] == 2
+
+
+def test_links_with_fetcher(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(links, "IMDB_URL", stub_server.url)
+    monkeypatch.setattr(links, "PREFETCH_WINDOW", 2)
+    path = tmp_path / "links.csv"
+    path.write_text("movieId,imdbId\n1,0000100\n2,0000300\n3,0000200\n")
+    with Fetcher(max_workers=4, rate=1000, burst=1000) as fetcher:
+        result = Links(str(path), fetcher=fetcher).most_expensive(2)
+    assert result == {"Movie tt0000300": "$300,000", "Movie tt0000200": "$200,000"}
+    assert all(hits == 1 for hits in stub_server.path_hits.values())
+
+
+def test_fetcher_with_http_session(stub_server):
+    with HttpSession() as session:
+        with Fetcher(
+            retries=3, backoff=0.01, rate=1000, burst=1000, session=session
+        ) as fetcher:
+            assert fetcher.fetch(stub_server.url + "flaky") == "page /flaky"
+            assert fetcher.fetch(stub_server.url + "missing") is None
+        assert len(session.latencies) == fetcher.requests_sent == 4
+        assert session.get(stub_server.url + "page/1").text == "page /page/1"
+
+
+def test_retry_after_over_limit_fails_fast():
+    session = MagicMock(errors=(OSError,), retry_errors=(ConnectionError,))
+    session.get.return_value = MagicMock(
+        status_code=429, headers={"Retry-After": "7200"}
+    )
+    with Fetcher(rate=1000, burst=1000, max_delay=5, session=session) as fetcher:
+        start = time.monotonic()
+        assert fetcher.fetch("http://example.com/slow") is None
+        assert time.monotonic() - start < 1
+        assert (fetcher.requests_sent, fetcher.retried, fetcher.failed) == (1, 0, 1)
+        assert fetcher._delay(10) <= 5
+        honoured = MagicMock(headers={"Retry-After": "3"})
+        assert 3 <= fetcher._delay(0, honoured) <= 5
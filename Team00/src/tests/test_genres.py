@@ -0,0 +1,57 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from genres import GenreMatrix
+
+
+@pytest.fixture
+def matrix():
+    return GenreMatrix.from_strings(
+        pd.Series(["Comedy|Drama", "Drama", np.nan, "Action|Comedy|Drama"])
+    )
+
+
+def test_vocabulary_and_masks(matrix):
+    assert matrix.vocabulary.tolist() == ["Comedy", "Drama", "Action"]
+    assert matrix.masks.dtype == np.uint32
+    assert matrix.masks.tolist() == [0b011, 0b010, 0, 0b111]
+
+
+def test_counts(matrix):
+    assert matrix.genre_counts().tolist() == [2, 3, 1]
+    assert matrix.movie_counts().tolist() == [2, 1, 0, 3]
+
+
+def test_cooccurrence(matrix):
+    co = matrix.cooccurrence()
+    assert co.loc["Comedy", "Drama"] == 2
+    assert co.loc["Action", "Drama"] == 1
+    assert np.diag(co).tolist() == matrix.genre_counts().tolist()
+
+
+def test_mask(matrix):
+    assert matrix.mask(["Comedy", "Action"]) == 0b101
+    with pytest.raises(KeyError):
+        matrix.mask(["Western"])
+
+
+def test_wide_vocabulary():
+    genres = pd.Series([f"g{i}" for i in range(40)])
+    matrix = GenreMatrix.from_strings(genres)
+    assert matrix.masks.dtype == np.uint64
+    assert int(matrix.masks[39]) == 1 << 39
+
+
+def test_vocabulary_beyond_bitmask():
+    genres = pd.Series(["|".join(f"g{j}" for j in range(i, i + 3)) for i in range(70)])
+    matrix = GenreMatrix.from_strings(genres)
+    assert matrix.masks.shape == (70, 72)
+    assert matrix.movie_counts().tolist() == [3] * 70
+    assert matrix.genre_counts()[:4].tolist() == [1, 2, 3, 3]
+    assert matrix.matches(["g1", "g2"]).nonzero()[0].tolist() == [0, 1]
+    assert matrix.matches(["g0", "g71"], match="any").nonzero()[0].tolist() == [0, 69]
+    assert matrix.cooccurrence().loc["g1", "g2"] == 2
@@ -0,0 +1,47 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from group_index import GroupIndex
+
+
+@pytest.fixture
+def keys():
+    return np.array([30, 10, 20, 10, 30, 30])
+
+
+@pytest.fixture
+def values():
+    return np.array([1.0, 4.0, 2.0, 5.0, 3.0, 5.0])
+
+
+def test_keys_and_offsets(keys):
+    index = GroupIndex(keys)
+    assert index.keys.tolist() == [10, 20, 30]
+    assert index.offsets.tolist() == [0, 2, 3, 6]
+    assert index.counts().tolist() == [2, 1, 3]
+    assert index.first_rows().tolist() == [1, 2, 0]
+    assert len(index) == 3
+
+
+def test_sum_matches_groupby(keys, values):
+    index = GroupIndex(keys)
+    grouped = pd.Series(values).groupby(keys)
+    assert index.sum(values).tolist() == grouped.sum().tolist()
+
+
+def test_positions_and_rows(keys):
+    index = GroupIndex(keys)
+    assert index.positions([20, 99, 10]).tolist() == [1, -1, 0]
+    assert index.rows(30).tolist() == [0, 4, 5]
+    assert index.rows(99).tolist() == []
+
+
+def test_empty_index():
+    index = GroupIndex(np.array([], dtype=np.int64))
+    assert len(index) == 0
+    assert index.sum(np.array([])).tolist() == []
+    assert index.positions([1]).tolist() == [-1]
@@ -0,0 +1,31 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from group_index import GroupIndex
+from group_stats import GroupStats
+
+
+def test_mean_and_var_match_groupby():
+    keys = np.array([1, 2, 1, 3, 1, 2])
+    ratings = np.array([4.0, 2.5, 3.0, 5.0, 0.5, 3.5])
+    stats = GroupStats.from_index(GroupIndex(keys), ratings)
+    grouped = pd.Series(ratings).groupby(keys)
+    assert np.allclose(stats.mean(), grouped.mean().to_numpy())
+    var = stats.var()
+    assert np.allclose(var[:2], grouped.var().to_numpy()[:2])
+    assert np.isnan(var[2])
+    assert stats.series(stats.counts).to_dict() == {1: 3, 2: 2, 3: 1}
+
+
+def test_update_matches_merge():
+    left = GroupStats.from_index(GroupIndex(np.array([1, 3, 1])), [4.0, 2.0, 3.0])
+    part = GroupStats.from_index(GroupIndex(np.array([3, 2])), [5.0, 1.0])
+    part.first_rows = part.first_rows + 3
+    expected = left.merge(part)
+    left.update(part)
+    assert left.keys.tolist() == [1, 2, 3]
+    for name in ("counts", "sums", "sums_of_squares", "first_rows"):
+        assert getattr(left, name).tolist() == getattr(expected, name).tolist()
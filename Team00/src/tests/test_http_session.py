@@ -0,0 +1,59 @@
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import links
+from http_session import HttpSession
+from links import Links
+
+
+def test_reuses_connection_and_records_latency(stub_server):
+    with HttpSession(pool_size=2) as session:
+        for i in range(5):
+            response = session.get(f"{stub_server.url}page/{i}")
+            assert response.status_code == 200
+        stats = session.stats()
+    assert len(stub_server.clients) == 1
+    assert stats["requests"] == 5
+    assert 0 < stats["p50"] <= stats["p99"]
+
+
+def test_empty_stats_and_invalid_pool():
+    with HttpSession() as session:
+        assert session.stats() == {
+            "requests": 0,
+            "mean": None,
+            "p50": None,
+            "p99": None,
+        }
+    with pytest.raises(ValueError):
+        HttpSession(pool_size=0)
+    with pytest.raises(ValueError):
+        HttpSession(max_latencies=0)
+
+
+def test_latency_window_is_bounded(stub_server):
+    with HttpSession(max_latencies=3) as session:
+        for _ in range(5):
+            session.get(stub_server.url + "/page").raise_for_status()
+        stats = session.stats()
+    assert len(session.latencies) == 3
+    assert stats["requests"] == session.requests_sent == 5
+
+
+def test_links_uses_session(stub_server, tmp_path):
+    path = tmp_path / "links.csv"
+    path.write_text("movieId,imdbId,tmdbId\n1,0114709,862\n2,0113497,8844\n")
+    with HttpSession() as session, patch.object(links, "IMDB_URL", stub_server.url):
+        movies = Links(str(path), cache=False, session=session)
+        soups = [movies._Links__get_soup(imdb_id) for imdb_id in ("0114709", "0113497")]
+        missing = movies._Links__get_soup("name/missing")
+        assert session.stats()["requests"] == 3
+    assert [soup.find("h1").text for soup in soups] == [
+        "Movie tt0114709",
+        "Movie tt0113497",
+    ]
+    assert missing is None
+    assert len(stub_server.clients) == 1
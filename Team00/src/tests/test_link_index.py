@@ -0,0 +1,49 @@
+import pytest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from link_index import MISSING_ID, LinkIndex, parse_ids
+
+
+@pytest.fixture
+def index():
+    return LinkIndex(
+        [
+            {"movieId": "1", "imdbId": "0114709", "tmdbId": "862"},
+            {"movieId": "BAD_ID", "imdbId": "tt1234567", "tmdbId": "1"},
+            {"movieId": "2", "imdbId": "0113497", "tmdbId": ""},
+            {"movieId": "1", "imdbId": "0000001", "tmdbId": "5"},
+        ]
+    )
+
+
+def test_parse_ids():
+    ids = parse_ids(["0114709", "tt0114709", "", None, "abc", " 7 "])
+    assert ids.dtype == np.int32
+    assert ids.tolist() == [114709, 114709, MISSING_ID, MISSING_ID, MISSING_ID, 7]
+    assert parse_ids(["3000000000"]).dtype == np.int64
+
+
+def test_imdb_id_keeps_string_and_first_row(index):
+    assert index.imdb_id(1) == "0114709"
+    assert index.imdb_id(np.int64(2)) == "0113497"
+    assert index.imdb_id(999) is None
+    assert index.imdb_id("1") is None
+
+
+def test_resolve(index):
+    assert index.resolve([2, 1, 999]).tolist() == [113497, 114709, MISSING_ID]
+    assert index.resolve([862, 5], "tmdbId", "movieId").tolist() == [1, 1]
+    assert index.resolve([114709], "imdbId", "tmdbId").tolist() == [862]
+    assert index.resolve([2], target="tmdbId").tolist() == [MISSING_ID]
+    with pytest.raises(ValueError):
+        index.resolve([1], target="title")
+
+
+def test_empty_rows():
+    index = LinkIndex(None)
+    assert len(index) == 0
+    assert index.imdb_id(1) is None
+    assert index.resolve([1, 2]).tolist() == [MISSING_ID, MISSING_ID]
@@ -126,10 +126,10 @@ class TestLinks:
 
     @patch("movielens_analysis.Links._Links__get_soup")
     @patch("movielens_analysis.Links._Links__extract_field")
-    def test_most_expensive_all_continues(self, mock_extract_field, mock_get_soup):
-        from movielens_analysis import Links
-
-        links = Links.__new__(Links)
+    def test_most_expensive_all_continues(
+        self, mock_extract_field, mock_get_soup, links_instance
+    ):
+        links = links_instance
         links.links_data = [
             {"imdbId": "tt_null_soup"},
             {"imdbId": "tt_no_budget"},
@@ -477,6 +477,15 @@ class TestLinks:
         assert links._Links__get_imdb_id(1) == "tt7654321"
         assert links._Links__get_imdb_id(999) is None
 
+    def test_resolve(self, links_instance):
+        result = links_instance.resolve([2, 1, 999])
+        assert result.tolist() == [113497, 114709, -1]
+
+    def test_id_index_follows_links_data(self, links_instance):
+        links_instance.links_data = [{"movieId": "5", "imdbId": "0000005"}]
+        assert links_instance._Links__get_imdb_id(5) == "0000005"
+        assert links_instance._Links__get_imdb_id(1) is None
+
     # END
     # __EXTRACT_FIELD
 
@@ -612,7 +621,7 @@ class TestLinks:
         result = instance._Links__get_soup(123)
         assert result is None
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_digit_id(self, mock_get, instance):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -624,19 +633,19 @@ class TestLinks:
         assert isinstance(result, BeautifulSoup)
         assert "Test" in result.text
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_prefixed_tt(self, mock_get, instance):
         mock_get.return_value = MagicMock(status_code=200, text="<html>tt test</html>")
         result = instance._Links__get_soup("tt1234567")
         assert "tt test" in result.text
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_prefixed_nm(self, mock_get, instance):
         mock_get.return_value = MagicMock(status_code=200, text="<html>nm test</html>")
         result = instance._Links__get_soup("nm1234567")
         assert "nm test" in result.text
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_prefixed_name_nm(self, mock_get, instance):
         mock_get.return_value = MagicMock(
             status_code=200, text="<html>name/nm test</html>"
@@ -644,7 +653,7 @@ class TestLinks:
         result = instance._Links__get_soup("name/nm1234567")
         assert "name/nm test" in result.text
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_prefixed_title_tt(self, mock_get, instance):
         mock_get.return_value = MagicMock(
             status_code=200, text="<html>title/tt test</html>"
@@ -652,7 +661,7 @@ class TestLinks:
         result = instance._Links__get_soup("title/tt1234567")
         assert "title/tt test" in result.text
 
-    @patch("movielens_analysis.requests.get")
+    @patch("links.SESSION.get")
     def test__get_soup_unknown_prefix(self, mock_get, instance):
         mock_get.return_value = MagicMock(
             status_code=200, text="<html>generic test</html>"
@@ -660,8 +669,20 @@ class TestLinks:
         result = instance._Links__get_soup("abc1234567")
         assert "generic test" in result.text
 
+    @patch("links.SESSION.get")
+    def test__get_soup_page_cache(self, mock_get, instance, tmp_path):
+        from page_cache import PageCache
+
+        mock_get.return_value = MagicMock(status_code=200, text="<html>cached</html>")
+        instance.page_cache = PageCache(str(tmp_path / "pages"))
+        first = instance._Links__get_soup("tt1234567")
+        second = instance._Links__get_soup("tt1234567")
+        assert mock_get.call_count == 1
+        assert first.text == second.text == "cached"
+        assert instance.page_cache.stats()["hits"] == 1
+
     @patch(
-        "movielens_analysis.requests.get",
+        "links.SESSION.get",
         side_effect=RequestException("Connection failed"),
     )
     def test__get_soup_request_exception(self, mock_get, instance):
@@ -669,3 +690,201 @@ class TestLinks:
         assert result is None
 
     # END
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    @patch("movielens_analysis.Links._Links__extract_field")
+    def test_reports_share_facts(
+        self, mock_extract_field, mock_get_soup, links_instance
+    ):
+        mock_soup = MagicMock()
+        mock_soup.find.return_value.text.strip.return_value = "Movie Title"
+        mock_get_soup.return_value = mock_soup
+        mock_extract_field.side_effect = lambda soup, field: (
+            "2:00" if field == "Runtime" else "$120000"
+        )
+
+        assert links_instance.longest(1) == {"Movie Title": 120}
+        assert links_instance.top_cost_per_minute(1) == {"Movie Title": 1000.0}
+        assert links_instance.most_profitable(1) == {"Movie Title": 0}
+        assert mock_get_soup.call_count == 2
+        assert str(links_instance.facts().table["budget_value"].dtype) == "Int64"
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    @patch("movielens_analysis.Links._Links__extract_field")
+    def test_facts_store_incremental(
+        self, mock_extract_field, mock_get_soup, mock_links_file, tmp_path
+    ):
+        from facts_store import FactsStore
+
+        mock_soup = MagicMock()
+        mock_soup.find.return_value.text.strip.return_value = "Movie Title"
+        mock_get_soup.return_value = mock_soup
+        mock_extract_field.side_effect = lambda soup, field: (
+            "2:00" if field == "Runtime" else "$120000"
+        )
+        store = FactsStore(str(tmp_path / "facts.sqlite"))
+
+        assert Links(mock_links_file, facts_store=store).longest(1) == {
+            "Movie Title": 120
+        }
+        assert mock_get_soup.call_count == 2
+
+        links = Links(mock_links_file, facts_store=store)
+        assert links.longest(1) == {"Movie Title": 120}
+        assert mock_get_soup.call_count == 2
+
+        links.links_data = links.links_data + [{"movieId": "3", "imdbId": "0000003"}]
+        assert len(links.facts()) == 3
+        assert mock_get_soup.call_count == 3
+
+        links.refresh_facts(max_age=0)
+        assert mock_get_soup.call_count == 6
+        assert len(store) == 3
+        store.close()
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    @patch("movielens_analysis.Links._Links__extract_field")
+    def test_iter_reports_stream_partial_top(
+        self, mock_extract_field, mock_get_soup, mock_links_file, tmp_path
+    ):
+        from facts_store import FactsStore
+
+        titles = iter(["First", "Second"])
+        budgets = iter(["$100", "$300"])
+        mock_soup = MagicMock()
+        mock_soup.find.return_value.text.strip.side_effect = lambda: next(titles)
+        mock_get_soup.return_value = mock_soup
+        mock_extract_field.side_effect = lambda soup, field: (
+            next(budgets) if field == "Budget" else None
+        )
+        store = FactsStore(str(tmp_path / "facts.sqlite"))
+        links = Links(mock_links_file, facts_store=store)
+
+        boards = links.iter_most_expensive(1)
+        assert next(boards) == {"First": "$100"}
+        boards.close()
+        assert len(store) == 1
+
+        assert list(links.iter_most_expensive(2)) == [
+            {"First": "$100"},
+            {"Second": "$300", "First": "$100"},
+        ]
+        assert mock_get_soup.call_count == 2
+        assert links.most_expensive(2) == {"Second": "$300", "First": "$100"}
+        store.close()
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    @patch("movielens_analysis.Links._Links__extract_field")
+    def test_iter_reports_match_batch_with_duplicate_titles(
+        self, mock_extract_field, mock_get_soup, tmp_path
+    ):
+        pages = {
+            "0000001": ("Hamlet", "4:02", "$300"),
+            "0000002": ("Hamlet", "1:45", "$200"),
+            "0000003": ("Heat", "2:50", "$100"),
+        }
+        soups = {}
+        for imdb_id, (title, runtime, budget) in pages.items():
+            soup = MagicMock()
+            soup.find.return_value.text.strip.return_value = title
+            soup.facts = {"Runtime": runtime, "Budget": budget}
+            soups[imdb_id] = soup
+        mock_get_soup.side_effect = lambda imdb_id: soups[imdb_id]
+        mock_extract_field.side_effect = lambda soup, field: soup.facts.get(field)
+        path = tmp_path / "links.csv"
+        path.write_text("movieId,imdbId\n1,0000001\n2,0000002\n3,0000003\n")
+        links = Links(str(path))
+
+        *_, longest = links.iter_longest(2)
+        assert longest == links.longest(2) == {"Heat": 170, "Hamlet": 105}
+        assert list(longest) == ["Heat", "Hamlet"]
+        *_, expensive = links.iter_most_expensive(2)
+        assert expensive == links.most_expensive(2) == {"Hamlet": "$200"}
+        *_, costly = links.iter_top_cost_per_minute(2)
+        assert costly == links.top_cost_per_minute(2)
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    def test_journal_resumes_interrupted_crawl(
+        self, mock_get_soup, mock_links_file, tmp_path
+    ):
+        from crawl_journal import CrawlJournal
+
+        def movie_soup(imdb_id):
+            director_tag = MagicMock()
+            director_tag.text.strip.return_value = f"Director {imdb_id}"
+            director_tag.get.return_value = f"/name/nm{imdb_id}/"
+            soup = MagicMock()
+            soup.find.return_value.text.strip.return_value = f"Movie {imdb_id}"
+            soup.find.return_value.find.return_value = director_tag
+            return soup
+
+        def director_soup(count):
+            soup = MagicMock()
+            soup.find.return_value.find.return_value.text.strip.return_value = count
+            return soup
+
+        pages = {
+            "0114709": movie_soup("0114709"),
+            "0113497": movie_soup("0113497"),
+            "name/nm0114709": director_soup("5"),
+            "name/nm0113497": director_soup("7"),
+        }
+
+        def interrupted(imdb_id):
+            if imdb_id == "name/nm0113497":
+                raise KeyboardInterrupt
+            return pages[imdb_id]
+
+        path = str(tmp_path / "crawl.jsonl")
+        mock_get_soup.side_effect = interrupted
+        with CrawlJournal(path) as journal, pytest.raises(KeyboardInterrupt):
+            Links(mock_links_file, journal=journal).top_directors(2)
+        assert mock_get_soup.call_count == 4
+
+        mock_get_soup.side_effect = pages.get
+        with CrawlJournal(path) as journal:
+            result = Links(mock_links_file, journal=journal).top_directors(2)
+            assert journal.processed("director") == {
+                "name/nm0114709",
+                "name/nm0113497",
+            }
+        assert result == {"Director 0113497": 7, "Director 0114709": 5}
+        assert mock_get_soup.call_count == 5
+
+    @patch("movielens_analysis.Links._Links__get_soup")
+    @patch("movielens_analysis.Links._Links__extract_field")
+    def test_journal_honours_facts_store_max_age(
+        self, mock_extract_field, mock_get_soup, mock_links_file, tmp_path
+    ):
+        from crawl_journal import CrawlJournal
+        from facts_store import FactsStore
+
+        mock_soup = MagicMock()
+        mock_soup.find.return_value.text.strip.return_value = "Movie Title"
+        mock_get_soup.return_value = mock_soup
+        mock_extract_field.side_effect = lambda soup, field: (
+            "2:00" if field == "Runtime" else "$120000"
+        )
+        store = FactsStore(str(tmp_path / "facts.sqlite"))
+        with CrawlJournal(str(tmp_path / "crawl.jsonl")) as journal:
+            links = Links(mock_links_file, facts_store=store, journal=journal)
+            links.refresh_facts()
+            assert mock_get_soup.call_count == 2
+            first = store.load()
+
+            links.refresh_facts(max_age=0)
+            assert mock_get_soup.call_count == 4
+            second = store.load()
+            assert all(
+                second[imdb_id]["fetched_at"] > first[imdb_id]["fetched_at"]
+                for imdb_id in first
+            )
+            assert len(list(links.iter_movie_records(max_age=0))) == 2
+            assert mock_get_soup.call_count == 6
+
+            fresh_store = FactsStore(str(tmp_path / "other.sqlite"))
+            Links(mock_links_file, facts_store=fresh_store, journal=journal).facts()
+            assert mock_get_soup.call_count == 6
+            assert len(fresh_store) == 2
+            fresh_store.close()
+        store.close()
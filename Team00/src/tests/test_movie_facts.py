@@ -0,0 +1,80 @@
+import pytest
+import sys
+import os
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from movie_facts import (
+    MovieFacts,
+    parse_amount,
+    parse_amounts,
+    parse_runtime,
+    parse_runtimes,
+)
+
+
+def record(imdb_id, title, budget=None, gross=None, runtime=None, director=None):
+    return {
+        "imdbId": imdb_id,
+        "title": title,
+        "budget": budget,
+        "gross": gross,
+        "runtime": runtime,
+        "director": director,
+        "director_href": f"name/{director.lower()}" if director else None,
+    }
+
+
+@pytest.fixture
+def facts():
+    return MovieFacts.from_records(
+        [
+            record("1", "A", "$100", "$150", "1:40", "X"),
+            record("2", "B", "$ABC", "$900", "oops", "Y"),
+            record("3", "C", "$300 (estimated)", "$350", "0:00", "X"),
+            record("4", None, "$999", None, "9:00"),
+            record("5", "A", "$50", "$250", "2:00"),
+        ]
+    )
+
+
+def test_parsers():
+    amounts = parse_amounts(["$1,500,000", "$ABC", None, 7])
+    assert amounts[0] == 1500000
+    assert amounts[1:].isna().all()
+    runtimes = parse_runtimes(["2:10", "1:05:00", "oops", None])
+    assert runtimes[:2].tolist() == [130, 65]
+    assert runtimes[2:].isna().all()
+
+
+def test_scalar_parsers_match_vector():
+    values = ["$1,500,000", "$ABC", None, 7, "2:10", "1:05:00", " 3 : 4 ", "oops"]
+    for value, amount, runtime in zip(
+        values, parse_amounts(values), parse_runtimes(values)
+    ):
+        assert parse_amount(value) == (None if pd.isna(amount) else amount)
+        assert parse_runtime(value) == (None if pd.isna(runtime) else runtime)
+
+
+def test_typed_columns(facts):
+    assert str(facts.table["budget_value"].dtype) == "Int64"
+    assert str(facts.table["runtime_minutes"].dtype) == "Int64"
+    assert len(facts) == 5
+
+
+def test_reports(facts):
+    assert facts.most_expensive(2) == {"C": "$300 (estimated)", "A": "$100"}
+    assert facts.most_profitable(5) == {"A": 200, "C": 50}
+    assert facts.longest(5) == {"A": 120, "C": 0}
+    assert facts.top_cost_per_minute(5) == {"A": 0.42}
+
+
+def test_directors(facts):
+    assert facts.directors() == [("X", "name/x"), ("Y", "name/y")]
+
+
+def test_empty():
+    facts = MovieFacts.from_records([])
+    assert facts.most_expensive(3) == {}
+    assert facts.longest(3) == {}
+    assert facts.directors() == []
@@ -47,3 +47,30 @@ def test_most_genres(movies_instance):
     assert isinstance(result, dict)
     assert list(result.keys())[0] == "Movie With Most Genres (1996)"
     assert list(result.values())[0] == 6
+
+
+def test_most_genres_keeps_data(movies_instance):
+    columns = list(movies_instance.data.columns)
+    movies_instance.most_genres(3)
+    assert list(movies_instance.data.columns) == columns
+
+
+def test_genre_cooccurrence(movies_instance):
+    co = movies_instance.genre_cooccurrence()
+    assert co.loc["Comedy", "Children"] == 2
+    assert co.loc["Comedy", "Comedy"] == 5
+    assert co.loc["Drama", "Crime"] == 0
+
+
+def test_filter(movies_instance):
+    result = movies_instance.filter(["Comedy", "Children"], (1995, 1995))
+    assert result == {1: "Toy Story (1995)"}
+    assert list(movies_instance.filter(years=(1996, 2000))) == [6]
+
+
+def test_genre_results_in_array_formats(movies_instance):
+    series = movies_instance.dist_by_genres(output="series")
+    assert series.to_dict() == movies_instance.dist_by_genres()
+    assert series.dtype.kind == "i"
+    titles, counts = movies_instance.most_genres(2, output="numpy")
+    assert dict(zip(titles, counts.tolist())) == movies_instance.most_genres(2)
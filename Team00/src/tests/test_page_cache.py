@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import page_cache
+from page_cache import PageCache, normalize_url, page_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(str(tmp_path / "pages"))
+
+
+def test_normalize_url():
+    assert (
+        normalize_url("HTTPS://WWW.IMDB.com/title/tt1/?b=2&a=1#cast")
+        == "https://www.imdb.com/title/tt1/?a=1&b=2"
+    )
+    assert normalize_url("https://imdb.com") == "https://imdb.com/"
+    assert page_key("https://IMDB.com/?b=1&a=2") == page_key(
+        "https://imdb.com/?a=2&b=1"
+    )
+
+
+def test_get_put_and_counters(cache):
+    url = "https://www.imdb.com/title/tt0114709/"
+    assert cache.get(url) is None
+    cache.put(url, "<html>Toy Story</html>" * 100)
+    assert cache.get(url) == "<html>Toy Story</html>" * 100
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["pages"]) == (1, 1, 1)
+    assert 0 < stats["bytes"] < len("<html>Toy Story</html>" * 100)
+
+
+def test_persists_between_instances(cache):
+    cache.put("https://imdb.com/a/", "page a")
+    reopened = PageCache(cache.directory)
+    assert len(reopened) == 1
+    assert reopened.get("https://imdb.com/a/") == "page a"
+
+
+def test_ttl(cache, monkeypatch):
+    cache.ttl = 60
+    now = page_cache.time.time()
+    cache.put("https://imdb.com/a/", "page a")
+    monkeypatch.setattr(page_cache.time, "time", lambda: now + 120)
+    assert cache.get("https://imdb.com/a/") is None
+    assert cache.evictions == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction(cache):
+    page = os.urandom(1000).hex()
+    cache.put("https://imdb.com/a/", page)
+    size = cache.stats()["bytes"]
+    cache.max_bytes = 2 * size + size // 2
+    cache.put("https://imdb.com/b/", page)
+    cache.get("https://imdb.com/a/")
+    cache.put("https://imdb.com/c/", page)
+    assert cache.get("https://imdb.com/b/") is None
+    assert cache.get("https://imdb.com/a/") == page
+    assert cache.get("https://imdb.com/c/") == page
+    assert cache.evictions == 1
+
+
+def test_clear(cache):
+    cache.put("https://imdb.com/a/", "page a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("https://imdb.com/a/") is None
@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from page_parser import FULL_PARSER, parse_page
+
+MOVIE_PAGE = """
+<html><head><title>Movie</title><script>var x = "<h1>no</h1>";</script></head>
+<body>
+  <div class="nav"><ul><li data-testid="other">Skip <span>me</span></li></ul></div>
+  <section><h1><span>Toy Story</span></h1></section>
+  <ul>
+    <li data-testid="title-pc-principal-credit">Director
+      <a href="/name/nm0005124/?ref_=tt">John Lasseter</a></li>
+    <li data-testid="title-boxoffice-budget"><span>Budget</span>
+      <span class="ipc-metadata-list-item__list-content-item">$30,000,000</span></li>
+    <li data-testid="title-boxoffice-cumulativeworldwidegross">
+      <span class="ipc-metadata-list-item__list-content-item">$394,436,586</span></li>
+  </ul>
+  <div><div><span class="sc-d7fcdef3-4 kjcuO">1:21</span></div></div>
+  <span class="sc-d7fcdef3-4 kjcuO other">9:99</span>
+</body></html>
+"""
+
+DIRECTOR_PAGE = """
+<html><body><h1>John Lasseter</h1>
+<div><button id="name-filmography-filter-director">Director
+<span class="ipc-chip__count">24</span></button></div>
+<button id="name-filmography-filter-writer"><span>11</span></button>
+</body></html>
+"""
+
+
+def facts(soup):
+    credit = soup.find("li", {"data-testid": "title-pc-principal-credit"})
+    item = {"class": "ipc-metadata-list-item__list-content-item"}
+    return (
+        soup.find("h1").text.strip(),
+        credit.find("a").text,
+        credit.find("a")["href"],
+        soup.find("li", {"data-testid": "title-boxoffice-budget"})
+        .find("span", item)
+        .text,
+        soup.find("li", {"data-testid": "title-boxoffice-cumulativeworldwidegross"})
+        .find("span", item)
+        .text,
+        soup.find("span", {"class": "sc-d7fcdef3-4 kjcuO"}).text,
+    )
+
+
+def test_movie_page_matches_full_tree():
+    soup = parse_page(MOVIE_PAGE)
+    assert facts(soup) == facts(BeautifulSoup(MOVIE_PAGE, FULL_PARSER))
+    assert soup.find("li", {"data-testid": "other"}) is None
+    assert "Skip" not in soup.text
+
+
+def test_director_page():
+    soup = parse_page(DIRECTOR_PAGE)
+    button = soup.find("button", {"id": "name-filmography-filter-director"})
+    assert button.find("span", class_="ipc-chip__count").text == "24"
+    assert soup.find("button", {"id": "name-filmography-filter-writer"}) is None
+
+
+@pytest.mark.parametrize("html", ["<html><body>Test</body></html>", "", "plain"])
+def test_pages_without_h1_use_full_tree(html):
+    soup = parse_page(html)
+    assert soup.text == BeautifulSoup(html, FULL_PARSER).text
@@ -0,0 +1,60 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from group_index import GroupIndex
+from rating_histogram import RatingHistogram
+from ratings_store import encode_ratings
+
+
+@pytest.fixture
+def groups():
+    keys = np.array([1, 2, 1, 3, 1, 2, 1, 2, 2])
+    ratings = np.array([4.0, 2.5, 3.0, 5.0, 0.5, 3.5, 3.0, 2.5, 5.0])
+    return keys, ratings
+
+
+@pytest.fixture
+def histogram(groups):
+    keys, ratings = groups
+    return RatingHistogram.from_index(GroupIndex(keys), encode_ratings(ratings))
+
+
+def test_counts_matrix(histogram):
+    assert histogram.counts.shape == (3, 10)
+    assert histogram.totals().tolist() == [4, 4, 1]
+    assert histogram.counts[0].tolist() == [1, 0, 0, 0, 0, 2, 0, 1, 0, 0]
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.25, 0.5, 0.9, 1.0])
+def test_quantile_matches_pandas(groups, histogram, q):
+    keys, ratings = groups
+    expected = pd.Series(ratings).groupby(keys).quantile(q).to_numpy()
+    assert np.allclose(histogram.quantile(q), expected)
+
+
+def test_median_mode_mean_var(groups, histogram):
+    keys, ratings = groups
+    grouped = pd.Series(ratings).groupby(keys)
+    assert histogram.median().tolist() == grouped.median().tolist()
+    assert histogram.mode().tolist() == [3.0, 2.5, 5.0]
+    assert np.allclose(histogram.mean(), grouped.mean().to_numpy())
+    var = histogram.var()
+    assert np.allclose(var[:2], grouped.var().to_numpy()[:2])
+    assert np.isnan(var[2])
+
+
+def test_quantile_invalid(histogram):
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+
+
+def test_update_matches_merge(histogram):
+    part = RatingHistogram.from_index(GroupIndex(np.array([1, 99])), [10, 1])
+    expected = histogram.merge(part)
+    histogram.update(part)
+    assert histogram.keys.tolist() == expected.keys.tolist()
+    assert histogram.counts.tolist() == expected.counts.tolist()
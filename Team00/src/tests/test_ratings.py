@@ -5,6 +5,8 @@ import pandas as pd
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from movielens_analysis import Ratings
+from ratings_store import RatingsStore
+from ratings_stream import RatingsSummary
 
 
 @pytest.fixture
@@ -123,3 +125,123 @@ def test_users_most_active_users(ratings_users_instance):
     assert len(result) == 3
     assert result[1] == 2
     assert all(v > 0 for v in result.values())
+
+
+def test_ratings_constructor_compact(mock_ratings_file):
+    r = Ratings(mock_ratings_file, compact=True)
+    assert isinstance(r.data, RatingsStore)
+    assert len(r.data) == 12
+
+
+def test_compact_matches_dataframe(mock_ratings_file):
+    frame = Ratings(mock_ratings_file).data
+    store = Ratings(mock_ratings_file, compact=True).data
+    for cls in (Ratings.Movies, Ratings.Users):
+        assert cls(store).top_controversial(3) == cls(frame).top_controversial(3)
+    movies_df, movies_store = Ratings.Movies(frame), Ratings.Movies(store)
+    assert movies_store.dist_by_year() == movies_df.dist_by_year()
+    assert movies_store.dist_by_rating() == movies_df.dist_by_rating()
+    assert movies_store.top_by_num_of_ratings(3) == movies_df.top_by_num_of_ratings(3)
+    for metric in ("average", "median"):
+        assert movies_store.top_by_ratings(3, metric) == movies_df.top_by_ratings(
+            3, metric
+        )
+    users_df, users_store = Ratings.Users(frame), Ratings.Users(store)
+    assert users_store.dist_by_num_of_ratings() == users_df.dist_by_num_of_ratings()
+    assert users_store.dist_by_rating("median") == users_df.dist_by_rating("median")
+    assert users_store.most_active_users(3) == users_df.most_active_users(3)
+
+
+def test_movies_rating_quantile(ratings_movies_instance):
+    result = ratings_movies_instance.rating_quantile(0.5)
+    assert result == {10: 4.5, 20: 2.0, 30: 3.0, 40: 3.0, 50: 3.0}
+    assert ratings_movies_instance.rating_quantile(1.0, movie_ids=[40]) == {40: 5.0}
+
+
+def test_users_rating_quantile(ratings_users_instance):
+    result = ratings_users_instance.rating_quantile(0.25, user_ids=[1, 2])
+    assert result == {1: 2.5, 2: 3.5}
+    with pytest.raises(ValueError):
+        ratings_users_instance.rating_quantile(-0.1)
+
+
+def test_streaming_matches_dataframe(mock_ratings_file):
+    frame = Ratings(mock_ratings_file).data
+    summary = Ratings(mock_ratings_file, streaming=True, memory_budget=500).data
+    assert isinstance(summary, RatingsSummary)
+    movies_df, movies_stream = Ratings.Movies(frame), Ratings.Movies(summary)
+    assert movies_stream.dist_by_year() == movies_df.dist_by_year()
+    assert movies_stream.dist_by_rating() == movies_df.dist_by_rating()
+    assert movies_stream.top_by_num_of_ratings(3) == movies_df.top_by_num_of_ratings(3)
+    assert movies_stream.top_by_ratings(3, "median") == movies_df.top_by_ratings(
+        3, "median"
+    )
+    assert movies_stream.top_controversial(3) == movies_df.top_controversial(3)
+    users_df, users_stream = Ratings.Users(frame), Ratings.Users(summary)
+    assert users_stream.dist_by_rating() == users_df.dist_by_rating()
+    assert users_stream.top_controversial(3) == users_df.top_controversial(3)
+    assert users_stream.most_active_users(3) == users_df.most_active_users(3)
+
+
+@pytest.mark.parametrize("mode", [{}, {"compact": True}, {"streaming": True}])
+def test_append_matches_full_reload(mock_ratings_file, tmp_path, mode):
+    df = pd.read_csv(mock_ratings_file)
+    head = tmp_path / "head.csv"
+    df.iloc[:8].to_csv(head, index=False)
+    ratings = Ratings(str(head), cache=False, **mode)
+    movies = Ratings.Movies(ratings.data)
+    movies.top_by_num_of_ratings(2)
+    movies.top_controversial(2)
+    ratings.append(df.iloc[8:10])
+    ratings.append(df.iloc[10:].to_numpy())
+    if not mode:
+        movies = Ratings.Movies(ratings.data)
+    full = Ratings.Movies(df)
+    assert movies.top_by_num_of_ratings(2) == full.top_by_num_of_ratings(2)
+    assert movies.top_controversial(2) == full.top_controversial(2)
+    assert movies.top_by_ratings(3, "median") == full.top_by_ratings(3, "median")
+    assert movies.dist_by_year() == full.dist_by_year()
+    users = Ratings.Users(ratings.data)
+    assert users.most_active_users(3) == Ratings.Users(df).most_active_users(3)
+
+
+def test_dist_by_granularity(mock_ratings_file, ratings_movies_instance):
+    assert ratings_movies_instance.dist_by("year") == {2000: 12}
+    assert ratings_movies_instance.dist_by("day") == {"2000-07-30": 12}
+    hours = ratings_movies_instance.dist_by("hour")
+    assert hours == {"2000-07-30 18:00": 10, "2000-07-30 19:00": 2}
+    summary = Ratings(mock_ratings_file, streaming=True, memory_budget=500).data
+    assert Ratings.Movies(summary).dist_by("week") == {"2000-W30": 12}
+    with pytest.raises(ValueError):
+        ratings_movies_instance.dist_by("minute")
+
+
+def test_result_formats(ratings_users_instance):
+    series = ratings_users_instance.dist_by_num_of_ratings(output="series")
+    assert isinstance(series, pd.Series)
+    assert series.to_dict() == ratings_users_instance.dist_by_num_of_ratings()
+    keys, values = ratings_users_instance.dist_by_rating(output="numpy")
+    assert keys.tolist() == list(range(1, 11))
+    assert values[0] == 3.0
+
+
+def test_float_ratings_in_dataframe_mode():
+    frame = pd.DataFrame(
+        {
+            "userId": [1, 1, 2, 2, 3],
+            "movieId": [10, 20, 10, 20, 10],
+            "rating": [4.3, 2.0, 3.7, 5.0, 1.1],
+            "timestamp": [964982703] * 5,
+        }
+    )
+    medians = frame.groupby("movieId")["rating"].median().round(2).to_dict()
+    movies = Ratings.Movies(frame)
+    assert movies.top_by_ratings(2, metric="median") == dict(
+        sorted(medians.items(), key=lambda item: -item[1])
+    )
+    assert movies.rating_quantile(0.5) == frame.groupby("movieId")[
+        "rating"
+    ].quantile(0.5).to_dict()
+    users = Ratings.Users(frame)
+    assert users.dist_by_rating("median") == {1: 3.15, 2: 4.35, 3: 1.1}
+    assert len(users.top_controversial(2)) == 2
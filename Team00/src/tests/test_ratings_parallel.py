@@ -0,0 +1,65 @@
+import pytest
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ratings_parallel import parallel_summary, shard_rows
+from ratings_store import RatingsStore
+from movielens_analysis import Ratings
+
+
+@pytest.fixture
+def mock_ratings_file(tmp_path):
+    content = (
+        "userId,movieId,rating,timestamp\n"
+        "1,10,4.0,964982703\n"
+        "1,21,2.0,1104537600\n"
+        "2,10,5.0,964981247\n"
+        "2,32,3.0,964982703\n"
+        "3,21,2.5,1104537600\n"
+        "4,21,2.0,964983815\n"
+        "5,32,3.0,964982931\n"
+        "5,43,1.0,964982931\n"
+    )
+    path = tmp_path / "ratings.csv"
+    path.write_text(content)
+    return str(path)
+
+
+def test_shard_rows():
+    shards = shard_rows([10, 21, 10, 32, 21], 2)
+    assert [rows.tolist() for rows in shards] == [[0, 2, 3], [1, 4]]
+    with pytest.raises(ValueError):
+        shard_rows([1], 0)
+
+
+def test_parallel_summary_matches_store(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file)
+    with ThreadPoolExecutor(3) as executor:
+        summary = parallel_summary(store, executor, shards=3)
+    assert summary.year_counts().to_dict() == store.year_counts().to_dict()
+    for key in ("movieId", "userId"):
+        expected, result = store.group_stats(key), summary.group_stats(key)
+        assert result.keys.tolist() == expected.keys.tolist()
+        assert result.counts.tolist() == expected.counts.tolist()
+        assert result.first_rows.tolist() == expected.first_rows.tolist()
+        assert (
+            summary.rating_histogram(key).counts.tolist()
+            == store.rating_histogram(key).counts.tolist()
+        )
+
+
+def test_ratings_with_process_pool(mock_ratings_file):
+    expected = Ratings(mock_ratings_file, compact=True).data
+    with ProcessPoolExecutor(2) as executor:
+        data = Ratings(mock_ratings_file, executor=executor, shards=4).data
+    assert isinstance(data, RatingsStore)
+    movies, movies_expected = Ratings.Movies(data), Ratings.Movies(expected)
+    assert movies.top_by_ratings(3, "median") == movies_expected.top_by_ratings(
+        3, "median"
+    )
+    assert movies.dist_by_year() == movies_expected.dist_by_year()
+    users, users_expected = Ratings.Users(data), Ratings.Users(expected)
+    assert users.most_active_users(3) == users_expected.most_active_users(3)
+    assert users.top_controversial(3) == users_expected.top_controversial(3)
@@ -0,0 +1,105 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ratings_store import RatingsStore, encode_ratings, decode_ratings
+
+
+@pytest.fixture
+def mock_ratings_file(tmp_path):
+    content = (
+        "userId,movieId,rating,timestamp\n"
+        "1,10,4.0,964982703\n"
+        "1,20,2.5,964982703\n"
+        "2,10,5.0,964981247\n"
+        "3,30,0.5,964982224\n"
+    )
+    path = tmp_path / "ratings.csv"
+    path.write_text(content)
+    return str(path)
+
+
+def test_encode_decode_roundtrip():
+    ratings = np.array([0.5, 1.0, 2.5, 5.0])
+    codes = encode_ratings(ratings)
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [1, 2, 5, 10]
+    assert decode_ratings(codes).tolist() == ratings.tolist()
+
+
+def test_encode_invalid_rating():
+    with pytest.raises(ValueError):
+        encode_ratings([4.3])
+    with pytest.raises(ValueError):
+        encode_ratings([5.5])
+
+
+def test_from_csv_compact_dtypes(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file, chunksize=3)
+    assert store.compact
+    assert len(store) == 4
+    assert store.user_ids.dtype == np.int32
+    assert store.movie_ids.dtype == np.int32
+    assert store.rating_codes.dtype == np.uint8
+    assert store.timestamps.dtype == np.int32
+    assert store.nbytes == 4 * (4 + 4 + 1 + 4)
+
+
+def test_to_frame_matches_csv(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file)
+    df = pd.read_csv(mock_ratings_file)
+    result = store.to_frame()
+    assert list(result.columns) == list(df.columns)
+    assert result["rating"].tolist() == df["rating"].tolist()
+    assert result["timestamp"].tolist() == df["timestamp"].tolist()
+
+
+def test_wrap_frame_without_copy(mock_ratings_file):
+    df = pd.read_csv(mock_ratings_file)
+    store = RatingsStore.wrap(df)
+    assert not store.compact
+    assert np.shares_memory(store.ratings, df["rating"].to_numpy())
+    assert RatingsStore.wrap(store) is store
+
+
+def test_column_unknown(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file)
+    with pytest.raises(KeyError):
+        store.column("year")
+
+
+def test_append_updates_cached_aggregates(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file)
+    stats = store.group_stats("movieId")
+    store.year_counts()
+    batch = pd.DataFrame(
+        {
+            "userId": [1, 9],
+            "movieId": [10, 99],
+            "rating": [1.5, 5.0],
+            "timestamp": [1262304000, 1262304000],
+        }
+    )
+    store.append(RatingsStore.from_batch(batch))
+    fresh = RatingsStore.from_frame(
+        pd.concat([pd.read_csv(mock_ratings_file), batch]), compact=True
+    )
+    assert len(store) == len(fresh)
+    assert store.group_stats("movieId") is stats
+    assert stats.keys.tolist() == fresh.group_stats("movieId").keys.tolist()
+    assert stats.sums.tolist() == fresh.group_stats("movieId").sums.tolist()
+    assert store.year_counts().to_dict() == fresh.year_counts().to_dict()
+    assert store.to_frame().equals(fresh.to_frame())
+
+
+def test_from_batch_array():
+    batch = RatingsStore.from_batch(np.array([[1, 10, 4.5, 964982703]]))
+    assert batch.compact
+    assert batch.ratings.tolist() == [4.5]
+    with pytest.raises(ValueError):
+        RatingsStore.from_batch(
+            {"userId": [1], "movieId": [1], "rating": [7.0], "timestamp": [0]}
+        )
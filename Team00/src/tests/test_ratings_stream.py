@@ -0,0 +1,56 @@
+import pytest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ratings_store import RatingsStore
+from ratings_stream import RatingsSummary, chunk_rows, BYTES_PER_ROW
+
+
+@pytest.fixture
+def mock_ratings_file(tmp_path):
+    content = (
+        "userId,movieId,rating,timestamp\n"
+        "1,10,4.0,964982703\n"
+        "1,20,2.0,1104537600\n"
+        "2,10,5.0,964981247\n"
+        "2,30,3.0,964982703\n"
+        "3,20,2.5,1104537600\n"
+        "4,20,2.0,964983815\n"
+        "5,30,3.0,964982931\n"
+    )
+    path = tmp_path / "ratings.csv"
+    path.write_text(content)
+    return str(path)
+
+
+def test_chunk_rows():
+    assert chunk_rows(10 * BYTES_PER_ROW) == 10
+    assert chunk_rows(1) == 1
+    with pytest.raises(ValueError):
+        chunk_rows(0)
+
+
+def test_streaming_matches_store(mock_ratings_file):
+    store = RatingsStore.from_csv(mock_ratings_file)
+    summary = RatingsSummary.from_csv(mock_ratings_file, 2 * BYTES_PER_ROW)
+    assert len(summary) == len(store)
+    assert summary.year_counts().to_dict() == store.year_counts().to_dict()
+    assert summary.rating_counts().to_dict() == store.rating_counts().to_dict()
+    for key in ("movieId", "userId"):
+        expected, result = store.group_stats(key), summary.group_stats(key)
+        assert result.keys.tolist() == expected.keys.tolist()
+        assert result.counts.tolist() == expected.counts.tolist()
+        assert result.sums.tolist() == expected.sums.tolist()
+        assert result.first_rows.tolist() == expected.first_rows.tolist()
+        assert (
+            summary.rating_histogram(key).counts.tolist()
+            == store.rating_histogram(key).counts.tolist()
+        )
+
+
+def test_empty_summary_merge(mock_ratings_file):
+    summary = RatingsSummary.from_csv(mock_ratings_file)
+    merged = RatingsSummary.empty().merge(summary)
+    assert len(merged) == 7
+    assert merged.group_stats("movieId").counts.tolist() == [2, 3, 2]
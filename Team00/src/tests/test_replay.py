@@ -0,0 +1,87 @@
+import pytest
+import sys
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import links
+from links import Links
+from replay import PageArchive, ReplayServer, page_path
+
+PAGES = {
+    "https://www.imdb.com/title/tt0114709/": (
+        "<html><h1>Toy Story</h1>"
+        '<li data-testid="title-boxoffice-budget">'
+        '<span class="ipc-metadata-list-item__list-content-item">$30,000,000</span>'
+        "</li></html>"
+    ),
+    "https://finance.yahoo.com/quote/MSFT/financials?p=MSFT": "<html>MSFT</html>",
+}
+
+
+def test_page_path():
+    assert page_path("https://www.imdb.com/title/tt1/") == "/title/tt1/"
+    assert page_path("https://example.com") == "/"
+    assert page_path("/quote/A/financials?p=A") == "/quote/A/financials?p=A"
+
+
+def test_archive_record_and_load(tmp_path):
+    def get(url, **kwargs):
+        response = MagicMock(text=PAGES.get(url, ""))
+        if url not in PAGES:
+            response.raise_for_status.side_effect = requests.HTTPError("404")
+        return response
+
+    archive = PageArchive(str(tmp_path / "archive"))
+    assert archive.record([*PAGES, "https://www.imdb.com/missing/"], get) == 2
+    reopened = PageArchive(str(tmp_path / "archive"))
+    assert len(reopened) == 2
+    assert reopened.load() == {page_path(url): html for url, html in PAGES.items()}
+
+
+def test_server_serves_pages_with_latency():
+    with ReplayServer(PAGES, latency=0.05) as server:
+        url = server.rewrite("https://finance.yahoo.com/quote/MSFT/financials?p=MSFT")
+        start = time.monotonic()
+        response = requests.get(url, timeout=5)
+        assert time.monotonic() - start >= 0.05
+        assert response.text == "<html>MSFT</html>"
+        assert requests.get(f"{server.url}nothing", timeout=5).status_code == 404
+        assert (server.hits, server.missing, server.errors) == (2, 1, 0)
+
+
+def test_server_injects_errors():
+    with pytest.raises(ValueError):
+        ReplayServer(PAGES, error_rate=2)
+    with ReplayServer(PAGES, error_rate=1) as server:
+        response = requests.get(server.rewrite(next(iter(PAGES))), timeout=5)
+        assert response.status_code == 503
+        assert server.errors == 1
+
+
+def test_server_page_hook_and_counters():
+    class Flaky(ReplayServer):
+        def page(self, path, hits):
+            if hits == 1:
+                return 503, "busy"
+            return super().page(path, hits)
+
+    with Flaky(PAGES) as server, requests.Session() as session:
+        url = server.rewrite(next(iter(PAGES)))
+        assert [session.get(url, timeout=5).status_code for _ in range(2)] == [
+            503,
+            200,
+        ]
+        assert server.path_hits == {"/title/tt0114709/": 2}
+        assert len(server.clients) == 1
+
+
+def test_links_against_replay(tmp_path):
+    path = tmp_path / "links.csv"
+    path.write_text("movieId,imdbId,tmdbId\n1,0114709,862\n2,0113497,8844\n")
+    with ReplayServer(PAGES) as server, patch.object(links, "IMDB_URL", server.url):
+        result = Links(str(path), cache=False).most_expensive(5)
+    assert result == {"Toy Story": "$30,000,000"}
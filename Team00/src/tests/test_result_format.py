@@ -0,0 +1,64 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from result_format import format_result, get_result_format, set_result_format
+
+
+@pytest.fixture
+def values():
+    return pd.Series([3, 1], index=[10, 20])
+
+
+@pytest.fixture(autouse=True)
+def restore_format():
+    yield
+    set_result_format("dict")
+
+
+def test_default_dict(values):
+    assert get_result_format() == "dict"
+    assert format_result(values) == {10: 3, 20: 1}
+    mapping = {"a": 1}
+    assert format_result(mapping) is mapping
+
+
+def test_series_and_numpy_without_copy(values):
+    assert format_result(values, "series") is values
+    keys, counts = format_result(values, "numpy")
+    assert keys.tolist() == [10, 20]
+    assert np.shares_memory(counts, values.to_numpy())
+    assert format_result({"a": 1}, "series").to_dict() == {"a": 1}
+
+
+def test_global_format(values):
+    set_result_format("series")
+    assert isinstance(format_result(values), pd.Series)
+    assert format_result(values, "dict") == {10: 3, 20: 1}
+
+
+def test_duplicate_keys_dict():
+    values = pd.Series([1, 2], index=["a", "a"])
+    assert format_result(values) == {"a": 2}
+
+
+def test_arrow(values):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            format_result(values, "arrow")
+        return
+    table = format_result(values, "arrow")
+    assert table.column("value").to_pylist() == [3, 1]
+
+
+def test_invalid_format(values):
+    with pytest.raises(ValueError):
+        format_result(values, "list")
+    with pytest.raises(ValueError):
+        set_result_format("list")
+    assert get_result_format() == "dict"
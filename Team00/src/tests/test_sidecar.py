@@ -0,0 +1,93 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from sidecar import Sidecar, cached_arrays, cached_object, sidecar_dir
+from movielens_analysis import Movies, Ratings
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n3,4\n")
+    return str(path)
+
+
+def test_sidecar_dir(csv_file):
+    assert sidecar_dir(csv_file).endswith(os.path.join("", ".data.csv.cache"))
+
+
+def test_cached_object_reused(csv_file):
+    build = lambda: pd.read_csv(csv_file)
+    first = cached_object(csv_file, "frame", build)
+    with patch("pandas.read_csv", side_effect=AssertionError("parsed again")):
+        second = cached_object(csv_file, "frame", build)
+    assert second.equals(first)
+
+
+def test_cached_arrays_memory_mapped(csv_file):
+    build = lambda: {"x": np.arange(5, dtype=np.int32)}
+    cached_arrays(csv_file, "arrays", build)
+    loaded = cached_arrays(csv_file, "arrays", lambda: None)
+    assert isinstance(loaded["x"], np.memmap)
+    assert loaded["x"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_cache_invalidated_on_change(csv_file):
+    cached_object(csv_file, "value", lambda: "old")
+    with open(csv_file, "a") as file:
+        file.write("5,6\n")
+    assert cached_object(csv_file, "value", lambda: "new") == "new"
+
+
+def test_rebuild_keeps_mapped_arrays_intact(csv_file):
+    cached_arrays(csv_file, "arrays", lambda: {"x": np.arange(100_000)})
+    mapped = cached_arrays(csv_file, "arrays", lambda: None)["x"]
+    assert isinstance(mapped, np.memmap)
+
+    with open(csv_file, "w") as file:
+        file.write("a,b\n9,9\n")
+    rebuilt = cached_arrays(csv_file, "arrays", lambda: {"x": np.full(10, 7)})
+    assert rebuilt["x"].tolist() == [7] * 10
+    assert cached_arrays(csv_file, "arrays", lambda: None)["x"].tolist() == [7] * 10
+    assert mapped[:1000].sum() == sum(range(1000))
+    assert mapped.sum() == sum(range(100_000))
+    assert not any(name.endswith(".tmp") for name in os.listdir(sidecar_dir(csv_file)))
+
+
+def test_touch_keeps_cache_when_hash_matches(csv_file):
+    cached_object(csv_file, "value", lambda: "old")
+    stat = os.stat(csv_file)
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert Sidecar(csv_file, "value").is_valid()
+    assert cached_object(csv_file, "value", lambda: "new") == "old"
+
+
+def test_missing_file_not_cached(tmp_path):
+    path = str(tmp_path / "missing" / "data.csv")
+    assert cached_object(path, "value", lambda: None) is None
+    assert not os.path.exists(tmp_path / "missing")
+
+
+def test_cache_disabled(csv_file):
+    assert cached_object(csv_file, "value", lambda: 1, cache=False) == 1
+    assert not os.path.exists(sidecar_dir(csv_file))
+
+
+def test_ratings_and_movies_from_cache(tmp_path):
+    ratings_path = tmp_path / "ratings.csv"
+    ratings_path.write_text("userId,movieId,rating,timestamp\n1,10,4.0,964982703\n")
+    movies_path = tmp_path / "movies.csv"
+    movies_path.write_text("movieId,title,genres\n1,Toy Story (1995),Comedy\n")
+    first = Ratings(str(ratings_path)).data
+    store = Ratings(str(ratings_path), compact=True).data
+    Movies(str(movies_path))
+    with patch("pandas.read_csv", side_effect=AssertionError("parsed again")):
+        assert Ratings(str(ratings_path)).data.equals(first)
+        cached = Ratings(str(ratings_path), compact=True).data
+        assert cached.rating_codes.tolist() == store.rating_codes.tolist()
+        assert Movies(str(movies_path)).data["title"].tolist() == ["Toy Story (1995)"]
@@ -0,0 +1,57 @@
+import pytest
+import sys
+import os
+import re
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from tag_index import TagSearchIndex, required_literals
+
+
+@pytest.fixture
+def index():
+    return TagSearchIndex(
+        ["Funny", "unfunny plot", "Funny Scenes", np.nan, "sci-fi", "dark comedy"]
+    )
+
+
+def test_contains_substring(index):
+    assert index.contains("funny").tolist() == [0, 1, 2]
+    assert index.contains("scenes").tolist() == [2]
+    assert index.contains("zzz").tolist() == []
+
+
+def test_contains_short_and_empty_query(index):
+    assert index.contains("fi").tolist() == [4]
+    assert index.contains("").tolist() == [0, 1, 2, 4, 5]
+
+
+def test_contains_regex_fallback(index):
+    assert index.contains("^funny").tolist() == [0, 2]
+    assert index.contains("sci.fi|dark").tolist() == [4, 5]
+
+
+def test_with_word(index):
+    assert index.with_word("FUNNY").tolist() == [0, 2]
+    assert index.with_word("funny scenes").tolist() == [2]
+    assert index.with_word("scenes funny").tolist() == []
+    assert index.with_word("fi").tolist() == [4]
+    assert index.with_word("  ").tolist() == []
+
+
+def test_contains_matches_full_scan():
+    tags = ["R.I.P", "rip off", "the war", "war on", "a.b.c", "Star Wars", "x", "abc"]
+    index = TagSearchIndex(tags)
+    queries = ["a", "ab", "r.i.p", "r\\.i", "^the", "war$", "\\.", "a.c", "x|y", "s?"]
+    for query in queries:
+        expected = [
+            i for i, tag in enumerate(tags) if re.search(query, tag.lower())
+        ]
+        assert index.contains(query).tolist() == expected, query
+
+
+def test_required_literals():
+    assert required_literals("r.i.p") == ["r", "i", "p"]
+    assert required_literals("^sci\\-fi$") == ["sci-fi"]
+    assert required_literals("a\\d") is None
+    assert required_literals("x|y") is None
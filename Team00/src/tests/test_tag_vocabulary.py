@@ -0,0 +1,27 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from tag_vocabulary import MISSING_LENGTH, TagVocabulary
+
+
+@pytest.fixture
+def vocabulary():
+    return TagVocabulary.from_series(
+        pd.Series(["funny", "dark  comedy", np.nan, "funny", "a b c", np.nan])
+    )
+
+
+def test_codes_and_tags(vocabulary):
+    assert vocabulary.codes.tolist() == [0, 1, 2, 0, 3, 2]
+    assert vocabulary.tags[[0, 1, 3]].tolist() == ["funny", "dark  comedy", "a b c"]
+    assert pd.isna(vocabulary.tags[2])
+    assert len(vocabulary) == 4
+
+
+def test_lengths_and_word_counts(vocabulary):
+    assert vocabulary.lengths.tolist() == [5, 12, MISSING_LENGTH, 5]
+    assert vocabulary.word_counts.tolist() == [1, 2, 1, 3]
@@ -61,3 +61,36 @@ def test_tags_with(tags_instance):
     assert isinstance(result, list)
     assert "funny" in result or any("funny" in tag for tag in result)
     assert result == sorted(result)
+
+
+def test_tags_with_whole_word(tags_instance):
+    assert tags_instance.tags_with("funny", whole_word=True) == [
+        "funny",
+        "funny scenes",
+    ]
+    assert tags_instance.tags_with("so good", whole_word=True) == ["not so good"]
+    assert tags_instance.tags_with("fun", whole_word=True) == []
+
+
+def test_movie_and_user_tags(tmp_path):
+    path = tmp_path / "tags.csv"
+    path.write_text(
+        "userId,movieId,tag,timestamp\n"
+        "1,10,funny,1\n"
+        "2,10,dark,2\n"
+        "1,20,funny,3\n"
+        "2,10,dark,4\n"
+        "3,10,funny,5\n"
+        "2,30,dark,6\n"
+    )
+    tags = Tags(str(path))
+    assert tags.movie_tags(10) == ["funny", "dark"]
+    assert tags.movie_tags(99) == []
+    assert tags.user_tags(2) == ["dark"]
+    assert tags.tag_movies("dark") == [10, 30]
+    assert tags.tag_movies("funny") == [10, 20]
+    assert tags.tag_movies("missing") == []
+    assert tags.top_movie_tags(10, 1) == {"funny": 2}
+    assert tags.top_movie_tags(10, 5) == {"funny": 2, "dark": 2}
+    assert tags.top_user_tags(1, 5) == {"funny": 2}
+    assert tags.top_user_tags(99, 5) == {}
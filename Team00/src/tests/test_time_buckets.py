@@ -0,0 +1,53 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from time_buckets import TimeBuckets, bucket_labels, bucketize, rebucket
+
+
+@pytest.fixture
+def timestamps():
+    return np.array([-86400, 0, 964982703, 1104537600, 1104537599, 1262304000])
+
+
+@pytest.mark.parametrize(
+    "granularity, fmt",
+    [
+        ("month", "%Y-%m"),
+        ("day", "%Y-%m-%d"),
+        ("hour", "%Y-%m-%d %H:00"),
+    ],
+)
+def test_labels_match_pandas(timestamps, granularity, fmt):
+    ids, starts = bucketize(timestamps, granularity)
+    expected = pd.to_datetime(timestamps, unit="s").strftime(fmt)
+    assert list(bucket_labels(starts, granularity)[ids]) == list(expected)
+
+
+def test_year_and_iso_week(timestamps):
+    ids, starts = bucketize(timestamps, "year")
+    assert list(bucket_labels(starts, "year")[ids]) == [
+        1969, 1970, 2000, 2005, 2004, 2010
+    ]
+    ids, starts = bucketize(timestamps, "week")
+    assert list(bucket_labels(starts, "week")[ids]) == [
+        "1970-W01", "1970-W01", "2000-W30", "2004-W53", "2004-W53", "2009-W53"
+    ]
+
+
+def test_counts_and_rebucket(timestamps):
+    buckets = TimeBuckets(timestamps)
+    years = buckets.counts("year")
+    assert years.sum() == len(timestamps)
+    assert (years > 0).all()
+    assert rebucket(buckets.counts("hour"), "year").equals(years)
+    assert buckets.bucket_ids("year") is buckets.bucket_ids("year")
+
+
+def test_invalid_granularity(timestamps):
+    with pytest.raises(ValueError):
+        bucketize(timestamps, "minute")
+    assert len(bucketize(np.empty(0, np.int64), "month")[1]) == 0
@@ -0,0 +1,97 @@
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from topk import Leaderboard, RunningTop, top_k
+
+
+def test_top_k_order_and_ties():
+    values = np.array([3.0, 5.0, 1.0, 5.0, 3.0, 4.0])
+    assert top_k(values, 3).tolist() == [1, 3, 5]
+    assert top_k(values, 5).tolist() == [1, 3, 5, 0, 4]
+
+
+def test_top_k_custom_tiebreak():
+    values = np.array([2, 7, 7, 7])
+    assert top_k(values, 2, tiebreak=[0, 9, 3, 5]).tolist() == [2, 3]
+
+
+def test_top_k_skips_nan_and_clips_k():
+    values = np.array([np.nan, 1.0, np.nan, 2.0])
+    assert top_k(values, 10).tolist() == [3, 1]
+    assert top_k(values, 0).tolist() == []
+    assert top_k(np.array([]), 3).tolist() == []
+
+
+def test_top_k_matches_full_sort():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 50, 1000)
+    expected = np.lexsort((np.arange(1000), -values))[:25]
+    assert top_k(values, 25).tolist() == expected.tolist()
+
+
+def test_leaderboard_update():
+    values = {1: 5.0, 2: 4.0, 3: 3.0, 4: 1.0}
+
+    def score(keys):
+        keys = np.array(sorted(values) if keys is None else keys)
+        return keys, np.array([values[key] for key in keys]), None
+
+    board = Leaderboard(2, score)
+    assert board.series().to_dict() == {1: 5.0, 2: 4.0}
+    values[4] = 6.0
+    board.update(np.array([4]))
+    assert board.series().to_dict() == {4: 6.0, 1: 5.0}
+    values[4] = 0.5
+    board.update(np.array([4]))
+    assert board.series().to_dict() == {1: 5.0, 2: 4.0}
+
+
+def test_running_top_matches_top_k():
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 20, 500).astype(float)
+    values[::7] = np.nan
+    top = RunningTop(10)
+    for position, value in enumerate(values):
+        top.push(value, position)
+    assert len(top) == 10
+    assert top.items() == top_k(values, 10).tolist()
+
+
+def test_running_top_skips_missing_and_empty():
+    top = RunningTop(2)
+    assert not top.push(None, "a")
+    assert top.push(1, "b") and top.push(3, "c")
+    assert not top.push(1, "d")
+    assert top.push(2, "e")
+    assert top.items() == ["c", "e"]
+    assert RunningTop(0).push(5, "x") is False
+
+
+def test_running_top_keyed_keeps_last_value():
+    top = RunningTop(2)
+    assert top.push(242, "Hamlet 4:02", key="Hamlet")
+    assert top.push(170, "Heat", key="Heat")
+    assert top.push(300, "Alien", key="Alien")
+    assert top.items() == ["Alien", "Hamlet 4:02"]
+    assert not top.push(105, "Hamlet 1:45", key="Hamlet")
+    assert top.items() == ["Alien", "Heat"]
+    assert top.push(170, "Hamlet 2:50", key="Hamlet")
+    assert top.items() == ["Alien", "Hamlet 2:50"]
+
+
+def test_running_top_keyed_memory_is_bounded():
+    rng = np.random.default_rng(2)
+    keys = rng.integers(0, 300, 3000)
+    values = rng.random(3000)
+    top = RunningTop(5)
+    latest = {}
+    for key, value in zip(keys, values):
+        # Значения ключей только растут, поэтому top-n точен.
+        value = max(value, latest.get(key, 0))
+        latest[key] = value
+        top.push(value, key, key=key)
+        assert len(top._latest) <= 15
+    expected = sorted(latest, key=latest.get, reverse=True)[:5]
+    assert top.items() == expected
@@ -0,0 +1,208 @@
+"""
+Модуль с разбиением timestamp на временные бакеты.
+
+Содержит класс TimeBuckets: timestamp в секундах от эпохи раскладываются
+по ISO-неделям, дням и часам целочисленным делением, а по календарным
+годам и месяцам — через searchsorted по заранее посчитанным границам
+и таблицу «день -> бакет». Номера бакетов кешируются, поэтому любое
+распределение по времени считается одним bincount.
+"""
+
+import numpy as np
+import pandas as pd
+
+GRANULARITIES = ("year", "month", "week", "day", "hour")
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+# 1970-01-01 — четверг, ISO-недели начинаются с понедельника 1969-12-29.
+WEEK_OFFSET = 3 * SECONDS_PER_DAY
+FIXED_WIDTHS = {
+    "week": SECONDS_PER_WEEK,
+    "day": SECONDS_PER_DAY,
+    "hour": SECONDS_PER_HOUR,
+}
+CALENDAR_UNITS = {"year": "Y", "month": "M"}
+
+
+def check_granularity(granularity: str):
+    """
+    Проверяет имя гранулярности.
+
+    Аргументы:
+        granularity: str, одно из year, month, week, day, hour.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(
+            "Invalid granularity. Use 'year', 'month', 'week', 'day' or 'hour'."
+        )
+
+
+def calendar_starts(granularity: str, low: int, high: int) -> np.ndarray:
+    """
+    Возвращает начала годов или месяцев, покрывающих отрезок [low, high].
+
+    Аргументы:
+        granularity: str, year или month.
+        low: int, минимальный timestamp в секундах.
+        high: int, максимальный timestamp в секундах.
+
+    Возвращает:
+        np.ndarray int64 с началами бакетов в секундах.
+    """
+    unit = f"datetime64[{CALENDAR_UNITS[granularity]}]"
+    first = np.datetime64(int(low), "s").astype(unit)
+    last = np.datetime64(int(high), "s").astype(unit)
+    return np.arange(first, last + 1).astype("datetime64[s]").astype(np.int64)
+
+
+def calendar_ids(day_ids, day_starts, granularity: str) -> tuple:
+    """
+    Переводит номера дней в номера годов или месяцев.
+
+    Границы годов и месяцев совпадают с границами дней (UTC), поэтому
+    searchsorted выполняется только по началам дней, а номера строк
+    получаются выборкой из таблицы размера «число дней».
+
+    Аргументы:
+        day_ids: номера дней, как у bucketize(..., 'day').
+        day_starts: начала дней в секундах.
+        granularity: str, year или month.
+
+    Возвращает:
+        tuple (ids, starts), как у bucketize.
+    """
+    if not len(day_starts):
+        return np.empty(0, np.int32), np.empty(0, np.int64)
+    starts = calendar_starts(granularity, day_starts[0], day_starts[-1])
+    table = np.searchsorted(starts, day_starts, side="right") - 1
+    return table.astype(np.int32)[day_ids], starts
+
+
+def bucketize(timestamps, granularity: str) -> tuple:
+    """
+    Раскладывает timestamp по бакетам заданной гранулярности.
+
+    Аргументы:
+        timestamps: массив timestamp в секундах от эпохи (UTC).
+        granularity: str, одно из year, month, week, day, hour.
+
+    Возвращает:
+        tuple (ids, starts): ids — номер бакета для каждого timestamp
+        (int32), starts — начала бакетов в секундах (int64) от бакета
+        минимального до бакета максимального timestamp.
+    """
+    check_granularity(granularity)
+    if granularity in CALENDAR_UNITS:
+        return calendar_ids(*bucketize(timestamps, "day"), granularity)
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if not len(timestamps):
+        return np.empty(0, np.int32), np.empty(0, np.int64)
+    width = FIXED_WIDTHS[granularity]
+    offset = WEEK_OFFSET if granularity == "week" else 0
+    numbers = (timestamps + offset) // width
+    first = numbers.min()
+    starts = np.arange(first, numbers.max() + 1) * width - offset
+    return (numbers - first).astype(np.int32), starts
+
+
+def bucket_labels(starts, granularity: str) -> pd.Index:
+    """
+    Возвращает подписи бакетов по их началам.
+
+    Аргументы:
+        starts: массив начал бакетов в секундах.
+        granularity: str, одно из year, month, week, day, hour.
+
+    Возвращает:
+        pd.Index: год (int) для year, иначе строки вида '2000-01',
+        '2000-W05', '2000-01-31', '2000-01-31 13:00'.
+    """
+    check_granularity(granularity)
+    moments = pd.to_datetime(np.asarray(starts, dtype=np.int64), unit="s")
+    if granularity == "year":
+        return moments.year
+    if granularity == "week":
+        calendar = moments.isocalendar()
+        return pd.Index(
+            calendar["year"].astype(str)
+            + "-W"
+            + calendar["week"].astype(str).str.zfill(2)
+        )
+    formats = {"month": "%Y-%m", "day": "%Y-%m-%d", "hour": "%Y-%m-%d %H:00"}
+    return moments.strftime(formats[granularity])
+
+
+class TimeBuckets:
+    """
+    Номера временных бакетов для массива timestamp.
+
+    Атрибуты:
+        timestamps: массив timestamp в секундах от эпохи.
+
+    Методы:
+        bucket_ids(granularity): Номера бакетов и их начала; годы и месяцы
+            собираются из закешированных номеров дней.
+        counts(granularity, weights): Количество (или сумма весов) по бакетам.
+    """
+
+    def __init__(self, timestamps):
+        """
+        Инициализирует бакеты для массива timestamp.
+
+        Аргументы:
+            timestamps: массив timestamp в секундах от эпохи.
+        """
+        self.timestamps = np.asarray(timestamps)
+        self._buckets = {}
+
+    def bucket_ids(self, granularity: str) -> tuple:
+        """
+        Возвращает номера бакетов и их начала, посчитанные один раз.
+
+        Аргументы:
+            granularity: str, одно из year, month, week, day, hour.
+
+        Возвращает:
+            tuple (ids, starts), как у bucketize.
+        """
+        if granularity not in self._buckets:
+            if granularity in CALENDAR_UNITS:
+                buckets = calendar_ids(*self.bucket_ids("day"), granularity)
+            else:
+                buckets = bucketize(self.timestamps, granularity)
+            self._buckets[granularity] = buckets
+        return self._buckets[granularity]
+
+    def counts(self, granularity: str, weights=None) -> pd.Series:
+        """
+        Возвращает количество timestamp в каждом непустом бакете.
+
+        Аргументы:
+            granularity: str, одно из year, month, week, day, hour.
+            weights: массив целых весов той же длины или None.
+
+        Возвращает:
+            pd.Series {начало бакета в секундах: количество}, по возрастанию.
+        """
+        ids, starts = self.bucket_ids(granularity)
+        counts = np.bincount(ids, weights, minlength=len(starts)).astype(np.int64)
+        present = counts > 0
+        return pd.Series(counts[present], index=starts[present])
+
+
+def rebucket(counts: pd.Series, granularity: str) -> pd.Series:
+    """
+    Переводит количества по мелким бакетам в количества по более крупным.
+
+    Аргументы:
+        counts: pd.Series {начало бакета в секундах: количество}, например
+            по часам.
+        granularity: str, целевая гранулярность, не мельче исходной.
+
+    Возвращает:
+        pd.Series {начало бакета в секундах: количество}.
+    """
+    return TimeBuckets(counts.index.to_numpy()).counts(
+        granularity, counts.to_numpy()
+    )
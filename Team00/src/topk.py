@@ -0,0 +1,248 @@
+"""
+Модуль с выбором top-n элементов без полной сортировки.
+
+Содержит функцию top_k: частичный выбор через np.partition за O(n)
+и сортировку только кандидатов, с детерминированным разрешением равенств.
+Используется всеми методами top_* / most_* в Ratings, Movies и Tags.
+
+Класс Leaderboard хранит готовый top-n групп и после дозаписи оценок
+пересчитывает его только по изменившимся группам.
+
+Класс RunningTop ведет top-n потока значений в куче из n элементов.
+"""
+
+import heapq
+import math
+from itertools import count
+
+import numpy as np
+import pandas as pd
+
+
+def top_k(values, k: int, tiebreak=None) -> np.ndarray:
+    """
+    Возвращает позиции k наибольших значений по убыванию.
+
+    Сначала np.partition находит k-е по величине значение, затем
+    сортируются только элементы не меньше его. При равенстве значений
+    раньше идет элемент с меньшим tiebreak (по умолчанию — с меньшей
+    позицией в массиве). NaN в результат не попадают.
+
+    Аргументы:
+        values: одномерный массив чисел.
+        k: int, количество элементов для возврата.
+        tiebreak: массив той же длины для разрешения равенств или None.
+
+    Возвращает:
+        np.ndarray позиций в values, не длиннее k.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if tiebreak is None:
+        tiebreak = np.arange(len(values))
+    tiebreak = np.asarray(tiebreak)
+
+    candidates = np.flatnonzero(~np.isnan(values))
+    k = max(0, min(k, len(candidates)))
+    if k == 0:
+        return candidates[:0]
+    if k < len(candidates):
+        present = values[candidates]
+        threshold = np.partition(present, len(present) - k)[len(present) - k]
+        candidates = candidates[present >= threshold]
+
+    order = np.lexsort((tiebreak[candidates], -values[candidates]))
+    return candidates[order[:k]]
+
+
+class Leaderboard:
+    """
+    Top-n групп по метрике, обновляемый по изменившимся группам.
+
+    Функция score(keys) возвращает кортеж (ключи, значения, tiebreak)
+    для переданных ключей групп или для всех групп, если keys равен None;
+    ключи должны быть отсортированы, tiebreak может быть None (меньший ключ).
+
+    Атрибуты:
+        n: int, размер лидерборда.
+        keys: ключи групп лидерборда по убыванию значения.
+        values: значения метрики для keys.
+
+    Методы:
+        refresh(): Пересчитывает лидерборд по всем группам.
+        update(changed_keys): Обновляет лидерборд после изменения групп.
+        series(): Лидерборд в виде pd.Series.
+    """
+
+    def __init__(self, n: int, score):
+        """
+        Инициализирует лидерборд и считает его по всем группам.
+
+        Аргументы:
+            n: int, количество групп в лидерборде.
+            score: функция значений метрики по ключам групп.
+        """
+        self.n = n
+        self._score = score
+        self.refresh()
+
+    def _select(self, keys, values, tiebreak):
+        positions = top_k(values, self.n, tiebreak)
+        self.keys = keys[positions]
+        self.values = values[positions]
+
+    def refresh(self):
+        """
+        Пересчитывает лидерборд по всем группам.
+        """
+        self._select(*self._score(None))
+
+    def update(self, changed_keys):
+        """
+        Обновляет лидерборд после изменения групп changed_keys.
+
+        Группы вне лидерборда и вне changed_keys не изменились и уступали
+        каждому его участнику. Если ни один участник не ухудшил значение,
+        новый top-n выбирается только среди участников и changed_keys;
+        иначе лидерборд пересчитывается по всем группам.
+
+        Аргументы:
+            changed_keys: массив ключей групп, у которых появились оценки.
+        """
+        _, current, _ = self._score(self.keys)
+        if not np.all(current >= self.values):
+            self.refresh()
+            return
+        self._select(*self._score(np.union1d(self.keys, changed_keys)))
+
+    def series(self) -> pd.Series:
+        """
+        Возвращает лидерборд в виде pd.Series {ключ группы: значение}.
+        """
+        return pd.Series(self.values, index=self.keys)
+
+
+class RunningTop:
+    """
+    Top-n потока значений в куче размера n.
+
+    Как и в top_k, при равенстве значений раньше идет элемент, добавленный
+    раньше; None и NaN пропускаются. Элементы с одинаковым ключом key
+    занимают одно место: новое значение заменяет прежнее, а при равенстве
+    значений порядок задает первое добавление ключа — как у словаря,
+    заполненного проходом по потоку. Память — O(n): кроме участников
+    top-n хранятся последние значения не более 3n лучших ключей, и при
+    переполнении остаются 2n лучших. Если значение участника уменьшилось,
+    top-n выбирается среди сохраненных ключей, поэтому он совпадает
+    с проходом словарем, пока значения уменьшались не более чем у n
+    ключей; забытый и добавленный снова ключ при равенстве значений идет
+    как новый.
+
+    Атрибуты:
+        n: int, размер top-n.
+
+    Методы:
+        push(value, item, key): Добавляет элемент со значением value.
+        items(): Элементы top-n по убыванию значения.
+    """
+
+    def __init__(self, n: int):
+        """
+        Инициализирует пустой top-n.
+
+        Аргументы:
+            n: int, количество элементов top-n.
+        """
+        self.n = max(n, 0)
+        # Участники: ключ -> (значение, -номер добавления, элемент).
+        self._board = {}
+        # Куча (значение, -номер, ключ) участников, в том числе устаревших
+        # записей; в вершине — наименьшее значение, среди равных — позднее.
+        self._heap = []
+        # Последние значения лучших ключей: участники и ближайшие к ним.
+        self._latest = {}
+        self._order = count()
+
+    def __len__(self) -> int:
+        return len(self._board)
+
+    def _lowest(self) -> tuple:
+        heap = self._heap
+        while True:
+            value, order, key = heap[0]
+            entry = self._board.get(key)
+            if entry is not None and entry[:2] == (value, order):
+                return heap[0]
+            heapq.heappop(heap)
+
+    def _reheap(self, entries):
+        self._board = dict(entries)
+        self._heap = [(value, order, key) for key, (value, order, _) in entries]
+        heapq.heapify(self._heap)
+
+    def _trim(self):
+        # Участники top-n — лучшие из сохраненных ключей и не вытесняются.
+        self._latest = dict(
+            heapq.nlargest(
+                2 * self.n, self._latest.items(), key=lambda pair: pair[1][:2]
+            )
+        )
+
+    def push(self, value, item, key=None) -> bool:
+        """
+        Добавляет элемент, вытесняя наименьший, если top-n заполнен.
+
+        Аргументы:
+            value: число, по которому выбирается top-n.
+            item: элемент, возвращаемый items().
+            key: ключ элемента или None (каждый элемент — отдельное место).
+
+        Возвращает:
+            bool: True, если элемент вошел в top-n.
+        """
+        if self.n == 0 or value is None:
+            return False
+        if isinstance(value, float) and math.isnan(value):
+            return False
+        previous = None if key is None else self._latest.get(key)
+        order = -next(self._order) if previous is None else previous[1]
+        entry = (value, order, item)
+        if key is None:
+            key = order
+        else:
+            self._latest[key] = entry
+            if len(self._latest) > 3 * self.n:
+                self._trim()
+
+        board = self._board
+        if key in board:
+            lowered = entry[:2] < board[key][:2]
+            board[key] = entry
+            if lowered and len(self._latest) > len(board):
+                self._reheap(
+                    heapq.nlargest(
+                        self.n, self._latest.items(), key=lambda pair: pair[1][:2]
+                    )
+                )
+                return key in self._board
+            heapq.heappush(self._heap, (value, order, key))
+            if len(self._heap) > 2 * self.n:
+                self._reheap(list(board.items()))
+            return True
+        if len(board) < self.n:
+            board[key] = entry
+            heapq.heappush(self._heap, (value, order, key))
+            return True
+        lowest = self._lowest()
+        if entry[:2] > lowest[:2]:
+            del board[lowest[2]]
+            board[key] = entry
+            heapq.heapreplace(self._heap, (value, order, key))
+            return True
+        return False
+
+    def items(self) -> list:
+        """
+        Возвращает элементы top-n по убыванию значения.
+        """
+        # Номера добавления различны, поэтому элементы item не сравниваются.
+        return [entry[2] for entry in sorted(self._board.values(), reverse=True)]